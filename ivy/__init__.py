@@ -748,9 +748,18 @@ from .data_classes.container import conversions as cont_conversions
 from .data_classes.container import (
     ContainerBase,
     Container,
+    ContainerQueueLoader,
+    SharedMemoryQueue,
     add_ivy_container_instance_methods,
 )
-from .nested_array import NestedArray
+from .nested_array import (
+    NestedArray,
+    LengthBucket,
+    bucket_by_length,
+    bucket_stream,
+    restore_order,
+    padding_efficiency,
+)
 from ivy.utils.backend import (
     current_backend,
     compiled_backends,
@@ -924,7 +933,9 @@ globals_vars = GlobalsDict(
         "array_decimal_values_stack": array_decimal_values_stack,
         "warning_level_stack": warning_level_stack,
         "queue_timeout_stack": general.queue_timeout_stack,
+        "attention_block_size_stack": general.attention_block_size_stack,
         "array_mode_stack": general.array_mode_stack,
+        "frontend_native_mode_stack": general.frontend_native_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
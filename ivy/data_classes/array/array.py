@@ -3,6 +3,7 @@
 import copy
 import functools
 import numpy as np
+import pickle
 from operator import mul
 from typing import Optional
 
@@ -53,6 +54,18 @@ from .experimental import (
 )
 
 
+def _array_from_pickle_buffer(buffer, dtype, shape, backend):
+    # with out-of-band pickling the buffer is not copied, and the numpy array is only
+    # a view of it
+    data = np.frombuffer(buffer, dtype=dtype).reshape(shape)
+    if backend is None or len(backend) == 0 or backend == ivy.current_backend_str():
+        return ivy.array(data)
+    ivy.set_backend(backend)
+    ret = ivy.array(data)
+    ivy.previous_backend()
+    return ret
+
+
 class Array(
     _ArrayWithActivations,
     _ArrayWithCreation,
@@ -421,6 +434,17 @@ class Array(
         # device = backend.as_native_dev(state["device_str"])
         # backend.to_device(self, device)
 
+    def __reduce_ex__(self, protocol):
+        # protocol 5 supports out-of-band buffers, which let the data be exported
+        # without being copied into the pickle stream
+        if protocol < 5 or self.dtype == "bfloat16":
+            return super().__reduce_ex__(protocol)
+        data = np.require(ivy.to_numpy(self._data), requirements="C")
+        return (
+            _array_from_pickle_buffer,
+            (pickle.PickleBuffer(data), data.dtype.str, data.shape, self.backend),
+        )
+
     def __pos__(self):
         return ivy.positive(self._data)
 
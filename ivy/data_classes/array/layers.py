@@ -807,6 +807,7 @@ class _ArrayWithLayers(abc.ABC):
         *,
         bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         recurrent_bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        lengths: Optional[Union[ivy.Array, ivy.NativeArray, Sequence[int]]] = None,
     ) -> Tuple[ivy.Array, ivy.Array]:
         """
         ivy.Array instance method variant of ivy.lstm_update. This method simply
@@ -827,6 +828,10 @@ class _ArrayWithLayers(abc.ABC):
             bias for cell kernel *[4 x out]*. (Default value = None)
         recurrent_bias
             bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+        lengths
+            lengths of the sequences *[batch_shape]*, for a batch of padded
+            variable-length sequences, which are then processed in packed form.
+            (Default value = None)
 
         Returns
         -------
@@ -857,4 +862,5 @@ class _ArrayWithLayers(abc.ABC):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            lengths=lengths,
         )
@@ -12,5 +12,7 @@ except ModuleNotFoundError:
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
+from .loader import ContainerQueueLoader  # noqa
+from .shared_memory import SharedMemoryQueue  # noqa
 
 colorama.init(strip=False)
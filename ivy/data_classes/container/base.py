@@ -18,20 +18,31 @@ try:
     import h5py
 except ModuleNotFoundError:
     h5py = None
+import mmap
 import pickle
 import random
+import struct
+import weakref
 from operator import mul
-from functools import reduce
+from functools import reduce, lru_cache
 from typing import Union, Tuple
 from builtins import set
 
 # local
 import ivy
+from ivy.data_classes.array.array import _array_from_pickle_buffer
+from . import checkpoint
+from . import shared_memory
 
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
+@lru_cache(maxsize=4096)
+def _split_key_chain(key_chain):
+    return tuple(re.split("[/.]", key_chain))
+
+
 def _is_jsonable(x):
     try:
         json.dumps(x)
@@ -47,10 +58,119 @@ def _repr(x):
         return str(x)
 
 
+_H5_PERMUTATION_KEY = "__ivy_permutation__"
+
+
+# header of pickle files written with out-of-band buffers, followed by the pickle
+# length, the number of buffers, and the offset and length of each buffer
+_OUT_OF_BAND_PICKLE_MAGIC = b"IVYOOB05"
+_OUT_OF_BAND_PICKLE_ALIGNMENT = 64
+
+
+def _dump_pickle_out_of_band(obj, pickle_filepath):
+    buffers = list()
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    buffers = [buffer.raw() for buffer in buffers]
+    offset = len(_OUT_OF_BAND_PICKLE_MAGIC) + 16 * (len(buffers) + 1) + len(data)
+    layout = list()
+    for buffer in buffers:
+        offset = -(-offset // _OUT_OF_BAND_PICKLE_ALIGNMENT) * (
+            _OUT_OF_BAND_PICKLE_ALIGNMENT
+        )
+        layout += [offset, buffer.nbytes]
+        offset += buffer.nbytes
+    with open(pickle_filepath, "wb") as f:
+        f.write(_OUT_OF_BAND_PICKLE_MAGIC)
+        f.write(struct.pack("<QQ", len(data), len(buffers)))
+        f.write(struct.pack("<{}Q".format(len(layout)), *layout))
+        f.write(data)
+        for buffer_offset, buffer in zip(layout[::2], buffers):
+            f.write(bytes(buffer_offset - f.tell()))
+            f.write(buffer)
+
+
+def _load_pickle(pickle_filepath, mmap_mode=False):
+    with open(pickle_filepath, "rb") as f:
+        if f.read(len(_OUT_OF_BAND_PICKLE_MAGIC)) != _OUT_OF_BAND_PICKLE_MAGIC:
+            f.seek(0)
+            return pickle.load(f)
+        if mmap_mode:
+            # copy-on-write, so the loaded arrays are writable without the file
+            # being modified
+            contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            f.seek(0)
+            contents = bytearray(f.read())
+    contents = memoryview(contents)
+    offset = len(_OUT_OF_BAND_PICKLE_MAGIC)
+    data_length, num_buffers = struct.unpack_from("<QQ", contents, offset)
+    offset += 16
+    layout = struct.unpack_from("<{}Q".format(2 * num_buffers), contents, offset)
+    offset += 16 * num_buffers
+    buffers = [
+        contents[buffer_offset : buffer_offset + buffer_length]
+        for buffer_offset, buffer_length in zip(layout[::2], layout[1::2])
+    ]
+    return pickle.loads(contents[offset : offset + data_length], buffers=buffers)
+
+
+def _native_array_from_pickle_buffer(*args):
+    return _array_from_pickle_buffer(*args).data
+
+
+class _NativeArrayPickler:
+    # native arrays of most backends do not support out-of-band buffers, so they are
+    # pickled through ivy.Array, and converted back to native arrays when loaded
+    def __init__(self, x):
+        self._x = x
+
+    def __reduce_ex__(self, protocol):
+        ret = ivy.to_ivy(self._x).__reduce_ex__(protocol)
+        if ret[0] is not _array_from_pickle_buffer:
+            return self._x.__reduce_ex__(protocol)
+        return (_native_array_from_pickle_buffer,) + ret[1:]
+
+
+def _h5_block_size(dataset, block_size=None):
+    if block_size is not None:
+        return block_size
+    if dataset.chunks is not None:
+        return dataset.chunks[0]
+    # aim for roughly 1MB per block for contiguous datasets
+    row_bytes = reduce(mul, dataset.shape[1:], 1) * dataset.dtype.itemsize
+    return max(2**20 // max(row_bytes, 1), 1)
+
+
+def _h5_gather_rows(dataset, indices):
+    # h5py point selections must be strictly increasing, so read each unique row
+    # once in sorted order with a single call, and reorder in memory
+    unique_indices, inverse = np.unique(indices, return_inverse=True)
+    if unique_indices.size == 0:
+        return dataset[0:0]
+    return dataset[unique_indices][inverse]
+
+
+def _h5_permutation(batch_size, seed_value):
+    # shuffle the indices exactly as random.shuffle would shuffle the rows, so that
+    # the same seed always produces the same ordering
+    random.seed(seed_value)
+    permutation = list(range(batch_size))
+    random.shuffle(permutation)
+    return np.asarray(permutation, dtype=np.int64)
+
+
 # noinspection PyMissingConstructor
 
 
 class ContainerBase(dict, abc.ABC):
+    # flat index from key chain to value for all nested keys, built once the
+    # container is queried repeatedly without being modified
+    _cont_key_chain_index = None
+    _cont_key_chain_index_size = 0
+    _cont_key_chain_lookups = 0
+    # weak references to the containers whose index includes this container
+    _cont_index_owners = None
+
     def __init__(
         self,
         dict_in=None,
@@ -80,7 +200,10 @@ class ContainerBase(dict, abc.ABC):
         queues
             Sequence of multiprocessing queues, each of which returns containers.
             This enables the current container to be passed around asynchronously while
-            waiting for data. Default is ``None``.
+            waiting for data. ``ivy.ContainerQueueLoader`` can be used to fill the
+            queues ahead of consumption, in which case the queues are consumed in
+            order, and the containers from earlier queues are released once a later
+            queue is queried. Default is ``None``.
         queue_load_sizes
             Size of leading dimension of the containers returned by each queue.
             Default is ``None``.
@@ -133,6 +256,11 @@ class ContainerBase(dict, abc.ABC):
             self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.get_queue_timeout())
+            # queues which can only be consumed once, in order, such as those of
+            # ivy.ContainerQueueLoader, release their chunks once they are passed
+            self._release_consumed_queues = all(
+                getattr(q, "releases_consumed_chunks", False) for q in self._queues
+            )
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
@@ -1095,7 +1223,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        permutation=None,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1112,6 +1244,10 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        permutation
+            Row indices along axis 0 to read the datasets in, applied before
+            ``slice_obj``. Default is ``None``, in which case the permutation stored
+            by ``shuffle_h5_file(..., virtual=True)`` is used, if present.
 
         Returns
         -------
@@ -1128,15 +1264,28 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, "r")
         else:
             h5_obj = h5_obj_or_filepath
+        if permutation is None and _H5_PERMUTATION_KEY in h5_obj:
+            permutation = h5_obj[_H5_PERMUTATION_KEY][()]
+        row_indices = None if permutation is None else permutation[slice_obj]
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
+            if key == _H5_PERMUTATION_KEY:
+                continue
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    permutation=permutation,
                 )
             elif isinstance(value, h5py.Dataset):
+                if row_indices is None:
+                    value_as_np = value[slice_obj]
+                else:
+                    value_as_np = _h5_gather_rows(value, row_indices)
                 container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+                    list(value_as_np), dtype=str(value_as_np.dtype)
                 )
             else:
                 raise ivy.utils.exceptions.IvyException(
@@ -1145,7 +1294,7 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(container_dict, ivyh=ivyh)
 
     @staticmethod
-    def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
+    def cont_from_disk_as_pickled(pickle_filepath, ivyh=None, mmap_mode=False):
         """Load container object from disk at the specified pickle filepath.
 
         Parameters
@@ -1155,6 +1304,12 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        mmap_mode
+            Whether to memory-map the arrays of files saved with out-of-band buffers,
+            rather than reading them into memory. The mapping is copy-on-write, so
+            changes to the arrays are not written back to the file. With the numpy
+            backend, the loaded arrays are then views of the mapped file. Default is
+            ``False``.
 
         Returns
         -------
@@ -1162,11 +1317,58 @@ class ContainerBase(dict, abc.ABC):
 
         """
         return ivy.Container(
-            pickle.load(open(pickle_filepath, "rb")),
+            _load_pickle(pickle_filepath, mmap_mode),
             rebuild_child_containers=True,
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def cont_from_disk_as_shards(directory, ivyh=None, mmap_mode=True):
+        """Load container object from the sharded checkpoint saved to the specified
+        directory by ``cont_to_disk_as_shards``.
+
+        Parameters
+        ----------
+        directory
+            Directory where the container object is saved to disk.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        mmap_mode
+            Whether to memory-map the shards rather than reading them into memory.
+            The mapping is copy-on-write, so changes to the arrays are not written
+            back to the shards, and the arrays are only read from disk once they are
+            accessed. With the numpy backend, the loaded arrays are then views of the
+            mapped files. Default is ``True``.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        """
+        return ivy.Container(
+            checkpoint.from_disk_as_shards(directory, mmap_mode), ivyh=ivyh
+        )
+
+    @staticmethod
+    def cont_from_shared_memory(handle):
+        """Load container object from the shared memory block created by
+        ``cont_to_shared_memory``, without copying the arrays when using the numpy
+        backend.
+
+        Parameters
+        ----------
+        handle
+            Handle returned by ``cont_to_shared_memory``, which can only be loaded
+            once.
+
+        Returns
+        -------
+            Container loaded from shared memory
+
+        """
+        return shared_memory.from_shared_memory(handle)
+
     @staticmethod
     def cont_from_disk_as_json(json_filepath, ivyh=None):
         """Load container object from disk at the specified json filepath. If some
@@ -1215,6 +1417,8 @@ class ContainerBase(dict, abc.ABC):
         size = 0
         batch_size = 0
         for key, value in h5_obj.items():
+            if key == _H5_PERMUTATION_KEY:
+                continue
             if isinstance(value, h5py.Group):
                 size_to_add, batch_size = ivy.Container.h5_file_size(value)
                 size += size_to_add
@@ -1229,16 +1433,37 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath,
+        seed_value=0,
+        out_h5_obj_or_filepath=None,
+        block_size=None,
+        virtual=False,
+    ):
         """Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        A single permutation is generated from the seed and shared by all datasets.
+        Each dataset is then permuted out-of-place, one chunk-aligned block of rows
+        at a time, so every block costs a single hdf5 read and a single hdf5 write.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        out_h5_obj_or_filepath
+            Filepath or h5 object to write the shuffled datasets to. Default is
+            ``None``, in which case the datasets are replaced within the input file.
+        block_size
+            Number of rows to permute at a time. Default is ``None``, in which case the
+            chunk size of each dataset along axis 0 is used, or roughly 1MB of rows for
+            contiguous datasets.
+        virtual
+            Whether to only store the permutation in the file, without moving any of
+            the data. The permutation is then applied by ``cont_from_disk_as_hdf5``
+            when reading. Default is ``False``.
 
         """
         ivy.utils.assertions.check_exists(
@@ -1249,23 +1474,86 @@ class ContainerBase(dict, abc.ABC):
         if seed_value is None:
             seed_value = random.randint(0, 1000)
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "a")
+            mode = "a" if out_h5_obj_or_filepath is None else "r"
+            h5_obj = h5py.File(h5_obj_or_filepath, mode)
         else:
             h5_obj = h5_obj_or_filepath
+        if type(out_h5_obj_or_filepath) is str:
+            out_h5_obj = h5py.File(out_h5_obj_or_filepath, "w")
+        else:
+            out_h5_obj = out_h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
+        _, batch_size = ivy.Container.h5_file_size(h5_obj)
+        permutation = _h5_permutation(batch_size, seed_value)
+        if virtual:
+            if ivy.exists(out_h5_obj):
+                raise ivy.utils.exceptions.IvyException(
+                    "virtual shuffling stores the permutation in the input file, "
+                    "out_h5_obj_or_filepath cannot be specified."
+                )
+            if _H5_PERMUTATION_KEY in h5_obj:
+                # compose with the permutation which is already stored
+                permutation = h5_obj[_H5_PERMUTATION_KEY][()][permutation]
+                del h5_obj[_H5_PERMUTATION_KEY]
+            h5_obj.create_dataset(_H5_PERMUTATION_KEY, data=permutation)
+        else:
+            ivy.Container._shuffle_h5_group(h5_obj, out_h5_obj, permutation, block_size)
+
+        if isinstance(h5_obj, h5py.File):
+            h5_obj.close()
+        if isinstance(out_h5_obj, h5py.File):
+            out_h5_obj.close()
+
+    @staticmethod
+    def _shuffle_h5_group(h5_group, out_h5_group, permutation, block_size):
+        for key, value in list(h5_group.items()):
+            if key == _H5_PERMUTATION_KEY:
+                continue
             if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
+                if out_h5_group is None:
+                    out_value = None
+                elif key in out_h5_group:
+                    out_value = out_h5_group[key]
+                else:
+                    out_value = out_h5_group.create_group(key)
+                ivy.Container._shuffle_h5_group(
+                    value, out_value, permutation, block_size
+                )
             elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
+                if value.shape[0] != permutation.shape[0]:
+                    raise ivy.utils.exceptions.IvyException(
+                        "all datasets must have the same size along axis 0 to be "
+                        "shuffled together, but found sizes {} and {}.".format(
+                            value.shape[0], permutation.shape[0]
+                        )
+                    )
+                # datasets cannot be permuted in place block by block, so write to a
+                # temporary dataset and swap it in when replacing within the file
+                in_place = out_h5_group is None
+                out_parent = h5_group if in_place else out_h5_group
+                out_key = key + "__ivy_shuffled__" if in_place else key
+                out_value = out_parent.create_dataset(
+                    out_key,
+                    shape=value.shape,
+                    dtype=value.dtype,
+                    chunks=value.chunks,
+                    maxshape=value.maxshape,
+                    compression=value.compression,
+                    compression_opts=value.compression_opts,
+                )
+                step = _h5_block_size(value, block_size)
+                for start in range(0, value.shape[0], step):
+                    stop = min(start + step, value.shape[0])
+                    out_value[start:stop] = _h5_gather_rows(
+                        value, permutation[start:stop]
+                    )
+                if in_place:
+                    del h5_group[key]
+                    h5_group.move(out_key, key)
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        if isinstance(h5_obj, h5py.File):
-            h5_obj.close()
 
     @staticmethod
     def cont_reduce(containers, reduction, config=None):
@@ -1443,6 +1731,52 @@ class ContainerBase(dict, abc.ABC):
             out=out,
         )
 
+    def _cont_get_key_chain_index(self, build=False):
+        index = self._cont_key_chain_index
+        if index is not None:
+            return index
+        # unless requested, walk the key chains until enough lookups have been made
+        # to pay for building the index, so that one-off lookups and frequent
+        # modifications are not slowed down
+        self._cont_key_chain_lookups += 1
+        if not build and self._cont_key_chain_lookups < max(
+            2, self._cont_key_chain_index_size // 16
+        ):
+            return
+        index = dict()
+        owner_ref = weakref.ref(self)
+
+        def _add_to_index(cont, prefix):
+            if cont is not self:
+                if cont._cont_index_owners is None:
+                    cont._cont_index_owners = dict()
+                cont._cont_index_owners[id(self)] = owner_ref
+            for key, value in dict.items(cont):
+                if not isinstance(key, str):
+                    continue
+                key_chain = prefix + key
+                index[key_chain] = value
+                if isinstance(value, ivy.Container):
+                    _add_to_index(value, key_chain + "/")
+
+        _add_to_index(self, "")
+        self._cont_key_chain_index = index
+        self._cont_key_chain_index_size = len(index)
+        return index
+
+    def _cont_invalidate_key_chain_index(self):
+        self._cont_key_chain_index = None
+        self._cont_key_chain_lookups = 0
+        owners = self._cont_index_owners
+        if owners:
+            # the index of every container above this one is out of date as well
+            self._cont_index_owners = None
+            for owner_ref in owners.values():
+                owner = owner_ref()
+                if owner is not None:
+                    owner._cont_key_chain_index = None
+                    owner._cont_key_chain_lookups = 0
+
     def _cont_get_shape(self):
         if not len(self.keys()):
             if ivy.exists(self._queues):
@@ -1491,6 +1825,8 @@ class ContainerBase(dict, abc.ABC):
         return None
 
     def _cont_at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
+        # resolve all of the key chains with a single pass over the container
+        self._cont_get_key_chain_index(build=len(key_chains) > 1)
         return_cont = ivy.Container(dict(), **self._config)
         for kc in key_chains:
             val = self.cont_at_key_chain(kc, ignore_key_errors=ignore_key_errors)
@@ -1502,6 +1838,8 @@ class ContainerBase(dict, abc.ABC):
     def _cont_at_key_chains_input_as_dict(
         self, key_chains, current_chain="", ignore_key_errors=False
     ):
+        if current_chain == "":
+            self._cont_get_key_chain_index(build=True)
         return_dict = dict()
         for k, v in key_chains.items():
             if current_chain == "":
@@ -1988,16 +2326,64 @@ class ContainerBase(dict, abc.ABC):
                     starting_index : starting_index + amount_to_write
                 ] = value_as_np[0:amount_to_write]
 
-    def cont_to_disk_as_pickled(self, pickle_filepath):
+    def cont_to_disk_as_pickled(self, pickle_filepath, out_of_band=False):
         """Save container object to disk, as an pickled file, at the specified filepath.
 
         Parameters
         ----------
         pickle_filepath
             Filepath for where to save the container to disk.
+        out_of_band
+            Whether to write the array buffers out-of-band with pickle protocol 5,
+            directly after the pickled structure and aligned for memory-mapping,
+            rather than copying them into the pickle stream. Such files can be loaded
+            with ``cont_from_disk_as_pickled(..., mmap_mode=True)``.
+            Default is ``False``.
+
+        """
+        if out_of_band:
+            _dump_pickle_out_of_band(self.to_ivy().cont_to_dict(), pickle_filepath)
+            return
+        with open(pickle_filepath, "wb") as f:
+            pickle.dump(self.to_native().cont_to_dict(), f)
+
+    def cont_to_disk_as_shards(self, directory, shard_size=None, asynchronous=False):
+        """Save container object to disk as a sharded checkpoint, made of a json index
+        and raw array shards in the specified directory. The arrays are aligned within
+        the shards, so they can be memory-mapped by ``cont_from_disk_as_shards``.
+
+        Parameters
+        ----------
+        directory
+            Directory for where to save the container to disk, which is created if it
+            does not exist.
+        shard_size
+            Maximum size of each shard in bytes, unless a single array is larger.
+            Default is ``None``, for 1GB shards.
+        asynchronous
+            Whether to write the shards on a background thread. The arrays are
+            copied before returning, so they can be updated while the write is in
+            progress. Default is ``False``.
+
+        Returns
+        -------
+        ret
+            ``None``, or a ``concurrent.futures.Future`` which completes once the
+            checkpoint is written, if ``asynchronous`` is set.
 
         """
-        pickle.dump(self.to_native().cont_to_dict(), open(pickle_filepath, "wb"))
+        return checkpoint.to_disk_as_shards(self, directory, shard_size, asynchronous)
+
+    def cont_to_shared_memory(self):
+        """Copy all arrays of the container into a single shared memory block.
+
+        Returns
+        -------
+            Picklable handle to the shared memory block, which can be sent to another
+            process and loaded with ``ivy.Container.cont_from_shared_memory``.
+
+        """
+        return shared_memory.to_shared_memory(self)
 
     def cont_to_jsonable(self, return_dict=None):
         """
@@ -2242,9 +2628,11 @@ class ContainerBase(dict, abc.ABC):
             Boolean
 
         """
-        keys = re.split("[/.]", key_chain)
+        index = self._cont_get_key_chain_index()
+        if index is not None and key_chain.replace(".", "/") in index:
+            return True
         ret = self
-        for key in keys:
+        for key in _split_key_chain(key_chain):
             try:
                 ret = ret[key]
             except KeyError:
@@ -2505,9 +2893,14 @@ class ContainerBase(dict, abc.ABC):
             sub-container or value at specified key chain
 
         """
-        keys = re.split("[/.]", key_chain)
+        index = self._cont_get_key_chain_index()
+        if index is not None:
+            try:
+                return index[key_chain.replace(".", "/")]
+            except KeyError:
+                pass
         ret = self
-        for key in keys:
+        for key in _split_key_chain(key_chain):
             try:
                 ret = ret[key]
             except KeyError as e:
@@ -2625,7 +3018,7 @@ class ContainerBase(dict, abc.ABC):
             new container with updated value at key chain
 
         """
-        keys = re.split("[/.]", key_chain)
+        keys = _split_key_chain(key_chain)
         if inplace:
             cont = self
         else:
@@ -2656,7 +3049,7 @@ class ContainerBase(dict, abc.ABC):
             new container with updated value at key chain, provided it existed before.
 
         """
-        keys = re.split("[/.]", key_chain)
+        keys = _split_key_chain(key_chain)
         if inplace:
             cont = self
         else:
@@ -2804,7 +3197,7 @@ class ContainerBase(dict, abc.ABC):
             Container with keys in key chain pruned.
 
         """
-        keys_in_chain = re.split("[/.]", key_chain)
+        keys_in_chain = _split_key_chain(key_chain)
         out_dict = dict()
         for key, value in self.items():
             if isinstance(value, ivy.Container):
@@ -3956,9 +4349,14 @@ class ContainerBase(dict, abc.ABC):
                 "Invalid slice type, must be one of integer, slice "
                 "or sequences of slices."
             )
-        queue_idxs = set(
-            [np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries]
+        queue_idxs = sorted(
+            set([np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries])
         )
+        if self._release_consumed_queues:
+            # the queues are consumed in order, so release the chunks before this query
+            for i in list(self._loaded_containers_from_queues):
+                if i < queue_idxs[0]:
+                    del self._loaded_containers_from_queues[i]
         conts = list()
         for i in queue_idxs:
             if i not in self._loaded_containers_from_queues:
@@ -3970,7 +4368,7 @@ class ContainerBase(dict, abc.ABC):
                 cont = self._loaded_containers_from_queues[i]
             conts.append(cont)
         combined_cont = self._container_combine_method(conts)
-        idx = list(queue_idxs)[0]
+        idx = queue_idxs[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
         if isinstance(query, int):
             shifted_query = query - offset
@@ -4095,11 +4493,36 @@ class ContainerBase(dict, abc.ABC):
             _set_dyn_backend(self, val)
             return
 
+        self._cont_invalidate_key_chain_index()
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_invalidate_key_chain_index()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._cont_invalidate_key_chain_index()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.clear(self)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_key_chain_index()
+        return dict.update(self, *args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._cont_invalidate_key_chain_index()
+        return dict.setdefault(self, key, default)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4110,6 +4533,13 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        for key in [
+            "_cont_key_chain_index",
+            "_cont_key_chain_index_size",
+            "_cont_key_chain_lookups",
+            "_cont_index_owners",
+        ]:
+            state_dict.pop(key, None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4129,6 +4559,19 @@ class ContainerBase(dict, abc.ABC):
         state_dict["_config"] = config
         return state_dict
 
+    def __reduce_ex__(self, protocol):
+        ret = super().__reduce_ex__(protocol)
+        if protocol < 5:
+            return ret
+        # export the buffers of native array leaves out-of-band as well
+        items = (
+            (k, _NativeArrayPickler(v))
+            if ivy.is_native_array(v) and not isinstance(v, np.ndarray)
+            else (k, v)
+            for k, v in self.items()
+        )
+        return ret[:4] + (items,)
+
     def __setstate__(self, state_dict):
         if "_local_ivy" in state_dict:
             if ivy.exists(state_dict["_local_ivy"]):
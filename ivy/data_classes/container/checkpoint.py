@@ -0,0 +1,203 @@
+"""Sharded checkpoint format for containers, made of a json index and raw array
+shards which can be memory-mapped."""
+
+# global
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# local
+import ivy
+
+
+_INDEX_FILENAME = "index.json"
+_FORMAT_VERSION = 1
+# arrays are placed at aligned offsets within the shards, so they can be viewed with
+# any dtype straight from the mapped file
+_ALIGNMENT = 64
+_DEFAULT_SHARD_SIZE = 2**30
+
+# a single writer, so that asynchronous saves complete in the order they were made
+_writer = None
+
+
+def _shard_filename(generation, i):
+    return "shard_{}_{:05d}.bin".format(generation, i)
+
+
+def _snapshot(x):
+    # the arrays are copied before returning, so that they can be written in the
+    # background while the originals are updated in-place
+    array = np.asarray(ivy.to_numpy(x), order="C")
+    if not array.flags.owndata:
+        array = array.copy()
+    return array
+
+
+def _plan_shards(x, shard_size):
+    arrays = list()
+    entries = dict()
+    values = dict()
+    shard, offset = 0, 0
+    for kc, leaf in x.cont_to_iterator():
+        if not ivy.is_array(leaf):
+            ivy.utils.assertions.check_true(
+                leaf is None or isinstance(leaf, (bool, int, float, str)),
+                message="only arrays and json values can be saved in a sharded "
+                "checkpoint, but found {} at {}".format(type(leaf), kc),
+            )
+            values[kc] = leaf
+            continue
+        array = _snapshot(leaf)
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        if offset and offset + array.nbytes > shard_size:
+            shard, offset = shard + 1, 0
+        arrays.append((shard, offset, array))
+        entries[kc] = {
+            "shard": shard,
+            "offset": offset,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+        }
+        offset += array.nbytes
+    num_shards = shard + 1 if arrays else 0
+    # every save writes its shards under fresh names, so the shards of the previous
+    # save, which may still be memory-mapped by loaded arrays, are never rewritten
+    generation = uuid.uuid4().hex
+    index = {
+        "format_version": _FORMAT_VERSION,
+        "alignment": _ALIGNMENT,
+        "shards": [_shard_filename(generation, i) for i in range(num_shards)],
+        "arrays": entries,
+        "values": values,
+    }
+    return index, arrays
+
+
+def _write_shards(directory, index, arrays):
+    os.makedirs(directory, exist_ok=True)
+    files = [open(os.path.join(directory, name), "xb") for name in index["shards"]]
+    try:
+        for shard, offset, array in arrays:
+            f = files[shard]
+            f.write(bytes(offset - f.tell()))
+            f.write(array.tobytes() if array.ndim == 0 else array.data)
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        for f in files:
+            f.close()
+    # the index is written last and replaced atomically, so an interrupted save never
+    # leaves an index pointing at incomplete shards
+    index_path = os.path.join(directory, _INDEX_FILENAME)
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(index, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(index_path + ".tmp", index_path)
+    # remove the shards of the previous saves, which the index no longer lists. Arrays
+    # loaded from them keep their mappings, which outlive the removed files
+    for name in os.listdir(directory):
+        if name.startswith("shard_") and name not in index["shards"]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                # files which are still mapped cannot be removed on windows, and are
+                # removed by a later save instead
+                pass
+
+
+def to_disk_as_shards(x, directory, shard_size=None, asynchronous=False):
+    """Save all leaves of a container to a directory, as raw array shards and a json
+    index.
+
+    Parameters
+    ----------
+    x
+        Container to save, whose leaves are arrays or json values.
+    directory
+        Directory to save the checkpoint to, which is created if it does not exist.
+    shard_size
+        Maximum size of each shard in bytes, unless a single array is larger.
+        Default is ``None``, for 1GB shards.
+    asynchronous
+        Whether to write the shards on a background thread. The arrays are copied
+        before returning, so they can be updated while the write is in progress.
+        Default is ``False``.
+
+    Returns
+    -------
+    ret
+        ``None``, or a ``concurrent.futures.Future`` which completes once the
+        checkpoint is written, if ``asynchronous`` is set.
+
+    """
+    global _writer
+    index, arrays = _plan_shards(x, ivy.default(shard_size, _DEFAULT_SHARD_SIZE))
+    if not asynchronous:
+        _write_shards(directory, index, arrays)
+        return None
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1)
+    return _writer.submit(_write_shards, directory, index, arrays)
+
+
+def is_sharded_checkpoint(directory):
+    """Whether the directory holds a checkpoint saved by ``to_disk_as_shards``."""
+    return os.path.isfile(os.path.join(directory, _INDEX_FILENAME))
+
+
+def from_disk_as_shards(directory, mmap_mode=True):
+    """Load a container saved by ``to_disk_as_shards``.
+
+    Parameters
+    ----------
+    directory
+        Directory the checkpoint was saved to.
+    mmap_mode
+        Whether to memory-map the shards rather than reading them into memory. The
+        mapping is copy-on-write, so changes to the arrays are not written back to
+        the shards, and each part of the shards is only read once it is accessed.
+        With the numpy backend, the loaded arrays are then views of the mapped
+        files. Default is ``True``.
+
+    Returns
+    -------
+    ret
+        Nested dict of the loaded leaves.
+
+    """
+    with open(os.path.join(directory, _INDEX_FILENAME)) as f:
+        index = json.load(f)
+    if index["format_version"] > _FORMAT_VERSION:
+        raise ivy.utils.exceptions.IvyException(
+            "the checkpoint was saved with format version {}, but only versions up "
+            "to {} are supported.".format(index["format_version"], _FORMAT_VERSION)
+        )
+    shards = list()
+    for name in index["shards"]:
+        path = os.path.join(directory, name)
+        if mmap_mode and os.path.getsize(path):
+            # plain array views of the mapping, which keep the mapping alive
+            shards.append(np.asarray(np.memmap(path, dtype=np.uint8, mode="c")))
+        else:
+            shards.append(np.fromfile(path, dtype=np.uint8))
+    leaves = dict(index["values"])
+    for kc, entry in index["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        size = int(np.prod(entry["shape"])) * dtype.itemsize
+        offset = entry["offset"]
+        array = shards[entry["shard"]][offset : offset + size]
+        leaves[kc] = ivy.asarray(array.view(dtype).reshape(entry["shape"]))
+    dict_in = dict()
+    for kc, leaf in leaves.items():
+        *keys, key = kc.split("/")
+        sub_dict = dict_in
+        for k in keys:
+            sub_dict = sub_dict.setdefault(k, dict())
+        sub_dict[key] = leaf
+    return dict_in
@@ -2113,6 +2113,9 @@ class _ContainerWithLayers(ContainerBase):
         recurrent_bias: Optional[
             Union[ivy.Array, ivy.NativeArray, ivy.Container]
         ] = None,
+        lengths: Optional[
+            Union[ivy.Array, ivy.NativeArray, ivy.Container, Sequence[int]]
+        ] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -2127,6 +2130,7 @@ class _ContainerWithLayers(ContainerBase):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            lengths=lengths,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -2145,6 +2149,9 @@ class _ContainerWithLayers(ContainerBase):
         recurrent_bias: Optional[
             Union[ivy.Array, ivy.NativeArray, ivy.Container]
         ] = None,
+        lengths: Optional[
+            Union[ivy.Array, ivy.NativeArray, ivy.Container, Sequence[int]]
+        ] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -2169,6 +2176,10 @@ class _ContainerWithLayers(ContainerBase):
             bias for cell kernel *[4 x out]*. (Default value = None)
         recurrent_bias
             bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+        lengths
+            lengths of the sequences *[batch_shape]*, for a batch of padded
+            variable-length sequences, which are then processed in packed form.
+            (Default value = None)
 
         Returns
         -------
@@ -2202,6 +2213,7 @@ class _ContainerWithLayers(ContainerBase):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            lengths=lengths,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
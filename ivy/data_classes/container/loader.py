@@ -0,0 +1,261 @@
+"""Prefetching loader which feeds the queues of a Container."""
+
+# global
+import queue
+import threading
+import time
+
+# local
+import ivy
+
+
+def _load_chunks(load_fn, index_queue, result_queue):
+    while True:
+        chunk_idx = index_queue.get()
+        if chunk_idx is None:
+            return
+        start_time = time.perf_counter()
+        try:
+            chunk = load_fn(chunk_idx)
+        except Exception as e:
+            chunk = e
+        result_queue.put((chunk_idx, chunk, time.perf_counter() - start_time))
+
+
+class _LoaderQueue:
+    # the loader releases each chunk once it is returned, so the containers reading
+    # from these queues release it as well once a later queue is queried
+    releases_consumed_chunks = True
+
+    def __init__(self, loader, slot):
+        self._loader = loader
+        self._slot = slot
+
+    def get(self, block=True, timeout=None):
+        return self._loader.get(self._slot, timeout=timeout if block else 0)
+
+
+class ContainerQueueLoader:
+    def __init__(
+        self,
+        load_fn,
+        queue_load_sizes,
+        num_workers=1,
+        prefetch_depth=None,
+        ordered=True,
+        use_processes=False,
+        context=None,
+    ):
+        """Load the chunks consumed by a queue-backed container ahead of time, using a
+        pool of worker threads or processes.
+
+        Parameters
+        ----------
+        load_fn
+            Function which takes a chunk index and returns the chunk, as a dict or
+            container with leading dimension given by the matching queue load size.
+            Must be picklable if ``use_processes`` is set.
+        queue_load_sizes
+            Size of the leading dimension of each chunk returned by ``load_fn``.
+        num_workers
+            Number of workers loading chunks in parallel. Default is ``1``.
+        prefetch_depth
+            Maximum number of chunks which are loading or loaded but not yet
+            consumed. Default is ``None``, in which case twice the number of workers
+            is used.
+        ordered
+            Whether chunks are delivered in index order. If ``False``, each queue
+            returns whichever chunk finished loading first, which requires all chunks
+            to have the same load size. Default is ``True``.
+        use_processes
+            Whether to load chunks in worker processes rather than threads.
+            Default is ``False``.
+        context
+            The multiprocessing context to use when ``use_processes`` is set, either
+            fork, forkserver or spawn. Default is ``None``.
+
+        """
+        self._queue_load_sizes = list(queue_load_sizes)
+        if not ordered and len(set(self._queue_load_sizes)) > 1:
+            raise ivy.utils.exceptions.IvyException(
+                "unordered delivery requires all queue load sizes to be equal, "
+                "but found {}.".format(self._queue_load_sizes)
+            )
+        self._num_chunks = len(self._queue_load_sizes)
+        self._num_workers = num_workers
+        self._prefetch_depth = ivy.default(prefetch_depth, 2 * num_workers)
+        self._ordered = ordered
+        if use_processes:
+            multiprocessing = ivy.multiprocessing(context)
+            self._index_queue = multiprocessing.Queue()
+            self._result_queue = multiprocessing.Queue()
+            worker_cls = multiprocessing.Process
+        else:
+            self._index_queue = queue.Queue()
+            self._result_queue = queue.Queue()
+            worker_cls = threading.Thread
+        self._workers = [
+            worker_cls(
+                target=_load_chunks,
+                args=(load_fn, self._index_queue, self._result_queue),
+                daemon=True,
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._num_submitted = 0
+        self._loaded_chunks = dict()
+        self._num_delivered = 0
+        self._load_time = 0.0
+        self._wait_time = 0.0
+        self._num_loaded = 0
+        self._num_items_loaded = 0
+        self._start_time = time.perf_counter()
+        for _ in range(min(self._prefetch_depth, self._num_chunks)):
+            self._submit_next()
+        self.queues = [_LoaderQueue(self, i) for i in range(self._num_chunks)]
+
+    # Private #
+    # --------#
+
+    def _submit_next(self):
+        if self._num_submitted < self._num_chunks:
+            self._index_queue.put(self._num_submitted)
+            self._num_submitted += 1
+            if self._num_submitted == self._num_chunks:
+                for _ in range(self._num_workers):
+                    self._index_queue.put(None)
+
+    def _receive(self, timeout):
+        chunk_idx, chunk, load_time = self._result_queue.get(timeout=timeout)
+        self._loaded_chunks[chunk_idx] = chunk
+        self._load_time += load_time
+        self._num_loaded += 1
+        self._num_items_loaded += self._queue_load_sizes[chunk_idx]
+
+    # Public #
+    # -------#
+
+    def get(self, slot, timeout=None):
+        """Get the chunk for the given queue slot, waiting for it to be loaded if
+        necessary. Once returned, the chunk is released by the loader and the next
+        chunk is scheduled for loading.
+
+        Parameters
+        ----------
+        slot
+            Index of the queue to get the chunk for.
+        timeout
+            Maximum time in seconds to wait for the chunk. Default is ``None``, in
+            which case the call blocks until the chunk is loaded.
+
+        Returns
+        -------
+        ret
+            The loaded chunk.
+
+        Raises
+        ------
+        queue.Empty
+            If the chunk is not loaded within the timeout.
+
+        """
+        start_time = time.perf_counter()
+        if self._ordered:
+            # a slot beyond the prefetch depth is only loaded once it is requested
+            while self._num_submitted <= slot:
+                self._submit_next()
+        try:
+            while True:
+                if self._ordered and slot in self._loaded_chunks:
+                    chunk = self._loaded_chunks.pop(slot)
+                    break
+                if not self._ordered and self._loaded_chunks:
+                    # deliver chunks in the order they finished loading
+                    chunk = self._loaded_chunks.pop(next(iter(self._loaded_chunks)))
+                    break
+                if timeout is None:
+                    self._receive(None)
+                else:
+                    elapsed = time.perf_counter() - start_time
+                    self._receive(max(timeout - elapsed, 0))
+        finally:
+            self._wait_time += time.perf_counter() - start_time
+        if isinstance(chunk, Exception):
+            raise chunk
+        self._num_delivered += 1
+        self._submit_next()
+        return chunk
+
+    def container(self, **kwargs):
+        """Create a container which consumes the chunks of this loader.
+
+        Parameters
+        ----------
+        kwargs
+            Further keyword arguments for the container constructor.
+
+        Returns
+        -------
+        ret
+            Container reading from the queues of this loader.
+
+        """
+        return ivy.Container(
+            queues=self.queues, queue_load_sizes=self._queue_load_sizes, **kwargs
+        )
+
+    def stats(self):
+        """Get the throughput and waiting time counters of the loading and consuming
+        stages. A large consumer waiting time relative to the elapsed time indicates
+        that the consumer is input-bound.
+
+        Returns
+        -------
+        ret
+            Dict of counters for the ``load`` and ``consume`` stages.
+
+        """
+        elapsed = time.perf_counter() - self._start_time
+        items_loaded = self._num_items_loaded
+        items_delivered = sum(self._queue_load_sizes[: self._num_delivered])
+        return {
+            "load": {
+                "chunks": self._num_loaded,
+                "items": items_loaded,
+                "busy_time": self._load_time,
+                "items_per_second": items_loaded / self._load_time
+                if self._load_time
+                else 0.0,
+            },
+            "consume": {
+                "chunks": self._num_delivered,
+                "items": items_delivered,
+                "wait_time": self._wait_time,
+                "wait_fraction": self._wait_time / elapsed if elapsed else 0.0,
+                "items_per_second": items_delivered / elapsed if elapsed else 0.0,
+            },
+        }
+
+    def close(self):
+        """Stop the workers, discarding any chunks which have not been consumed."""
+        for _ in range(self._num_workers):
+            self._index_queue.put(None)
+        for worker in self._workers:
+            # keep draining results, since worker processes cannot exit while their
+            # results are still waiting to be flushed to the queue
+            while worker.is_alive():
+                try:
+                    self._receive(0.01)
+                except queue.Empty:
+                    pass
+            worker.join()
+        self._loaded_chunks.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,157 @@
+"""Shared memory transport for containers and arrays."""
+
+# global
+import ctypes
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# local
+import ivy
+
+
+# leaves are placed at aligned offsets, so they can be viewed with any dtype
+_ALIGNMENT = 64
+
+_SharedLeaf = namedtuple("_SharedLeaf", ["offset", "shape", "dtype"])
+_SharedContainer = namedtuple("_SharedContainer", ["dict_in"])
+SharedMemoryHandle = namedtuple("SharedMemoryHandle", ["name", "nbytes", "nest"])
+
+
+class _SharedBlock:
+    def __init__(self, name, nbytes):
+        self._shm = shared_memory.SharedMemory(name=name)
+        # each block is consumed exactly once, so it can be unlinked straight away,
+        # and the memory is freed once the mapping is closed
+        self._shm.unlink()
+        # expose the mapping through the array interface rather than the buffer
+        # protocol, so that the block can still be closed once the last view of it
+        # has been freed
+        view = ctypes.c_char.from_buffer(self._shm.buf)
+        self.__array_interface__ = {
+            "shape": (nbytes,),
+            "typestr": "|u1",
+            "data": (ctypes.addressof(view), False),
+            "version": 3,
+        }
+        del view
+
+    def __del__(self):
+        self._shm.close()
+
+
+def to_shared_memory(x):
+    """Copy all array leaves of ``x`` into a single shared memory block, and return a
+    small picklable handle for it. Only the handle needs to be sent to the receiving
+    process, which recovers ``x`` with ``from_shared_memory``.
+
+    Parameters
+    ----------
+    x
+        Array, container, or nest of arrays and containers to place in shared memory.
+
+    Returns
+    -------
+    ret
+        Handle to the shared memory block, holding the name of the block and the
+        structure and metadata of the array leaves.
+
+    """
+    arrays = list()
+    nbytes = 0
+
+    def _to_nest(x):
+        nonlocal nbytes
+        if isinstance(x, ivy.Container):
+            return _SharedContainer(_to_nest(x.cont_to_dict()))
+        if isinstance(x, dict):
+            return {k: _to_nest(v) for k, v in x.items()}
+        if isinstance(x, (list, tuple)):
+            return type(x)([_to_nest(v) for v in x])
+        if ivy.is_array(x):
+            x = np.ascontiguousarray(ivy.to_numpy(x))
+            offset = -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+            arrays.append((offset, x))
+            nbytes = offset + x.nbytes
+            return _SharedLeaf(offset, x.shape, x.dtype.str)
+        return x
+
+    nest = _to_nest(x)
+    # shared memory blocks cannot be empty
+    nbytes = max(nbytes, 1)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    for offset, array in arrays:
+        np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=offset)[...] = array
+    shm.close()
+    return SharedMemoryHandle(shm.name, nbytes, nest)
+
+
+def from_shared_memory(handle):
+    """Recover the arrays and containers placed in shared memory by
+    ``to_shared_memory``. With the numpy backend, the returned arrays are views of the
+    shared memory block, without any copies. The block is released once every
+    returned array has been freed.
+
+    Parameters
+    ----------
+    handle
+        Handle returned by ``to_shared_memory``, which can only be consumed once.
+
+    Returns
+    -------
+    ret
+        The arrays and containers, with the same structure as the input to
+        ``to_shared_memory``.
+
+    """
+    buffer = np.asarray(_SharedBlock(handle.name, handle.nbytes))
+
+    def _from_nest(x):
+        if isinstance(x, _SharedLeaf):
+            dtype = np.dtype(x.dtype)
+            size = int(np.prod(x.shape)) * dtype.itemsize
+            array = buffer[x.offset : x.offset + size].view(dtype).reshape(x.shape)
+            return ivy.asarray(array)
+        if isinstance(x, _SharedContainer):
+            return ivy.Container(_from_nest(x.dict_in))
+        if isinstance(x, dict):
+            return {k: _from_nest(v) for k, v in x.items()}
+        if isinstance(x, (list, tuple)):
+            return type(x)([_from_nest(v) for v in x])
+        return x
+
+    return _from_nest(handle.nest)
+
+
+class SharedMemoryQueue:
+    def __init__(self, maxsize=0, context=None):
+        """Multiprocessing queue which transfers arrays and containers through shared
+        memory, so that only the handles and metadata of the array leaves are pickled.
+        Can be passed as one of the ``queues`` of an ``ivy.Container``.
+
+        Parameters
+        ----------
+        maxsize
+            Maximum number of items in the queue. Default is ``0``, for no limit.
+        context
+            The multiprocessing context, either fork, forkserver or spawn.
+            Default is ``None``.
+
+        """
+        self._queue = ivy.multiprocessing(context).Queue(maxsize)
+
+    def put(self, obj, block=True, timeout=None):
+        self._queue.put(to_shared_memory(obj), block, timeout)
+
+    def get(self, block=True, timeout=None):
+        return from_shared_memory(self._queue.get(block, timeout))
+
+    def qsize(self):
+        return self._queue.qsize()
+
+    def empty(self):
+        return self._queue.empty()
+
+    def close(self):
+        self._queue.close()
@@ -81,33 +81,33 @@ def _get_first_array(*args, **kwargs):
 
 
 def _build_view(original, view, fn, args, kwargs, index=None):
-    if ivy.exists(original._base):
-        if ivy.backend in ("jax", "tensorflow"):
+    base = original._base if ivy.exists(original._base) else original
+    view._base = base
+    if ivy.backend in ("jax", "tensorflow"):
+        # without native views, inplace updates replay the manipulations of the
+        # view on its base, and then on every other view of the base
+        if ivy.exists(original._base):
             warnings.warn(
                 "Creating many views will lead to overhead "
                 "when performing inplace updates with this backend"
             )
-        base = original._base
-        view._base = base
-        view._manipulation_stack = python_copy.copy(original._manipulation_stack)
-    else:
-        base = original
-        view._base = base
-    base._view_refs.append(weakref.ref(view))
-    view._manipulation_stack.append((fn, args[1:], kwargs, index))
-
-    # Handle attributes for torch functions without native view functionality
-    if ivy.exists(original._torch_base):
-        view._torch_base = (
-            original
-            if ivy.exists(original._torch_manipulation)
-            else original._torch_base
-        )
-    else:
-        view._torch_base = base
-    if fn in _torch_non_native_view_functions:
-        view._torch_manipulation = (original, (fn, args[1:], kwargs))
-        view._torch_base._torch_view_refs.append(weakref.ref(view))
+            view._manipulation_stack = python_copy.copy(original._manipulation_stack)
+        base._view_refs.append(weakref.ref(view))
+        view._manipulation_stack.append((fn, args[1:], kwargs, index))
+    elif ivy.backend == "torch":
+        # native views share memory with their base, and only the manipulations
+        # which torch can't express as strided views are replayed
+        if ivy.exists(original._torch_base):
+            view._torch_base = (
+                original
+                if ivy.exists(original._torch_manipulation)
+                else original._torch_base
+            )
+        else:
+            view._torch_base = base
+        if fn in _torch_non_native_view_functions:
+            view._torch_manipulation = (original, (fn, args[1:], kwargs))
+            view._torch_base._torch_view_refs.append(weakref.ref(view))
     return view
 
 
@@ -282,6 +282,38 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
     return _inputs_to_native_arrays
 
 
+def _frontend_array_to_native(x):
+    if hasattr(x, "ivy_array"):
+        return x.ivy_array.data
+    if isinstance(x, ivy.Array):
+        return x.data
+    return x
+
+
+def _call_with_native_arrays(fn, args, kwargs, to_native=_frontend_array_to_native):
+    """
+    Call a frontend function in frontend native mode, with all frontend arrays and
+    ivy arrays in its inputs unwrapped to native arrays in a single pass, and with
+    array mode off, such that the ivy functions it calls pass the native arrays on
+    to the backend without converting them again. The out argument is left as is.
+    """
+    has_out = "out" in kwargs
+    out = kwargs.get("out")
+    args, kwargs = ivy.nested_map(
+        [args, {k: v for k, v in kwargs.items() if k != "out"}],
+        to_native,
+        include_derived={tuple: True},
+        shallow=False,
+    )
+    if has_out:
+        kwargs["out"] = out
+    ivy.set_array_mode(False)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        ivy.unset_array_mode()
+
+
 def inputs_to_ivy_arrays(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _inputs_to_ivy_arrays(*args, **kwargs):
@@ -673,15 +705,21 @@ def _update_torch_views(x, visited_view=None):
 
 
 def _update_torch_references(x, visited_view=None):
+    live_refs = []
     for ref in x._torch_view_refs:
         view = ref()
-        if ivy.exists(view) and view is not visited_view:
+        if not ivy.exists(view):
+            continue
+        live_refs.append(ref)
+        if view is not visited_view:
             parent_tensor, fn_args_kwargs = view._torch_manipulation
             fn, args, kwargs = fn_args_kwargs
             kwargs["copy"] = True
             view.data[()] = ivy.__dict__[fn](parent_tensor, *args, **kwargs).data
             if view._torch_view_refs != []:
                 _update_torch_references(view)
+    # drop the references of the views which were garbage collected
+    x._torch_view_refs = live_refs
 
 
 # Nestable Handling #
@@ -25,7 +25,8 @@ def native_sparse_array(
     row_indices=None,
     values=None,
     dense_shape=None,
-    format="coo"
+    format="coo",
+    validate=True,
 ):
     ivy.utils.assertions.check_exists(
         data,
@@ -49,39 +50,44 @@ def native_sparse_array(
     format = format.lower()
 
     if format == "coo":
-        _verify_coo_components(
-            indices=coo_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_coo_components(
+                indices=coo_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "csr":
-        _verify_csr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "bsr":
-        _verify_bsr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "csc":
-        _verify_csc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     else:
-        _verify_bsc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     logging.warning("Jax does not support sparse array natively, None is returned.")
     return None
 
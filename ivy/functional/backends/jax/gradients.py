@@ -10,6 +10,7 @@ from typing import Optional, Callable, Sequence, Union, Tuple
 # local
 import ivy
 from ivy.functional.ivy.gradients import (
+    _checkpoint_array_args,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_variables_and_indices,
@@ -137,6 +138,10 @@ def value_and_grad(func):
     return callback_fn
 
 
+def checkpoint(func: Callable):
+    return _checkpoint_array_args(func, lambda fn, *args: jax.checkpoint(fn)(*args))
+
+
 def stop_gradient(
     x: JaxArray, /, *, preserve_type: bool = True, out: Optional[JaxArray] = None
 ) -> JaxArray:
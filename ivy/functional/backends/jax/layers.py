@@ -6,6 +6,7 @@ import jax.numpy as jnp
 
 # local
 import ivy
+from ivy.func_wrapper import handle_mixed_function
 from ivy.functional.backends.jax import JaxArray
 from typing import Union, Tuple, Optional, Sequence
 from ivy.functional.ivy.layers import (
@@ -15,6 +16,78 @@ from ivy.functional.ivy.layers import (
 )
 
 
+def _key_blocks(x, axis, num_blocks, block_size):
+    # pads the key axis to a whole number of blocks, and moves the blocks to the front
+    # for scanning over them
+    axis = axis % x.ndim
+    pad_width = [(0, 0)] * x.ndim
+    pad_width[axis] = (0, num_blocks * block_size - x.shape[axis])
+    x = jnp.pad(x, pad_width)
+    x = x.reshape(x.shape[:axis] + (num_blocks, block_size) + x.shape[axis + 1 :])
+    return jnp.moveaxis(x, axis, 0)
+
+
+@handle_mixed_function(
+    lambda *args, **kwargs: ivy.get_attention_block_size() is not None
+)
+def scaled_dot_product_attention(
+    q: JaxArray,
+    k: JaxArray,
+    v: JaxArray,
+    scale: float,
+    /,
+    *,
+    mask: Optional[JaxArray] = None,
+    out: Optional[JaxArray] = None,
+) -> JaxArray:
+    block_size = ivy.get_attention_block_size()
+    num_keys = k.shape[-2]
+    num_blocks = -(-num_keys // block_size)
+    dtype = jnp.result_type(q, k, 1.0)
+    batch_shape = jnp.broadcast_shapes(
+        q.shape[:-2],
+        k.shape[:-2],
+        v.shape[:-2],
+        *(() if mask is None else (mask.shape[:-2],)),
+    )
+    blocked_mask = mask is not None and mask.shape[-1] != 1
+    xs = (
+        _key_blocks(k, -2, num_blocks, block_size),
+        _key_blocks(v, -2, num_blocks, block_size),
+        jnp.arange(num_blocks * block_size).reshape(num_blocks, block_size) < num_keys,
+    )
+    if blocked_mask:
+        xs += (_key_blocks(mask, -1, num_blocks, block_size),)
+
+    def _attend_block(carry, xs):
+        running_max, running_sum, ret = carry
+        k_block, v_block, valid_block = xs[:3]
+
+        # BS x Q x block
+        sim = (jnp.einsum("...qf,...kf->...qk", q, k_block) * scale).astype(dtype)
+        if mask is not None:
+            mask_block = xs[3] if blocked_mask else mask
+            sim = jnp.where(jnp.logical_not(mask_block), -jnp.finfo(dtype).max, sim)
+        # the padding past the last key is left out of the softmax
+        sim = jnp.where(valid_block, sim, -jnp.inf)
+
+        new_max = jnp.maximum(running_max, sim.max(axis=-1, keepdims=True))
+        correction = jnp.exp(running_max - new_max)
+        weights = jnp.exp(sim - new_max)
+        running_sum = running_sum * correction + weights.sum(axis=-1, keepdims=True)
+        ret = ret * correction + jnp.einsum("...qk,...kf->...qf", weights, v_block)
+        return (new_max, running_sum, ret), None
+
+    num_queries = q.shape[-2]
+    init = (
+        jnp.full(batch_shape + (num_queries, 1), -jnp.inf, dtype),
+        jnp.zeros(batch_shape + (num_queries, 1), dtype),
+        jnp.zeros(batch_shape + (num_queries, v.shape[-1]), jnp.result_type(dtype, v)),
+    )
+    (_, running_sum, ret), _ = jlax.scan(_attend_block, init, xs)
+    return ret / running_sum
+
+
 def _transpose_padding_helper(k, s, padding, dilation, diff=0):
     k = (k - 1) * dilation + 1
     if padding == "SAME":
@@ -56,7 +56,7 @@ def asarray(
 ) -> np.ndarray:
     if isinstance(obj, np.ndarray):
         if dtype is not None:
-            obj = ivy.astype(obj, dtype, copy=False).to_native()
+            obj = ivy.to_native(ivy.astype(obj, dtype, copy=False))
         ret = np.copy(obj) if copy else obj
         return _to_device(ret, device=device)
     elif isinstance(obj, (list, tuple, dict)) and len(obj) != 0 and dtype is None:
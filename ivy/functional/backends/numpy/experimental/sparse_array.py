@@ -1,10 +1,14 @@
 # global
 import logging
+from typing import Optional
+
+import numpy as np
 
 # local
 import ivy
 from ivy.functional.ivy.experimental.sparse_array import (
     _is_valid_format,
+    _sparse_coordinates,
     _verify_bsc_components,
     _verify_bsr_components,
     _verify_coo_components,
@@ -29,6 +33,7 @@ def native_sparse_array(
     values=None,
     dense_shape=None,
     format="coo",
+    validate=True,
 ):
     ivy.utils.assertions.check_exists(
         data,
@@ -55,39 +60,44 @@ def native_sparse_array(
     format = format.lower()
 
     if format == "coo":
-        _verify_coo_components(
-            indices=coo_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_coo_components(
+                indices=coo_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "csr":
-        _verify_csr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "bsr":
-        _verify_bsr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "csc":
-        _verify_csc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     else:
-        _verify_bsc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     logging.warning("Numpy does not support sparse array natively, None is returned.")
     return None
 
@@ -98,3 +108,65 @@ def native_sparse_array_to_indices_values_and_shape(x):
         " indices, values and shape."
     )
     return None, None, None
+
+
+def _segments(x, axis):
+    """Get the values of a sparse matrix grouped into contiguous segments, one for
+    each row when reducing along axis 1, or for each column when reducing along axis
+    0, along with the segment boundaries and the column or row of each value."""
+    compressed_format = "csr" if axis == 1 else "csc"
+    if x._format == compressed_format:
+        if axis == 1:
+            pointers, indices = x.crow_indices, x.col_indices
+        else:
+            pointers, indices = x.ccol_indices, x.row_indices
+        return (
+            ivy.to_native(pointers),
+            ivy.to_native(indices),
+            ivy.to_native(x.values),
+        )
+    rows, cols, values = (ivy.to_native(a) for a in _sparse_coordinates(x))
+    segment_ids, indices = (rows, cols) if axis == 1 else (cols, rows)
+    order = np.lexsort((indices, segment_ids))
+    counts = np.bincount(segment_ids, minlength=x.dense_shape[1 - axis])
+    pointers = np.concatenate([[0], np.cumsum(counts)])
+    return pointers, indices[order], values[order]
+
+
+def _segment_reduce(ufunc, data, pointers):
+    # reduceat repeats the value at the start of empty segments, so only the
+    # non-empty segments are reduced, and the others are left as zeros
+    ret = np.zeros((pointers.shape[0] - 1,) + data.shape[1:], dtype=data.dtype)
+    non_empty = pointers[:-1] < pointers[1:]
+    if np.any(non_empty):
+        ret[non_empty] = ufunc.reduceat(data, pointers[:-1][non_empty], axis=0)
+    return ret
+
+
+def sparse_matmul(x, y: np.ndarray, /) -> np.ndarray:
+    pointers, cols, values = _segments(x, 1)
+    products = values.reshape((-1,) + (1,) * (y.ndim - 1)) * y[cols]
+    return _segment_reduce(np.add, products, pointers)
+
+
+def sparse_sum(x, /, *, axis: Optional[int] = None) -> np.ndarray:
+    if axis is None:
+        return np.asarray(np.sum(ivy.to_native(x.values)))
+    pointers, _, values = _segments(x, axis % 2)
+    return _segment_reduce(np.add, values, pointers)
+
+
+def sparse_max(x, /, *, axis: Optional[int] = None) -> np.ndarray:
+    num_rows, num_cols = x.dense_shape
+    if axis is None:
+        values = ivy.to_native(x.values)
+        if values.size < num_rows * num_cols:
+            return np.asarray(np.max(values, initial=0))
+        return np.asarray(np.max(values))
+    axis = axis % 2
+    pointers, _, values = _segments(x, axis)
+    ret = _segment_reduce(np.maximum, values, pointers)
+    # the rows or columns which are not full also hold zeros
+    not_full = np.diff(pointers) < x.dense_shape[axis]
+    ret[not_full] = np.maximum(ret[not_full], 0)
+    return ret
@@ -191,16 +191,16 @@ def inplace_update(
             val = ivy.astype(val, x.dtype)
         (x_native, val_native), _ = ivy.args_to_native(x, val)
 
-        # make both arrays contiguous if not already
-        if not x_native.flags.c_contiguous:
-            x_native = np.ascontiguousarray(x_native)
-        if not val_native.flags.c_contiguous:
-            val_native = np.ascontiguousarray(val_native)
-
-        if val_native.shape == x_native.shape:
-            if x_native.dtype != val_native.dtype:
-                x_native = x_native.astype(val_native.dtype)
+        # write through the strides of x, such that the update is shared with
+        # the base array and every other view of it
+        if (
+            val_native.shape == x_native.shape
+            and x_native.dtype == val_native.dtype
+            and x_native.flags.writeable
+        ):
             np.copyto(x_native, val_native)
+        elif val_native.shape == x_native.shape:
+            x_native = val_native.copy()
         else:
             x_native = val_native
         if ivy.is_ivy_array(x):
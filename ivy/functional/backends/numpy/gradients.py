@@ -93,6 +93,11 @@ def grad(func, argnums=0):
     return grad_fn
 
 
+def checkpoint(func):
+    # NumPy does not support autograd, so there are no activations to release
+    return func
+
+
 def stop_gradient(x, /, *, preserve_type=True, out=None):
     logging.warning(
         "NumPy does not support autograd, 'stop_gradient' "
@@ -7,13 +7,72 @@ from typing import Union, Tuple, Optional, Sequence
 
 # local
 import ivy
+from ivy.func_wrapper import handle_mixed_function
 from ivy.functional.ivy.layers import (
     _handle_padding,
     _deconv_length,
     _get_x_data_format,
+    _lstm_packed_batch,
 )
 
 
+@handle_mixed_function(
+    lambda *args, **kwargs: ivy.get_attention_block_size() is not None
+)
+def scaled_dot_product_attention(
+    q: np.ndarray,
+    k: np.ndarray,
+    v: np.ndarray,
+    scale: float,
+    /,
+    *,
+    mask: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    block_size = ivy.get_attention_block_size()
+    num_keys = k.shape[-2]
+    dtype = np.result_type(q, k, scale)
+    masked_value = -np.finfo(dtype).max
+    running_max = None
+    # the scores of masked keys overflow once the running maximum is subtracted,
+    # which leaves them with a weight of zero
+    with np.errstate(over="ignore"):
+        for start in range(0, num_keys, block_size):
+            end = min(start + block_size, num_keys)
+            v_block = v[..., start:end, :]
+
+            # BS x Q x block, with the weights computed in place
+            weights = np.matmul(q, np.swapaxes(k[..., start:end, :], -1, -2)).astype(
+                dtype, copy=False
+            )
+            weights *= scale
+            if mask is not None:
+                mask_block = mask[..., start:end] if mask.shape[-1] != 1 else mask
+                weights = np.where(
+                    np.logical_not(mask_block), dtype.type(masked_value), weights
+                )
+
+            block_max = weights.max(axis=-1, keepdims=True)
+            if running_max is None:
+                running_max = block_max
+                weights -= running_max
+                np.exp(weights, out=weights)
+                running_sum = weights.sum(axis=-1, keepdims=True)
+                ret = np.matmul(weights, v_block)
+                continue
+            new_max = np.maximum(running_max, block_max)
+            correction = np.exp(running_max - new_max)
+            weights -= new_max
+            np.exp(weights, out=weights)
+            running_sum *= correction
+            running_sum += weights.sum(axis=-1, keepdims=True)
+            ret *= correction
+            ret += np.matmul(weights, v_block)
+            running_max = new_max
+    ret /= running_sum
+    return ret
+
+
 def _add_dilations(x, dilations, axis, values=0):
     return np.insert(
         x,
@@ -519,3 +578,91 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+    lengths: Optional[Union[np.ndarray, Sequence[int]]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    batch_shape = list(x.shape[:-2])
+    timesteps, input_channels = x.shape[-2:]
+    hidden_channels = recurrent_kernel.shape[0]
+    batch_size = int(np.prod(batch_shape))
+    dtype = np.result_type(x, init_h, init_c, kernel, recurrent_kernel)
+
+    # the gates are reordered as input, forget, output and cell, so that the three
+    # sigmoid gates are activated together
+    gate_order = np.r_[
+        : 2 * hidden_channels,
+        3 * hidden_channels : 4 * hidden_channels,
+        2 * hidden_channels : 3 * hidden_channels,
+    ]
+    recurrent_kernel = recurrent_kernel[:, gate_order].astype(dtype, copy=False)
+
+    # time-major input projection for all timesteps, with both biases added once
+    x = x.reshape(batch_size, timesteps, input_channels).swapaxes(0, 1)
+    Wi_x = np.matmul(x, kernel[:, gate_order]).astype(dtype, copy=False)
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            Wi_x += b[gate_order]
+
+    # the cell state is updated in place
+    ht = init_h.reshape(batch_size, hidden_channels).astype(dtype)
+    ct = init_c.reshape(batch_size, hidden_channels).astype(dtype)
+    if lengths is None:
+        batch_sizes = [batch_size] * timesteps
+    else:
+        order, batch_sizes = _lstm_packed_batch(lengths, batch_size, timesteps)
+        Wi_x = Wi_x[:, order]
+        ht = ht[order]
+        ct = ct[order]
+
+    # buffers shared by all steps, with the hidden states written straight into the
+    # output, which is zero past the end of each sequence in packed form
+    hts = (np.empty if lengths is None else np.zeros)(
+        (timesteps, batch_size, hidden_channels), dtype
+    )
+    gates = np.empty((batch_size, 4 * hidden_channels), dtype)
+    tanh_ct = np.empty((batch_size, hidden_channels), dtype)
+    h = hidden_channels
+    with np.errstate(over="ignore"):
+        for t, n in enumerate(batch_sizes):
+            gates_t = gates[:n]
+            np.matmul(ht[:n], recurrent_kernel, out=gates_t)
+            gates_t += Wi_x[t, :n]
+            sigmoid_gates = gates_t[:, : 3 * h]
+            np.negative(sigmoid_gates, out=sigmoid_gates)
+            np.exp(sigmoid_gates, out=sigmoid_gates)
+            sigmoid_gates += 1
+            np.reciprocal(sigmoid_gates, out=sigmoid_gates)
+            it, ft, ot = (
+                gates_t[:, :h],
+                gates_t[:, h : 2 * h],
+                gates_t[:, 2 * h : 3 * h],
+            )
+            gt = gates_t[:, 3 * h :]
+            np.tanh(gt, out=gt)
+            ct_t = ct[:n]
+            ct_t *= ft
+            it *= gt
+            ct_t += it
+            np.tanh(ct_t, out=tanh_ct[:n])
+            ht = hts[t]
+            np.multiply(ot, tanh_ct[:n], out=ht[:n])
+
+    if lengths is not None:
+        inverse_order = np.argsort(order)
+        hts = hts[:, inverse_order]
+        ct = ct[inverse_order]
+    return (
+        hts.swapaxes(0, 1).reshape(batch_shape + [timesteps, hidden_channels]),
+        ct.reshape(batch_shape + [hidden_channels]),
+    )
@@ -360,7 +360,7 @@ def atleast_1d(
 ) -> List[paddle.Tensor]:
     res = []
     for ary in arys:
-        ary = ivy.array(ary, copy=copy).data
+        ary = ivy.to_native(ivy.array(ary, copy=copy))
         if ary.ndim < 1:
             with ivy.ArrayMode(False):
                 res.append(ivy.expand_dims(ary, axis=0))
@@ -392,7 +392,7 @@ def atleast_2d(
 ) -> List[paddle.Tensor]:
     res = []
     for ary in arys:
-        ary = ivy.array(ary, copy=copy).data
+        ary = ivy.to_native(ivy.array(ary, copy=copy))
         if ary.ndim < 2:
             with ivy.ArrayMode(False):
                 res.append(ivy.expand_dims(ary, axis=list(range(2 - ary.ndim))))
@@ -408,7 +408,7 @@ def atleast_3d(
 ) -> List[paddle.Tensor]:
     res = []
     for ary in arys:
-        ary = ivy.array(ary, copy=copy).data
+        ary = ivy.to_native(ivy.array(ary, copy=copy))
         if ary.ndim < 3:
             with ivy.ArrayMode(False):
                 res.append(ivy.expand_dims(ary, axis=list(range(3 - ary.ndim))))
@@ -565,8 +565,8 @@ def expand(
         return paddle.expand(x.cast("float32"), shape).cast(x.dtype)
 
     elif x.dtype in [paddle.complex64, paddle.complex128]:
-        x_real = paddle.expand(ivy.real(x).data, shape)
-        x_imag = paddle.expand(ivy.imag(x).data, shape)
+        x_real = paddle.expand(ivy.to_native(ivy.real(x)), shape)
+        x_imag = paddle.expand(ivy.to_native(ivy.imag(x)), shape)
         return x_real + 1j * x_imag
     else:
         return paddle.expand(x, shape)
@@ -16,6 +16,7 @@ def native_sparse_array(
     values=None,
     dense_shape=None,
     format="coo",
+    validate=True,
 ):
     raise IvyNotImplementedException()
 
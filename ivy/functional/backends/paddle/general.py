@@ -613,7 +613,7 @@ def scatter_nd(
                 )
         else:
             indices = [[indices]] if isinstance(indices, Number) else indices
-            indices = ivy.array(indices).data
+            indices = ivy.to_native(ivy.array(indices))
             if len(indices.shape) < 2:
                 indices = ivy.expand_dims(indices, 0)
             if ivy.any(indices < 0):
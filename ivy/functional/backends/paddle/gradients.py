@@ -11,6 +11,7 @@ import ivy
 from ivy.func_wrapper import with_unsupported_device_and_dtypes
 from . import backend_version
 from ivy.functional.ivy.gradients import (
+    _checkpoint_array_args,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_y,
@@ -21,7 +22,7 @@ from ivy.functional.ivy.gradients import (
 
 def variable(x, /):
     if ivy.is_int_dtype(x.dtype):
-        x = ivy.astype(x, ivy.default_float_dtype()).to_native()
+        x = ivy.to_native(ivy.astype(x, ivy.default_float_dtype()))
     if not x.is_leaf:
         ret = x.detach()
         ret.stop_gradient = False
@@ -45,7 +46,7 @@ def _grad_func(y, xs, retain_grads):
     grads_ = ivy.nested_map(
         xs,
         lambda x: (
-            ivy.array([0.0]).to_native()
+            ivy.to_native(ivy.array([0.0]))
             if x is None
             else ivy.to_native(ivy.zeros_like(x))
         ),
@@ -69,7 +70,7 @@ def _grad_func(y, xs, retain_grads):
                 paddle.grad(
                     outputs=[y],
                     inputs=[
-                        ivy.array([0.0]).to_native() if v is None else v
+                        ivy.to_native(ivy.array([0.0])) if v is None else v
                         for k, v in xs.cont_to_iterator()
                     ],
                     retain_graph=True,
@@ -89,10 +90,10 @@ def _grad_func(y, xs, retain_grads):
     else:
 
         def grad_(x):
-            x = ivy.array([0.0]).to_native() if x is None else x
+            x = ivy.to_native(ivy.array([0.0])) if x is None else x
             grad = paddle.grad(
                 outputs=y,
-                inputs=ivy.array([0.0]).to_native() if x is None else x,
+                inputs=ivy.to_native(ivy.array([0.0])) if x is None else x,
                 retain_graph=True,
                 create_graph=retain_grads,
                 allow_unused=True,
@@ -184,6 +185,12 @@ def value_and_grad(func):
     return callback_fn
 
 
+def checkpoint(func: Callable):
+    return _checkpoint_array_args(
+        func, lambda fn, *args: paddle.distributed.fleet.utils.recompute(fn, *args)
+    )
+
+
 def stop_gradient(
     x: Optional[paddle.Tensor],
     /,
@@ -1,9 +1,11 @@
 # global
 import tensorflow as tf
 import logging
+from typing import Optional
 
 # local
 import ivy
+from ivy.func_wrapper import handle_mixed_function
 from ivy.functional.ivy.experimental.sparse_array import (
     _is_data_not_indices_values_and_shape,
     _verify_bsc_components,
@@ -29,6 +31,7 @@ def native_sparse_array(
     values=None,
     dense_shape=None,
     format="coo",
+    validate=True,
 ):
     if _is_data_not_indices_values_and_shape(
         data,
@@ -49,47 +52,49 @@ def native_sparse_array(
     format = format.lower()
 
     if format == "coo":
-        _verify_coo_components(
-            coo_indices,
-            values,
-            dense_shape,
-        )
-        all_coordinates = []
-        for i in range(values.shape[0]):
-            coordinate = ivy.gather(coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
+        if validate:
+            _verify_coo_components(
+                coo_indices,
+                values,
+                dense_shape,
+            )
         return tf.SparseTensor(
-            indices=all_coordinates, values=values, dense_shape=dense_shape
-        )
-    elif format == "csr":
-        _verify_csr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
+            indices=tf.transpose(tf.cast(coo_indices, tf.int64)),
             values=values,
             dense_shape=dense_shape,
         )
+    elif format == "csr":
+        if validate:
+            _verify_csr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "bsr":
-        _verify_bsr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     elif format == "csc":
-        _verify_csc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     else:
-        _verify_bsc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
 
     logging.warning(
         f"Tensorflow does not support {format.upper()} \
@@ -102,3 +107,39 @@ def native_sparse_array_to_indices_values_and_shape(x):
     if isinstance(x, tf.SparseTensor):
         return {"coo_indices": x.indices}, x.values, x.dense_shape
     raise ivy.utils.exceptions.IvyException("not a SparseTensor")
+
+
+def _is_native_coo(x):
+    return x.data is not None and x._format == "coo"
+
+
+@handle_mixed_function(
+    lambda x, y, **kwargs: _is_native_coo(x) and x.data.dtype == y.dtype
+)
+def sparse_matmul(x, y: tf.Tensor, /) -> tf.Tensor:
+    data = tf.sparse.reorder(x.data)
+    if len(y.shape) == 1:
+        return tf.squeeze(
+            tf.sparse.sparse_dense_matmul(data, tf.expand_dims(y, -1)), -1
+        )
+    return tf.sparse.sparse_dense_matmul(data, y)
+
+
+@handle_mixed_function(lambda x, **kwargs: _is_native_coo(x))
+def sparse_sum(x, /, *, axis: Optional[int] = None) -> tf.Tensor:
+    return tf.sparse.reduce_sum(x.data, axis=axis)
+
+
+@handle_mixed_function(
+    lambda x, y, **kwargs: _is_native_coo(x)
+    and _is_native_coo(y)
+    and x.data.dtype == y.data.dtype
+)
+def sparse_add(x, y, /):
+    ret = tf.sparse.reorder(tf.sparse.add(x.data, y.data))
+    return ivy.SparseArray(
+        coo_indices=tf.transpose(ret.indices),
+        values=ret.values,
+        dense_shape=x.dense_shape,
+        format="coo",
+    )
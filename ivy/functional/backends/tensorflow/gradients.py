@@ -10,6 +10,7 @@ from typing import Sequence, Union, Optional, Callable
 import ivy
 from ivy.func_wrapper import outputs_to_ivy_arrays, inputs_to_native_arrays
 from ivy.functional.ivy.gradients import (
+    _checkpoint_array_args,
     _get_required_float_variables,
     _get_y_and_ret_idxs,
     _get_native_y,
@@ -142,6 +143,10 @@ def value_and_grad(func):
     return grad_fn
 
 
+def checkpoint(func: Callable):
+    return _checkpoint_array_args(func, lambda fn, *args: tf.recompute_grad(fn)(*args))
+
+
 def stop_gradient(
     x: Union[tf.Tensor, tf.Variable],
     /,
@@ -1,4 +1,11 @@
+# global
+from typing import Optional
+
+import torch
+
+# local
 import ivy
+from ivy.func_wrapper import handle_mixed_function
 from ivy.functional.ivy.experimental.sparse_array import (
     _verify_bsr_components,
     _verify_bsc_components,
@@ -7,7 +14,6 @@ from ivy.functional.ivy.experimental.sparse_array import (
     _verify_csc_components,
     _is_data_not_indices_values_and_shape,
 )
-import torch
 
 
 def is_native_sparse_array(x):
@@ -31,6 +37,7 @@ def native_sparse_array(
     values=None,
     dense_shape=None,
     format="coo",
+    validate=True,
 ):
     if _is_data_not_indices_values_and_shape(
         data,
@@ -50,19 +57,21 @@ def native_sparse_array(
     format = format.lower()
 
     if format == "coo":
-        _verify_coo_components(
-            indices=coo_indices, values=values, dense_shape=dense_shape
-        )
+        if validate:
+            _verify_coo_components(
+                indices=coo_indices, values=values, dense_shape=dense_shape
+            )
         return torch.sparse_coo_tensor(
             indices=coo_indices, values=values, size=dense_shape
         )
     elif format == "csr":
-        _verify_csr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
         return torch.sparse_csr_tensor(
             crow_indices=crow_indices,
             col_indices=col_indices,
@@ -70,12 +79,13 @@ def native_sparse_array(
             size=dense_shape,
         )
     elif format == "csc":
-        _verify_csc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_csc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
         return torch.sparse_csc_tensor(
             ccol_indices=ccol_indices,
             row_indices=row_indices,
@@ -83,19 +93,21 @@ def native_sparse_array(
             size=dense_shape,
         )
     elif format == "bsc":
-        _verify_bsc_components(
-            ccol_indices=ccol_indices,
-            row_indices=row_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsc_components(
+                ccol_indices=ccol_indices,
+                row_indices=row_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
     else:
-        _verify_bsr_components(
-            crow_indices=crow_indices,
-            col_indices=col_indices,
-            values=values,
-            dense_shape=dense_shape,
-        )
+        if validate:
+            _verify_bsr_components(
+                crow_indices=crow_indices,
+                col_indices=col_indices,
+                values=values,
+                dense_shape=dense_shape,
+            )
 
 
 def native_sparse_array_to_indices_values_and_shape(x):
@@ -115,3 +127,43 @@ def native_sparse_array_to_indices_values_and_shape(x):
             x.size(),
         )
     raise ivy.utils.exceptions.IvyException("not a sparse COO/CSR/CSC/BSC/BSR Tensor")
+
+
+def _is_native_coo(x):
+    return x.data is not None and x._format == "coo"
+
+
+@handle_mixed_function(
+    lambda x, y, **kwargs: x.data is not None
+    and x._format in ["coo", "csr"]
+    and x.data.dtype == y.dtype
+)
+def sparse_matmul(x, y: torch.Tensor, /) -> torch.Tensor:
+    if y.dim() == 1:
+        return torch.mm(x.data, y.unsqueeze(-1)).squeeze(-1)
+    return torch.mm(x.data, y)
+
+
+@handle_mixed_function(lambda x, **kwargs: _is_native_coo(x))
+def sparse_sum(x, /, *, axis: Optional[int] = None) -> torch.Tensor:
+    if axis is None:
+        return torch.sparse.sum(x.data)
+    return torch.sparse.sum(x.data, dim=axis).to_dense()
+
+
+@handle_mixed_function(
+    lambda x, y, **kwargs: _is_native_coo(x)
+    and _is_native_coo(y)
+    and x.data.dtype == y.data.dtype
+)
+def sparse_add(x, y, /):
+    return ivy.SparseArray(data=torch.add(x.data, y.data).coalesce())
+
+
+@handle_mixed_function(
+    lambda x, y, **kwargs: _is_native_coo(x)
+    and _is_native_coo(y)
+    and x.data.dtype == y.data.dtype
+)
+def sparse_multiply(x, y, /):
+    return ivy.SparseArray(data=torch.mul(x.data, y.data).coalesce())
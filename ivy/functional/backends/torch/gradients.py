@@ -2,6 +2,7 @@
 
 # global
 import torch
+import torch.utils.checkpoint
 from typing import Optional, Callable, Sequence, Union
 
 # local
@@ -21,7 +22,7 @@ from ivy.functional.ivy.gradients import (
 
 def variable(x, /):
     if ivy.is_int_dtype(x.dtype):
-        x = ivy.astype(x, ivy.default_float_dtype()).to_native()
+        x = ivy.to_native(ivy.astype(x, ivy.default_float_dtype()))
     if not x.is_leaf:
         return x.detach().requires_grad_()
     return x.clone().requires_grad_()
@@ -163,6 +164,17 @@ def value_and_grad(func):
     return callback_fn
 
 
+def checkpoint(func: Callable):
+    def checkpointed_fn(*args, **kwargs):
+        # the non-reentrant implementation supports keyword and non-tensor arguments,
+        # as well as variables which are only captured by func
+        return torch.utils.checkpoint.checkpoint(
+            func, *args, use_reentrant=False, **kwargs
+        )
+
+    return checkpointed_fn
+
+
 def stop_gradient(
     x: Optional[torch.Tensor],
     /,
@@ -267,7 +267,7 @@ def depthwise_conv2d(
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
     if data_format == "NHWC":
         x = x.permute(0, 3, 1, 2)
-    filters = ivy.squeeze(filters, 3).to_native() if filters.ndim == 4 else filters
+    filters = ivy.to_native(ivy.squeeze(filters, 3)) if filters.ndim == 4 else filters
     filters = torch.unsqueeze(filters, -1)
     dims_in = filters.shape[-2]
     x = _pad_before_conv(x, filters, strides, padding, 2, dilations)
@@ -479,3 +479,71 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@with_unsupported_dtypes(
+    {"1.11.0 and below": ("float16", "bfloat16", "complex")},
+    backend_version,
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+    lengths: Optional[Union[torch.Tensor, Sequence[int]]] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = list(x.shape[:-2])
+    timesteps, input_channels = x.shape[-2:]
+    hidden_channels = recurrent_kernel.shape[0]
+    x = x.reshape(-1, timesteps, input_channels)
+    # states of a single unidirectional layer
+    hx = (
+        init_h.reshape(1, -1, hidden_channels),
+        init_c.reshape(1, -1, hidden_channels),
+    )
+    # torch stores the weights transposed, with the same gate order
+    params = [kernel.t(), recurrent_kernel.t()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            bias if bias is not None else torch.zeros_like(recurrent_bias),
+            recurrent_bias if recurrent_bias is not None else torch.zeros_like(bias),
+        ]
+    if lengths is None:
+        ret, _, c_n = torch.lstm(x, hx, params, has_biases, 1, 0.0, False, False, True)
+    else:
+        packed = torch.nn.utils.rnn.pack_padded_sequence(
+            x,
+            torch.as_tensor(lengths, dtype=torch.int64).reshape(-1).cpu(),
+            batch_first=True,
+            enforce_sorted=False,
+        )
+        hx = tuple(state.index_select(1, packed.sorted_indices) for state in hx)
+        data, _, c_n = torch.lstm(
+            packed.data,
+            packed.batch_sizes,
+            hx,
+            params,
+            has_biases,
+            1,
+            0.0,
+            False,
+            False,
+        )
+        ret, _ = torch.nn.utils.rnn.pad_packed_sequence(
+            torch.nn.utils.rnn.PackedSequence(
+                data, packed.batch_sizes, packed.sorted_indices, packed.unsorted_indices
+            ),
+            batch_first=True,
+            total_length=timesteps,
+        )
+        c_n = c_n.index_select(1, packed.unsorted_indices)
+    return (
+        ret.reshape(batch_shape + [timesteps, hidden_channels]),
+        c_n.reshape(batch_shape + [hidden_channels]),
+    )
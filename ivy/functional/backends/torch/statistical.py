@@ -320,7 +320,7 @@ def einsum(
 ) -> torch.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
     operands = (
-        ivy.astype(operand, torch.float32, copy=False).to_native()
+        ivy.to_native(ivy.astype(operand, torch.float32, copy=False))
         for operand in operands
     )
     return ivy.astype(torch.einsum(equation, *operands), dtype, copy=False)
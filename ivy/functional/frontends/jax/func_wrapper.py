@@ -7,6 +7,11 @@ import inspect
 import ivy
 import ivy.functional.frontends.jax as jax_frontend
 import ivy.functional.frontends.numpy as np_frontend
+from ivy.func_wrapper import _call_with_native_arrays
+
+
+# default dtypes of jax creation functions while jax_enable_x64 is set
+_x64_dtype_context = ivy.FrontendDtypeContext("int64", "float64")
 
 
 def _from_jax_frontend_array_to_ivy_array(x):
@@ -26,7 +31,7 @@ def _from_ivy_array_to_jax_frontend_array(x, nested=False, include_derived=None)
         return ivy.nested_map(
             x, _from_ivy_array_to_jax_frontend_array, include_derived, shallow=False
         )
-    elif isinstance(x, ivy.Array):
+    elif isinstance(x, ivy.Array) or ivy.is_native_array(x):
         return jax_frontend.DeviceArray(x)
     return x
 
@@ -41,7 +46,7 @@ def _from_ivy_array_to_jax_frontend_array_weak_type(
             include_derived,
             shallow=False,
         )
-    elif isinstance(x, ivy.Array):
+    elif isinstance(x, ivy.Array) or ivy.is_native_array(x):
         return jax_frontend.DeviceArray(x, weak_type=True)
     return x
 
@@ -56,9 +61,18 @@ def _to_ivy_array(x):
     return _from_jax_frontend_array_to_ivy_array(_native_to_ivy_array(x))
 
 
+def _to_native_array(x):
+    x = _from_jax_frontend_array_to_ivy_array(x)
+    return x.data if isinstance(x, ivy.Array) else x
+
+
 def inputs_to_ivy_arrays(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _inputs_to_ivy_arrays_jax(*args, **kwargs):
+        if ivy.get_frontend_native_mode():
+            return _call_with_native_arrays(
+                fn, args, kwargs, to_native=_to_native_array
+            )
         # check if kwargs contains an out argument, and if so, remove it
         has_out = False
         out = None
@@ -96,15 +110,16 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
         if jax_frontend.config.jax_enable_x64:
-            ivy.set_default_int_dtype("int64")
-            ivy.set_default_float_dtype("float64")
+            previous = _x64_dtype_context.activate()
             try:
                 ret = fn(*args, **kwargs)
             finally:
-                ivy.unset_default_int_dtype()
-                ivy.unset_default_float_dtype()
+                ivy.FrontendDtypeContext.restore(previous)
         else:
             ret = fn(*args, **kwargs)
+        # nested in a call in frontend native mode, the outer call wraps the result
+        if not ivy.get_array_mode():
+            return ret
         # convert all arrays in the return to `jax_frontend.DeviceArray` instances
         if weak_type:
             return _from_ivy_array_to_jax_frontend_array_weak_type(
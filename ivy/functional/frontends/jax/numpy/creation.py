@@ -115,7 +115,7 @@ def identity(n, dtype=None):
 
 @to_ivy_arrays_and_back
 def ndim(a):
-    if not isinstance(a, ivy.Array):
+    if not ivy.is_array(a):
         return 0
     return ivy.astype(ivy.array(a.ndim), ivy.int64)
 
@@ -202,7 +202,7 @@ def geomspace(start, stop, num=50, endpoint=True, dtype=None, axis=0):
     x[0] = (start * cr) / cr
     if endpoint:
         x[-1] = stop
-    return x.asarray(dtype=dtype)
+    return ivy.asarray(x, dtype=dtype)
 
 
 @to_ivy_arrays_and_back
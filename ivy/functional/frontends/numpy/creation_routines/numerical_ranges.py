@@ -55,7 +55,7 @@ def geomspace(start, stop, num=50, endpoint=True, dtype=None, axis=0):
     x[0] = start
     if endpoint:
         x[-1] = stop
-    return x.asarray(dtype=dtype)
+    return ivy.asarray(x, dtype=dtype)
 
 
 class nd_grid:
@@ -7,6 +7,13 @@ import platform
 # local
 import ivy
 import ivy.functional.frontends.numpy as np_frontend
+from ivy.func_wrapper import _call_with_native_arrays
+
+
+# default dtypes of numpy creation functions, which depend on the platform
+_default_dtype_context = ivy.FrontendDtypeContext(
+    "int32" if platform.system() == "Windows" else "int64", "float64"
+)
 
 
 # Helpers #
@@ -340,6 +347,10 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
         -------
             The return of the function, with ivy arrays passed in the arguments.
         """
+        if ivy.get_frontend_native_mode():
+            if "out" in kwargs:
+                kwargs["out"] = _to_ivy_array(kwargs["out"])
+            return _call_with_native_arrays(fn, args, kwargs)
         # convert all arrays in the inputs to ivy.Array instances
         ivy_args = ivy.nested_map(args, _to_ivy_array, include_derived={tuple: True})
         ivy_kwargs = ivy.nested_map(
@@ -362,33 +373,23 @@ def outputs_to_numpy_arrays(fn: Callable) -> Callable:
         # handle order and call unmodified function
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
-        set_default_dtype = False
-        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and any(
-            [not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args]
-        ):
-            ivy.set_default_int_dtype(
-                "int64"
-            ) if platform.system() != "Windows" else ivy.set_default_int_dtype("int32")
-            ivy.set_default_float_dtype("float64")
-            set_default_dtype = True
-        if contains_order:
-            if len(args) >= (order_pos + 1):
-                order = args[order_pos]
-                args = args[:-1]
-            order = _set_order(args, order)
-            try:
+        set_default_dtype = kwargs.get("dtype") is None and any(
+            not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args
+        )
+        if set_default_dtype:
+            previous = _default_dtype_context.activate()
+        try:
+            if contains_order:
+                if len(args) >= (order_pos + 1):
+                    order = args[order_pos]
+                    args = args[:-1]
+                order = _set_order(args, order)
                 ret = fn(*args, order=order, **kwargs)
-            finally:
-                if set_default_dtype:
-                    ivy.unset_default_int_dtype()
-                    ivy.unset_default_float_dtype()
-        else:
-            try:
+            else:
                 ret = fn(*args, **kwargs)
-            finally:
-                if set_default_dtype:
-                    ivy.unset_default_int_dtype()
-                    ivy.unset_default_float_dtype()
+        finally:
+            if set_default_dtype:
+                ivy.FrontendDtypeContext.restore(previous)
         if not ivy.get_array_mode():
             return ret
         # convert all returned arrays to `ndarray` instances
@@ -49,7 +49,7 @@ def amin(
     where_mask = None
     if initial is not None:
         if ivy.is_array(where):
-            a = ivy.where(where, a, a.full_like(initial))
+            a = ivy.where(where, a, ivy.full_like(a, initial))
             where_mask = ivy.all(ivy.logical_not(where), axis=axis, keepdims=keepdims)
         s = ivy.shape(a, as_array=True)
         if axis is not None:
@@ -91,7 +91,7 @@ def amax(
     where_mask = None
     if initial is not None:
         if ivy.is_array(where):
-            a = ivy.where(where, a, a.full_like(initial))
+            a = ivy.where(where, a, ivy.full_like(a, initial))
             where_mask = ivy.all(ivy.logical_not(where), axis=axis, keepdims=keepdims)
         s = ivy.shape(a, as_array=True)
         if axis is not None:
@@ -129,11 +129,11 @@ def nanmin(
 ):
     out_dtype = ivy.dtype(a)
     nan_mask = ivy.isnan(a)
-    a = ivy.where(ivy.logical_not(nan_mask), a, a.full_like(+ivy.inf))
+    a = ivy.where(ivy.logical_not(nan_mask), a, ivy.full_like(a, +ivy.inf))
     where_mask = None
     if initial is not None:
         if ivy.is_array(where):
-            a = ivy.where(where, a, a.full_like(initial))
+            a = ivy.where(where, a, ivy.full_like(a, initial))
             where_mask = ivy.all(ivy.logical_not(where), axis=axis, keepdims=keepdims)
         s = ivy.shape(a, as_array=True)
         if axis is not None:
@@ -203,11 +203,11 @@ def nanmax(
 ):
     out_dtype = ivy.dtype(a)
     nan_mask = ivy.isnan(a)
-    a = ivy.where(ivy.logical_not(nan_mask), a, a.full_like(-ivy.inf))
+    a = ivy.where(ivy.logical_not(nan_mask), a, ivy.full_like(a, -ivy.inf))
     where_mask = None
     if initial is not None:
         if ivy.is_array(where):
-            a = ivy.where(where, a, a.full_like(initial))
+            a = ivy.where(where, a, ivy.full_like(a, initial))
             where_mask = ivy.all(ivy.logical_not(where), axis=axis, keepdims=keepdims)
         s = ivy.shape(a, as_array=True)
         if axis is not None:
@@ -3,7 +3,12 @@ import inspect
 from math import inf
 
 # local
+import ivy
 import ivy.functional.frontends.numpy as np_frontend
+from ivy.functional.frontends.numpy.func_wrapper import (
+    inputs_to_ivy_arrays,
+    to_ivy_arrays_and_back,
+)
 
 # constants #
 # --------#
@@ -199,6 +204,70 @@ identities = {
 }
 
 
+# ivy reductions, cumulative functions and scatter reductions which the methods of
+# these ufuncs map onto directly
+reductions = {
+    "add": "sum",
+    "multiply": "prod",
+    "maximum": "max",
+    "minimum": "min",
+    "logical_and": "all",
+    "logical_or": "any",
+}
+
+cumulative_functions = {
+    "add": "cumsum",
+    "multiply": "cumprod",
+}
+
+scatter_reductions = {
+    "add": "sum",
+    "maximum": "max",
+    "minimum": "min",
+}
+
+# ufuncs which can be applied in any order, such that they are reduced as trees and
+# accumulated as parallel scans rather than one element at a time
+associative_ufuncs = [
+    "add",
+    "multiply",
+    "maximum",
+    "minimum",
+    "fmax",
+    "fmin",
+    "logical_and",
+    "logical_or",
+    "logical_xor",
+    "bitwise_and",
+    "bitwise_or",
+    "bitwise_xor",
+    "logaddexp",
+    "logaddexp2",
+    "gcd",
+    "lcm",
+    "hypot",
+]
+
+# ufuncs whose successive applications to an array combine the other operands with
+# an associative ufunc, such that a - b - c = a - (b + c)
+inverse_ufuncs = {
+    "subtract": "add",
+    "divide": "multiply",
+}
+
+# operands which leave the first operand unchanged
+right_identities = {
+    **{name: identity for name, identity in identities.items() if identity is not None},
+    "subtract": 0,
+    "divide": 1,
+    "floor_divide": 1,
+    "power": 1,
+    "float_power": 1,
+    "left_shift": 0,
+    "right_shift": 0,
+}
+
+
 # Class #
 # ----- #
 
@@ -256,25 +325,227 @@ class ufunc:
     def identity(self):
         return identities[self.__name__]
 
+    # Helpers #
+    # --------#
+
+    def _apply(self, *args, **kwargs):
+        ret = self.func(*args, **kwargs)
+        return ivy.array(ret.ivy_array if hasattr(ret, "ivy_array") else ret)
+
+    def _inverse(self):
+        return getattr(np_frontend, inverse_ufuncs[self.__name__])
+
+    def _reduce_first_axis(self, x):
+        """Reduce x along its first axis, which is not empty."""
+        if self.__name__ in reductions:
+            return getattr(ivy, reductions[self.__name__])(x, axis=0)
+        if self.__name__ in inverse_ufuncs:
+            if x.shape[0] == 1:
+                return x[0]
+            return self._apply(x[0], self._inverse()._reduce_first_axis(x[1:]))
+        if self.__name__ in associative_ufuncs:
+            # adjacent pairs are combined, halving the length at every step
+            while x.shape[0] > 1:
+                even = x.shape[0] - x.shape[0] % 2
+                pairs = self._apply(x[0:even:2], x[1:even:2])
+                x = ivy.concat([pairs, x[even:]]) if even < x.shape[0] else pairs
+            return x[0]
+        ret = x[0]
+        for i in range(1, x.shape[0]):
+            ret = self._apply(ret, x[i])
+        return ret
+
+    def _accumulate_first_axis(self, x):
+        if self.__name__ in cumulative_functions:
+            return getattr(ivy, cumulative_functions[self.__name__])(x, axis=0)
+        if self.__name__ in inverse_ufuncs:
+            if x.shape[0] < 2:
+                return x
+            rest = self._inverse()._accumulate_first_axis(x[1:])
+            return ivy.concat([x[:1], self._apply(x[:1], rest)])
+        if self.__name__ in associative_ufuncs:
+            # parallel prefix scan, combining each element with the one shift before
+            shift = 1
+            while shift < x.shape[0]:
+                x = ivy.concat([x[:shift], self._apply(x[:-shift], x[shift:])])
+                shift *= 2
+            return x
+        ret = [x[0]]
+        for i in range(1, x.shape[0]):
+            ret.append(self._apply(ret[-1], x[i]))
+        return ivy.stack(ret)
+
+    def _reduce_segments(self, x, starts, lengths):
+        """Reduce the segments x[starts[i] : starts[i] + lengths[i]] along the first
+        axis, where every length is at least one."""
+        num_segments = starts.shape[0]
+        segment_ids = ivy.repeat(ivy.arange(num_segments, dtype="int64"), lengths)
+        if self.__name__ in scatter_reductions:
+            # every element of every segment is scattered onto its segment
+            offsets = ivy.cumsum(lengths) - lengths
+            positions = ivy.arange(segment_ids.shape[0], dtype="int64") + ivy.gather(
+                starts - offsets, segment_ids
+            )
+            return ivy.scatter_nd(
+                ivy.expand_dims(segment_ids, axis=-1),
+                ivy.gather(x, positions, axis=0),
+                shape=(num_segments,) + tuple(x.shape[1:]),
+                reduction=scatter_reductions[self.__name__],
+            )
+        # the segments are padded to the longest one, along a new second axis
+        max_length = int(ivy.max(lengths))
+        steps = ivy.arange(max_length, dtype="int64")
+        positions = ivy.minimum(
+            ivy.expand_dims(starts, axis=-1) + steps, ivy.array(x.shape[0] - 1)
+        )
+        padded = ivy.gather(x, positions, axis=0)
+        valid = ivy.reshape(
+            ivy.expand_dims(steps, axis=0) < ivy.expand_dims(lengths, axis=-1),
+            (num_segments, max_length) + (1,) * (len(x.shape) - 1),
+        )
+        if self.__name__ in right_identities:
+            padded = ivy.where(
+                valid,
+                padded,
+                ivy.array(right_identities[self.__name__], dtype=padded.dtype),
+            )
+            return self._reduce_first_axis(ivy.moveaxis(padded, 1, 0))
+        ret = padded[:, 0]
+        for step in range(1, max_length):
+            ret = ivy.where(valid[:, step], self._apply(ret, padded[:, step]), ret)
+        return ret
+
     # Methods #
     # ---------#
 
     def __call__(self, *args, **kwargs):
         return self.func(*args, **kwargs)
 
+    @to_ivy_arrays_and_back
     def reduce(
-        array, axis=0, dtype=None, out=None, keepdims=False, initial=None, where=True
+        self,
+        array,
+        axis=0,
+        dtype=None,
+        out=None,
+        keepdims=False,
+        initial=None,
+        where=True,
     ):
-        pass
+        x = ivy.array(array, dtype=dtype)
+        ndim = len(x.shape)
+        if axis is None:
+            axis = tuple(range(ndim))
+        axis = sorted(a % ndim for a in ((axis,) if isinstance(axis, int) else axis))
+        if where is not True:
+            fill = ivy.default(initial, self.identity)
+            if fill is None:
+                raise ivy.utils.exceptions.IvyException(
+                    "reduction operation '{}' does not have an identity, so to use a "
+                    "where mask one has to specify 'initial'".format(self.__name__)
+                )
+            x = ivy.where(where, x, ivy.full_like(x, fill))
+        # the reduced axes are flattened into a single leading axis
+        rest = [x.shape[i] for i in range(ndim) if i not in axis]
+        x = ivy.reshape(
+            ivy.permute_dims(x, axes=axis + [i for i in range(ndim) if i not in axis]),
+            [-1] + rest,
+        )
+        if initial is not None:
+            x = ivy.concat([ivy.full([1] + rest, initial, dtype=x.dtype), x])
+        if x.shape[0] == 0:
+            if self.identity is None:
+                raise ivy.utils.exceptions.IvyException(
+                    "zero-size array to reduction operation {} which has no "
+                    "identity".format(self.__name__)
+                )
+            ret = ivy.full(rest, self.identity, dtype=x.dtype)
+        else:
+            ret = self._reduce_first_axis(x)
+        if keepdims:
+            ret = ivy.expand_dims(ret, axis=axis)
+        if ivy.exists(out):
+            return ivy.inplace_update(out, ret)
+        return ret
 
-    def accumulate(array, axis=0, dtype=None, out=None):
-        pass
+    @to_ivy_arrays_and_back
+    def accumulate(self, array, axis=0, dtype=None, out=None):
+        x = ivy.moveaxis(ivy.array(array, dtype=dtype), axis, 0)
+        ret = ivy.moveaxis(self._accumulate_first_axis(x), 0, axis)
+        if ivy.exists(out):
+            return ivy.inplace_update(out, ret)
+        return ret
 
-    def reduceat(array, indices, axis=0, dtype=None, out=None):
-        pass
+    @to_ivy_arrays_and_back
+    def reduceat(self, array, indices, axis=0, dtype=None, out=None):
+        x = ivy.moveaxis(ivy.array(array, dtype=dtype), axis, 0)
+        starts = ivy.array(indices, dtype="int64")
+        ends = ivy.concat([starts[1:], ivy.array([x.shape[0]], dtype="int64")])
+        # as for numpy, a start which is not before the next one gives x[start] alone
+        lengths = ivy.where(ends > starts, ends - starts, ivy.ones_like(starts))
+        ret = ivy.moveaxis(self._reduce_segments(x, starts, lengths), 0, axis)
+        if ivy.exists(out):
+            return ivy.inplace_update(out, ret)
+        return ret
 
-    def outer(A, B, /, **kwargs):
-        pass
+    @to_ivy_arrays_and_back
+    def outer(self, A, B, /, **kwargs):
+        A, B = ivy.array(A), ivy.array(B)
+        # every element of A is broadcast against the whole of B
+        A = ivy.reshape(A, tuple(A.shape) + (1,) * len(B.shape))
+        return self._apply(A, B, **kwargs)
 
-    def at(a, indices, b=None, /):
-        pass
+    @inputs_to_ivy_arrays
+    def at(self, a, indices, b=None, /):
+        flat = ivy.reshape(a, (-1,))
+        positions = ivy.reshape(
+            ivy.reshape(ivy.arange(flat.shape[0], dtype="int64"), a.shape)[indices],
+            (-1,),
+        )
+        if b is not None:
+            b = ivy.reshape(
+                ivy.broadcast_to(ivy.array(b, dtype=a.dtype), positions.shape), (-1,)
+            )
+        if b is not None and self.__name__ in scatter_reductions:
+            ret = ivy.scatter_nd(
+                ivy.expand_dims(positions, axis=-1),
+                b,
+                reduction=scatter_reductions[self.__name__],
+                out=ivy.copy_array(flat),
+            )
+            ivy.inplace_update(a, ivy.reshape(ret, a.shape), keep_input_dtype=True)
+            return
+        # the repeated positions are grouped, keeping the order of their operands
+        unique_positions, inverse = ivy.unique_inverse(positions)
+        counts = ivy.bincount(inverse, minlength=unique_positions.shape[0])
+        values = ivy.gather(flat, unique_positions)
+        if b is None:
+            for step in range(int(ivy.max(counts))):
+                values = ivy.where(step < counts, self._apply(values), values)
+        elif self.__name__ in inverse_ufuncs or self.__name__ in associative_ufuncs:
+            # the operands of each position are combined first, then applied once
+            combine = self._inverse() if self.__name__ in inverse_ufuncs else self
+            operands = combine._reduce_segments(
+                ivy.gather(b, ivy.argsort(inverse, stable=True)),
+                ivy.cumsum(counts) - counts,
+                counts,
+            )
+            values = self._apply(values, operands)
+        else:
+            # each position is folded over its value in a, then its operands in order
+            order = ivy.argsort(
+                ivy.concat([ivy.arange(values.shape[0], dtype="int64"), inverse]),
+                stable=True,
+            )
+            values = self._reduce_segments(
+                ivy.gather(ivy.concat([values, b]), order),
+                ivy.cumsum(counts + 1) - counts - 1,
+                counts + 1,
+            )
+        ret = ivy.scatter_nd(
+            ivy.expand_dims(unique_positions, axis=-1),
+            values,
+            reduction="replace",
+            out=ivy.copy_array(flat),
+        )
+        ivy.inplace_update(a, ivy.reshape(ret, a.shape), keep_input_dtype=True)
@@ -7,6 +7,7 @@ import functools
 # local
 import ivy
 import ivy.functional.frontends.tensorflow as frontend
+from ivy.func_wrapper import _call_with_native_arrays
 
 
 def to_ivy_dtype(dtype):
@@ -85,6 +86,8 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
         -------
             The return of the function, with ivy arrays passed in the arguments.
         """
+        if ivy.get_frontend_native_mode():
+            return _call_with_native_arrays(fn, args, kwargs)
         has_out = False
         out = None
         if "out" in kwargs:
@@ -128,6 +131,9 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         """
         # call unmodified function
         ret = fn(*args, **kwargs)
+        # nested in a call in frontend native mode, the outer call wraps the result
+        if not ivy.get_array_mode():
+            return ret
 
         # convert all arrays in the return to `frontend.Tensorflow.tensor` instances
         return ivy.nested_map(
@@ -113,7 +113,7 @@ def inverse(input, *, out=None):
 
 @to_ivy_arrays_and_back
 def logdet(input):
-    return ivy.det(input).log()
+    return ivy.log(ivy.det(input))
 
 
 @to_ivy_arrays_and_back
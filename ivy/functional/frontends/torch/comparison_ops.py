@@ -179,8 +179,8 @@ ne = not_equal
 @with_unsupported_dtypes({"1.11.0 and below": ("float16", "bfloat16")}, "torch")
 @to_ivy_arrays_and_back
 def isin(elements, test_elements, *, assume_unique=False, invert=False):
-    input_elements_copy = ivy.reshape(ivy.to_ivy(elements), (-1,))
-    test_elements_copy = ivy.reshape(ivy.to_ivy(test_elements), (-1,))
+    input_elements_copy = ivy.reshape(elements, (-1,))
+    test_elements_copy = ivy.reshape(test_elements, (-1,))
 
     if (
         ivy.shape(test_elements_copy)[0]
@@ -25,6 +25,8 @@ def promote_types(type1, type2, /):
 
 
 _default_dtype = torch_frontend.float32
+# default dtypes of torch creation functions, resolved once per default float dtype
+_default_dtype_context = ivy.FrontendDtypeContext("int64", _default_dtype)
 
 
 def set_default_dtype(d):
@@ -38,8 +40,9 @@ def set_default_dtype(d):
         ],
         message="only floating-point types are supported as the default type",
     )
-    global _default_dtype
+    global _default_dtype, _default_dtype_context
     _default_dtype = d
+    _default_dtype_context = ivy.FrontendDtypeContext("int64", d)
     return
 
 
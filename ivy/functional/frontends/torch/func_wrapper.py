@@ -5,6 +5,7 @@ from typing import Callable
 # local
 import ivy
 import ivy.functional.frontends.torch as torch_frontend
+from ivy.func_wrapper import _call_with_native_arrays
 
 
 def _from_ivy_array_to_torch_frontend_tensor(x, nested=False, include_derived=None):
@@ -46,6 +47,12 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
             raise ivy.utils.exceptions.IvyException(
                 "Out argument must be an ivy.frontends.torch.Tensor object"
             )
+        if ivy.get_frontend_native_mode():
+            if "out" in kwargs:
+                kwargs["out"] = ivy.nested_map(
+                    kwargs["out"], _to_ivy_array, include_derived={tuple: True}
+                )
+            return _call_with_native_arrays(fn, args, kwargs)
         # convert all input arrays to ivy.Array instances
         new_args = ivy.nested_map(
             args, _to_ivy_array, include_derived={tuple: True}, shallow=False
@@ -68,19 +75,19 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         # call unmodified function
         # ToDo: Remove this default dtype setting
         #  once frontend specific backend setting is added
-        set_default_dtype = False
-        if not ("dtype" in kwargs and ivy.exists(kwargs["dtype"])) and all(
-            [not (ivy.is_array(i) or hasattr(i, "ivy_array")) for i in args]
+        if kwargs.get("dtype") is None and not any(
+            ivy.is_array(i) or hasattr(i, "ivy_array") for i in args
         ):
-            ivy.set_default_int_dtype("int64")
-            ivy.set_default_float_dtype(torch_frontend.get_default_dtype())
-            set_default_dtype = True
-        try:
+            previous = torch_frontend.dtype._default_dtype_context.activate()
+            try:
+                ret = fn(*args, **kwargs)
+            finally:
+                ivy.FrontendDtypeContext.restore(previous)
+        else:
             ret = fn(*args, **kwargs)
-        finally:
-            if set_default_dtype:
-                ivy.unset_default_int_dtype()
-                ivy.unset_default_float_dtype()
+        # nested in a call in frontend native mode, the outer call wraps the result
+        if not ivy.get_array_mode():
+            return ret
         # convert all arrays in the return to `torch_frontend.Tensor` instances
         return _from_ivy_array_to_torch_frontend_tensor(
             ret, nested=True, include_derived={tuple: True}
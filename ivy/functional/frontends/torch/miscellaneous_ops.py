@@ -52,7 +52,7 @@ def meshgrid(*tensors, indexing=None):
     "torch",
 )
 def cumsum(input, dim, *, dtype=None, out=None):
-    if not dtype and "int" in input.dtype:
+    if not dtype and "int" in ivy.dtype(input):
         dtype = ivy.int64
     return ivy.cumsum(input, axis=dim, dtype=dtype, out=out)
 
@@ -60,9 +60,9 @@ def cumsum(input, dim, *, dtype=None, out=None):
 @to_ivy_arrays_and_back
 @with_unsupported_dtypes({"1.11.0 and below": ("float16", "bfloat16")}, "torch")
 def trace(input):
-    if "int" in input.dtype:
-        input = input.astype("int64")
-    target_type = "int64" if "int" in input.dtype else input.dtype
+    if "int" in ivy.dtype(input):
+        input = ivy.astype(input, "int64")
+    target_type = "int64" if "int" in ivy.dtype(input) else ivy.dtype(input)
     return ivy.astype(ivy.trace(input), target_type)
 
 
@@ -77,7 +77,7 @@ def tril_indices(row, col, offset=0, *, dtype=ivy.int64, device="cpu", layout=No
 
 @to_ivy_arrays_and_back
 def cumprod(input, dim, *, dtype=None, out=None):
-    if not dtype and "int" in input.dtype:
+    if not dtype and "int" in ivy.dtype(input):
         dtype = ivy.int64
     return ivy.cumprod(input, axis=dim, dtype=dtype, out=out)
 
@@ -112,9 +112,9 @@ def std(input, dim, unbiased, keepdim=False, *, out=None):
 # TODO: the original torch.prod places * right before `dtype`
 def prod(input, dim, *, keepdim=False, dtype=None):
     if not dtype:
-        if "int" in input.dtype:
+        if "int" in ivy.dtype(input):
             dtype = ivy.int64
-        elif "float" in input.dtype:
+        elif "float" in ivy.dtype(input):
             dtype = ivy.float32
     return ivy.prod(input, axis=dim, dtype=dtype, keepdims=keepdim)
 
@@ -477,7 +477,9 @@ class Tensor:
             else:
                 size = args
 
-        return torch_frontend.tensor(ivy.expand(self, tuple(size)))
+        return torch_frontend.Tensor(
+            ivy.expand(self.ivy_array, tuple(size)), _init_overload=True
+        )
 
     def expand_as(self, other):
         return self.expand(
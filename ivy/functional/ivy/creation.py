@@ -101,7 +101,9 @@ def asarray_to_native_arrays_and_back(fn: Callable) -> Callable:
         new_args = (new_arg,) + args[1:]
         if dtype is not None:
             dtype = ivy.default_dtype(dtype=dtype, as_native=True)
-        return to_ivy(fn(*new_args, dtype=dtype, **kwargs))
+        ret = fn(*new_args, dtype=dtype, **kwargs)
+        # with array mode off, the native array is returned as with other functions
+        return to_ivy(ret) if ivy.get_array_mode() else ret
 
     return _asarray_to_native_arrays_and_back
 
@@ -776,6 +776,8 @@ default_float_dtype_stack = list()
 default_int_dtype_stack = list()
 default_uint_dtype_stack = list()
 default_complex_dtype_stack = list()
+# the frontend dtype context of the running frontend function, if any
+_frontend_dtype_context = None
 
 
 class DefaultDtype:
@@ -868,6 +870,38 @@ class DefaultComplexDtype:
         return self
 
 
+class FrontendDtypeContext:
+    """
+    Default int and float dtypes of a frontend, resolved once when the context is
+    created.
+
+    While the context is active, its dtypes take precedence over the default dtype
+    stacks without being pushed to them, so that a frontend function only swaps the
+    active context on every call.
+    """
+
+    def __init__(self, int_dtype: ivy.Dtype, float_dtype: ivy.Dtype):
+        self.int_dtype = ivy.IntDtype(int_dtype)
+        self.float_dtype = ivy.FloatDtype(float_dtype)
+        self._needs_x64 = "64" in self.int_dtype or "64" in self.float_dtype
+
+    def activate(self):
+        """Make this the active context, and return the context it replaces."""
+        global _frontend_dtype_context
+        if self._needs_x64 and ivy.backend == "jax":
+            ivy.utils.assertions._check_jax_x64_flag(self.int_dtype)
+            ivy.utils.assertions._check_jax_x64_flag(self.float_dtype)
+        previous = _frontend_dtype_context
+        _frontend_dtype_context = self
+        return previous
+
+    @staticmethod
+    def restore(previous):
+        """Make ``previous``, as returned by ``activate``, the active context."""
+        global _frontend_dtype_context
+        _frontend_dtype_context = previous
+
+
 @handle_exceptions
 def dtype_bits(dtype_in: Union[ivy.Dtype, ivy.NativeDtype, str], /) -> int:
     """Get the number of bits used for representing the input data type.
@@ -946,6 +980,24 @@ def _check_float64(input) -> bool:
     return False
 
 
+def _global_default_float_dtype():
+    if _frontend_dtype_context is not None:
+        return _frontend_dtype_context.float_dtype
+    if default_float_dtype_stack:
+        return default_float_dtype_stack[-1]
+    def_dtype = default_dtype()
+    return def_dtype if ivy.is_float_dtype(def_dtype) else "float32"
+
+
+def _global_default_int_dtype():
+    if _frontend_dtype_context is not None:
+        return _frontend_dtype_context.int_dtype
+    if default_int_dtype_stack:
+        return default_int_dtype_stack[-1]
+    def_dtype = ivy.default_dtype()
+    return def_dtype if ivy.is_int_dtype(def_dtype) else "int32"
+
+
 def _check_complex128(input) -> bool:
     if ivy.is_array(input):
         return ivy.dtype(input) == "complex128"
@@ -1040,7 +1092,6 @@ def default_float_dtype(
     >>> ivy.default_float_dtype(input=x)
     'float16'
     """
-    global default_float_dtype_stack
     if ivy.exists(float_dtype):
         if as_native is True:
             return ivy.as_native_dtype(float_dtype)
@@ -1057,35 +1108,14 @@ def default_float_dtype(
             ):
                 ret = ivy.float64
             else:
-                if not default_float_dtype_stack:
-                    def_dtype = default_dtype()
-                    if ivy.is_float_dtype(def_dtype):
-                        ret = def_dtype
-                    else:
-                        ret = "float32"
-                else:
-                    ret = default_float_dtype_stack[-1]
+                ret = _global_default_float_dtype()
         elif isinstance(input, Number):
             if _check_float64(input):
                 ret = ivy.float64
             else:
-                if not default_float_dtype_stack:
-                    def_dtype = default_dtype()
-                    if ivy.is_float_dtype(def_dtype):
-                        ret = def_dtype
-                    else:
-                        ret = "float32"
-                else:
-                    ret = default_float_dtype_stack[-1]
+                ret = _global_default_float_dtype()
     else:
-        if not default_float_dtype_stack:
-            def_dtype = default_dtype()
-            if ivy.is_float_dtype(def_dtype):
-                ret = def_dtype
-            else:
-                ret = "float32"
-        else:
-            ret = default_float_dtype_stack[-1]
+        ret = _global_default_float_dtype()
     if as_native:
         return ivy.as_native_dtype(ret)
     return ivy.FloatDtype(ivy.as_ivy_dtype(ret))
@@ -1187,7 +1217,9 @@ def default_dtype(
     global default_dtype_stack
     if not default_dtype_stack:
         global default_float_dtype_stack
-        if default_float_dtype_stack:
+        if _frontend_dtype_context is not None:
+            ret = _frontend_dtype_context.float_dtype
+        elif default_float_dtype_stack:
             ret = default_float_dtype_stack[-1]
         else:
             ret = "float32"
@@ -1238,7 +1270,6 @@ def default_int_dtype(
     >>> ivy.default_int_dtype(input=x)
     'int32'
     """
-    global default_int_dtype_stack
     if ivy.exists(int_dtype):
         if as_native is True:
             return ivy.as_native_dtype(int_dtype)
@@ -1267,14 +1298,7 @@ def default_int_dtype(
             ):
                 ret = ivy.int64
             else:
-                if not default_int_dtype_stack:
-                    def_dtype = ivy.default_dtype()
-                    if ivy.is_int_dtype(def_dtype):
-                        ret = def_dtype
-                    else:
-                        ret = "int32"
-                else:
-                    ret = default_int_dtype_stack[-1]
+                ret = _global_default_int_dtype()
         elif isinstance(input, Number):
             if (
                 input > 9223372036854775807
@@ -1285,23 +1309,9 @@ def default_int_dtype(
             elif input > 2147483647 and input != ivy.inf:
                 ret = ivy.int64
             else:
-                if not default_int_dtype_stack:
-                    def_dtype = ivy.default_dtype()
-                    if ivy.is_int_dtype(def_dtype):
-                        ret = def_dtype
-                    else:
-                        ret = "int32"
-                else:
-                    ret = default_int_dtype_stack[-1]
+                ret = _global_default_int_dtype()
     else:
-        if not default_int_dtype_stack:
-            def_dtype = ivy.default_dtype()
-            if ivy.is_int_dtype(def_dtype):
-                ret = def_dtype
-            else:
-                ret = "int32"
-        else:
-            ret = default_int_dtype_stack[-1]
+        ret = _global_default_int_dtype()
     if as_native:
         return ivy.as_native_dtype(ret)
     return ivy.IntDtype(ivy.as_ivy_dtype(ret))
@@ -1,3 +1,6 @@
+# global
+from typing import Optional, Union
+
 # local
 import ivy
 from ivy.func_wrapper import inputs_to_native_arrays
@@ -327,6 +330,166 @@ def _is_valid_format(
     )
 
 
+def _sparse_coordinates(x):
+    """Get the row and column of every stored value of a sparse array, along with the
+    values, all flattened, in the order in which the values are stored. These are
+    cached on the sparse array, as every format conversion and operation starts from
+    them."""
+    if x._coordinates is None:
+        x._coordinates = _expand_coordinates(x)
+    return x._coordinates
+
+
+def _expand_coordinates(x):
+    format = x._format
+    if format == "coo":
+        return x.coo_indices[0], x.coo_indices[1], x.values
+    if format.endswith("r"):
+        compressed, indices = x.crow_indices, x.col_indices
+    else:
+        compressed, indices = x.ccol_indices, x.row_indices
+    expanded = ivy.repeat(
+        ivy.arange(compressed.shape[0] - 1, dtype="int64", device=ivy.dev(indices)),
+        compressed[1:] - compressed[:-1],
+    )
+    rows, cols = (expanded, indices) if format.endswith("r") else (indices, expanded)
+    if format in ["csr", "csc"]:
+        return rows, cols, x.values
+    # the coordinates of each block are expanded to those of its elements
+    nblockrows, nblockcols = x.values.shape[-2:]
+    rows = ivy.reshape(rows, (-1, 1, 1)) * nblockrows + ivy.reshape(
+        ivy.arange(nblockrows, dtype="int64", device=ivy.dev(rows)), (1, -1, 1)
+    )
+    cols = ivy.reshape(cols, (-1, 1, 1)) * nblockcols + ivy.reshape(
+        ivy.arange(nblockcols, dtype="int64", device=ivy.dev(cols)), (1, 1, -1)
+    )
+    return (
+        ivy.flatten(ivy.broadcast_to(rows, x.values.shape)),
+        ivy.flatten(ivy.broadcast_to(cols, x.values.shape)),
+        ivy.flatten(x.values),
+    )
+
+
+def _coalesce_coordinates(rows, cols, values, dense_shape):
+    """Sum the values of repeated coordinates, and sort the coordinates row by row."""
+    ids = rows * dense_shape[1] + cols
+    unique_ids, inverse = ivy.unique_inverse(ids)
+    values = ivy.scatter_nd(
+        ivy.expand_dims(inverse, axis=-1),
+        values,
+        shape=(unique_ids.shape[0],),
+        reduction="sum",
+    )
+    return unique_ids // dense_shape[1], unique_ids % dense_shape[1], values
+
+
+def _sparse_array_from_coordinates(rows, cols, values, dense_shape, format):
+    """Build a COO, CSR or CSC sparse array from coalesced coordinates, sorted row by
+    row."""
+    if format == "coo":
+        ret = ivy.SparseArray(
+            coo_indices=ivy.stack([rows, cols]),
+            values=values,
+            dense_shape=dense_shape,
+            format=format,
+            validate=False,
+        )
+        ret._coordinates = (rows, cols, ret.values)
+        return ret
+    if format == "csc":
+        order = ivy.argsort(cols * dense_shape[0] + rows)
+        rows, cols, values = rows[order], cols[order], values[order]
+        compressed, indices = cols, rows
+    else:
+        compressed, indices = rows, cols
+    num_compressed = dense_shape[0 if format == "csr" else 1]
+    compressed = ivy.concat(
+        [
+            ivy.zeros((1,), dtype="int64", device=ivy.dev(indices)),
+            ivy.cumsum(ivy.bincount(compressed, minlength=num_compressed)),
+        ]
+    )
+    if format == "csr":
+        ret = ivy.SparseArray(
+            crow_indices=compressed,
+            col_indices=indices,
+            values=values,
+            dense_shape=dense_shape,
+            format=format,
+            validate=False,
+        )
+    else:
+        ret = ivy.SparseArray(
+            ccol_indices=compressed,
+            row_indices=indices,
+            values=values,
+            dense_shape=dense_shape,
+            format=format,
+            validate=False,
+        )
+    # the coordinates are already in the order of the values, so they are kept
+    ret._coordinates = (rows, cols, ret.values)
+    return ret
+
+
+def _block_sparse_array_from_coordinates(
+    rows, cols, values, dense_shape, format, blocksize
+):
+    """Build a BSR or BSC sparse array from coalesced coordinates, storing every block
+    which holds at least one of them."""
+    block_rows, block_cols = blocksize
+    ivy.utils.assertions.check_true(
+        dense_shape[0] % block_rows == 0 and dense_shape[1] % block_cols == 0,
+        message="the shape of the array must be divisible by the blocksize",
+    )
+    num_block_rows = dense_shape[0] // block_rows
+    num_block_cols = dense_shape[1] // block_cols
+    # blocks are ordered row by row for BSR, and column by column for BSC
+    if format == "bsr":
+        block_ids = (rows // block_rows) * num_block_cols + cols // block_cols
+        num_compressed, num_indices = num_block_rows, num_block_cols
+    else:
+        block_ids = (cols // block_cols) * num_block_rows + rows // block_rows
+        num_compressed, num_indices = num_block_cols, num_block_rows
+    unique_ids, inverse = ivy.unique_inverse(block_ids)
+    num_blocks = unique_ids.shape[0]
+    offsets = (rows % block_rows) * block_cols + cols % block_cols
+    values = ivy.reshape(
+        ivy.scatter_nd(
+            ivy.expand_dims(inverse * block_rows * block_cols + offsets, axis=-1),
+            values,
+            shape=(num_blocks * block_rows * block_cols,),
+        ),
+        (num_blocks, block_rows, block_cols),
+    )
+    compressed = ivy.concat(
+        [
+            ivy.zeros((1,), dtype="int64", device=ivy.dev(unique_ids)),
+            ivy.cumsum(
+                ivy.bincount(unique_ids // num_indices, minlength=num_compressed)
+            ),
+        ]
+    )
+    indices = unique_ids % num_indices
+    if format == "bsr":
+        return ivy.SparseArray(
+            crow_indices=compressed,
+            col_indices=indices,
+            values=values,
+            dense_shape=dense_shape,
+            format=format,
+            validate=False,
+        )
+    return ivy.SparseArray(
+        ccol_indices=compressed,
+        row_indices=indices,
+        values=values,
+        dense_shape=dense_shape,
+        format=format,
+        validate=False,
+    )
+
+
 class SparseArray:
     def __init__(
         self,
@@ -340,7 +503,10 @@ class SparseArray:
         values=None,
         dense_shape=None,
         format=None,
+        validate=True,
     ):
+        # the expanded coordinates of the values, built on first use
+        self._coordinates = None
         if _is_data_not_indices_values_and_shape(
             data,
             coo_indices,
@@ -365,15 +531,17 @@ class SparseArray:
             format = format.lower()
 
             if format == "coo":
-                self._init_coo_components(coo_indices, values, dense_shape, format)
+                self._init_coo_components(
+                    coo_indices, values, dense_shape, format, validate
+                )
             elif format == "csr" or format == "bsr":
                 self._init_compressed_row_components(
-                    crow_indices, col_indices, values, dense_shape, format
+                    crow_indices, col_indices, values, dense_shape, format, validate
                 )
             else:
                 print(format)
                 self._init_compressed_column_components(
-                    ccol_indices, row_indices, values, dense_shape, format
+                    ccol_indices, row_indices, values, dense_shape, format, validate
                 )
 
         else:
@@ -399,6 +567,7 @@ class SparseArray:
             )
 
     def _init_data(self, data):
+        self._coordinates = None
         if ivy.is_ivy_sparse_array(data):
             self._data = data.data
             self._coo_indices = data.coo_indices
@@ -408,7 +577,8 @@ class SparseArray:
             self._row_indices = data.row_indices
             self._values = data.values
             self._dense_shape = data.dense_shape
-            self._format = data.format.lower()
+            self._format = data._format
+            self._coordinates = data._coordinates
         else:
             ivy.utils.assertions.check_true(
                 ivy.is_native_sparse_array(data), message="not a native sparse array"
@@ -446,12 +616,16 @@ class SparseArray:
         self._dense_shape = ivy.Shape(shape)
         self._format = self._data.format.lower()
 
-    def _init_coo_components(self, coo_indices, values, shape, format):
+    def _init_coo_components(self, coo_indices, values, shape, format, validate=True):
         coo_indices = ivy.array(coo_indices, dtype="int64")
         values = ivy.array(values)
         shape = ivy.Shape(shape)
         self._data = ivy.native_sparse_array(
-            coo_indices=coo_indices, values=values, dense_shape=shape, format=format
+            coo_indices=coo_indices,
+            values=values,
+            dense_shape=shape,
+            format=format,
+            validate=validate,
         )
         self._coo_indices = coo_indices
         self._values = values
@@ -463,7 +637,7 @@ class SparseArray:
         self._row_indices = None
 
     def _init_compressed_row_components(
-        self, crow_indices, col_indices, values, shape, format
+        self, crow_indices, col_indices, values, shape, format, validate=True
     ):
         crow_indices = ivy.array(crow_indices, dtype="int64")
         col_indices = ivy.array(col_indices, dtype="int64")
@@ -475,6 +649,7 @@ class SparseArray:
             values=values,
             dense_shape=shape,
             format=format,
+            validate=validate,
         )
         self._crow_indices = crow_indices
         self._col_indices = col_indices
@@ -486,7 +661,7 @@ class SparseArray:
         self._row_indices = None
 
     def _init_compressed_column_components(
-        self, ccol_indices, row_indices, values, shape, format
+        self, ccol_indices, row_indices, values, shape, format, validate=True
     ):
         ccol_indices = ivy.array(ccol_indices, dtype="int64")
         row_indices = ivy.array(row_indices, dtype="int64")
@@ -498,6 +673,7 @@ class SparseArray:
             values=values,
             dense_shape=shape,
             format=format,
+            validate=validate,
         )
         self._ccol_indices = ccol_indices
         self._row_indices = row_indices
@@ -557,6 +733,7 @@ class SparseArray:
             indices=indices, values=self._values, dense_shape=self._dense_shape
         )
         self._coo_indices = indices
+        self._coordinates = None
 
     @crow_indices.setter
     def crow_indices(self, indices):
@@ -576,6 +753,7 @@ class SparseArray:
                 dense_shape=self._dense_shape,
             )
         self._crow_indices = indices
+        self._coordinates = None
 
     @col_indices.setter
     def col_indices(self, indices):
@@ -595,6 +773,7 @@ class SparseArray:
                 dense_shape=self._dense_shape,
             )
         self._col_indices = indices
+        self._coordinates = None
 
     @ccol_indices.setter
     def ccol_indices(self, indices):
@@ -614,6 +793,7 @@ class SparseArray:
                 dense_shape=self._dense_shape,
             )
         self._ccol_indices = indices
+        self._coordinates = None
 
     @row_indices.setter
     def row_indices(self, indices):
@@ -633,6 +813,7 @@ class SparseArray:
                 dense_shape=self._dense_shape,
             )
         self._row_indices = indices
+        self._coordinates = None
 
     @values.setter
     def values(self, values):
@@ -641,6 +822,7 @@ class SparseArray:
             indices=self._coo_indices, values=values, dense_shape=self._dense_shape
         )
         self._values = values
+        self._coordinates = None
 
     @dense_shape.setter
     def dense_shape(self, dense_shape):
@@ -649,103 +831,105 @@ class SparseArray:
             indices=self._coo_indices, values=self._values, dense_shape=dense_shape
         )
         self._dense_shape = dense_shape
+        self._coordinates = None
 
     # Instance Methods #
     # ---------------- #
 
-    def _coo_to_dense_coordinates(self):
-        all_coordinates = []
-        for i in range(self._values.shape[0]):
-            coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-            coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-            all_coordinates.append(coordinate.to_list())
-        return all_coordinates
-
-    def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _bsr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._crow_indices.to_list()
-        all_cols = self._col_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for row in range(total_rows // nblockrows):
-            cols = all_cols[all_rows[row] : all_rows[row + 1]]
-            for col in cols:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
-    def _bsc_to_dense_coordinates(self):
-        all_coordinates = []
-        total_cols = self._dense_shape[1]
-        all_rows = self._row_indices.to_list()
-        all_cols = self._ccol_indices.to_list()
-
-        nblockrows, nblockcols = self._values.shape[-2:]
-
-        for col in range(total_cols // nblockcols):
-            rows = all_rows[all_cols[col] : all_cols[col + 1]]
-            for row in rows:
-                for col_index in range(nblockcols):
-                    for row_index in range(nblockrows):
-                        all_coordinates.append(
-                            [
-                                nblockrows * row + row_index,
-                                nblockcols * col + col_index,
-                            ]
-                        )
-        return all_coordinates
-
     def to_dense_array(self, *, native=False):
-        if self._format == "coo":
-            all_coordinates = self._coo_to_dense_coordinates()
-        elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
-        elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
-        elif self._format == "bsc":
-            all_coordinates = self._bsc_to_dense_coordinates()
+        if self._values.shape[0] == 0:
+            ret = ivy.zeros(
+                tuple(self._dense_shape),
+                dtype=self._values.dtype,
+                device=ivy.dev(self._values),
+            )
+            return ret.to_native() if native else ret
+        if self._format == "coo" and len(self._dense_shape) != 2:
+            # coo indices may address any number of dimensions
+            indices = ivy.permute_dims(self._coo_indices, axes=(1, 0))
+            values = self._values
         else:
-            all_coordinates = self._bsr_to_dense_coordinates()
+            rows, cols, values = _sparse_coordinates(self)
+            indices = ivy.stack([rows, cols], axis=-1)
 
         # make dense array
-        ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
-            ivy.flatten(self._values),
-            ivy.array(self._dense_shape),
-        )
+        ret = ivy.scatter_nd(indices, values, ivy.array(list(self._dense_shape)))
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        if self._format == "coo":
+            return self
+        return _sparse_array_from_coordinates(
+            *_coalesce_coordinates(*_sparse_coordinates(self), self._dense_shape),
+            self._dense_shape,
+            "coo",
+        )
+
+    def to_csr(self):
+        if self._format == "csr":
+            return self
+        return _sparse_array_from_coordinates(
+            *_coalesce_coordinates(*_sparse_coordinates(self), self._dense_shape),
+            self._dense_shape,
+            "csr",
+        )
+
+    def to_csc(self):
+        if self._format == "csc":
+            return self
+        return _sparse_array_from_coordinates(
+            *_coalesce_coordinates(*_sparse_coordinates(self), self._dense_shape),
+            self._dense_shape,
+            "csc",
+        )
+
+    def to_bsr(self, blocksize):
+        if self._format == "bsr" and tuple(self._values.shape[-2:]) == tuple(blocksize):
+            return self
+        return _block_sparse_array_from_coordinates(
+            *_coalesce_coordinates(*_sparse_coordinates(self), self._dense_shape),
+            self._dense_shape,
+            "bsr",
+            blocksize,
+        )
+
+    def to_bsc(self, blocksize):
+        if self._format == "bsc" and tuple(self._values.shape[-2:]) == tuple(blocksize):
+            return self
+        return _block_sparse_array_from_coordinates(
+            *_coalesce_coordinates(*_sparse_coordinates(self), self._dense_shape),
+            self._dense_shape,
+            "bsc",
+            blocksize,
+        )
+
+    def matmul(self, other):
+        return ivy.sparse_matmul(self, other)
+
+    def sum(self, *, axis=None):
+        return ivy.sparse_sum(self, axis=axis)
+
+    def max(self, *, axis=None):
+        return ivy.sparse_max(self, axis=axis)
+
+    def transpose(self):
+        return ivy.sparse_transpose(self)
+
+    def add(self, other):
+        return ivy.sparse_add(self, other)
+
+    def multiply(self, other):
+        return ivy.sparse_multiply(self, other)
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
 
 class NativeSparseArray:
     pass
@@ -774,6 +958,7 @@ def native_sparse_array(
     values=None,
     dense_shape=None,
     format=None,
+    validate=True,
 ):
     return ivy.current_backend().native_sparse_array(
         data,
@@ -785,9 +970,331 @@ def native_sparse_array(
         values=values,
         dense_shape=dense_shape,
         format=format,
+        validate=validate,
     )
 
 
 @handle_exceptions
 def native_sparse_array_to_indices_values_and_shape(x):
     return ivy.current_backend().native_sparse_array_to_indices_values_and_shape(x)
+
+
+# Sparse Operations #
+# ------------------#
+
+
+@handle_exceptions
+def sparse_matmul(
+    x: SparseArray,
+    y: Union[ivy.Array, ivy.NativeArray],
+    /,
+) -> ivy.Array:
+    """
+    Multiply a sparse matrix with a dense matrix or vector, without densifying the
+    sparse matrix.
+
+    Parameters
+    ----------
+    x
+        sparse matrix *[m,n]*, in any format.
+    y
+        dense matrix *[n,k]* or vector *[n]*.
+
+    Returns
+    -------
+    ret
+        dense product *[m,k]* or *[m]*.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 2]], values=[2., 3., 4.],
+    ...                     dense_shape=[2, 3], format="coo")
+    >>> print(ivy.sparse_matmul(x, ivy.array([1., 2., 3.])))
+    ivy.array([ 4., 15.])
+    """
+    rows, cols, values = _sparse_coordinates(x)
+    vector = len(y.shape) == 1
+    if vector:
+        y = ivy.expand_dims(y, axis=-1)
+    # each stored value scales a row of y, which is summed into its row of the output
+    products = ivy.expand_dims(values, axis=-1) * ivy.gather(y, cols, axis=0)
+    ret = ivy.scatter_nd(
+        ivy.expand_dims(rows, axis=-1),
+        products,
+        shape=(x.dense_shape[0], y.shape[-1]),
+        reduction="sum",
+    )
+    return ivy.squeeze(ret, axis=-1) if vector else ret
+
+
+sparse_matmul.mixed_function = True
+
+
+@handle_exceptions
+def sparse_sum(
+    x: SparseArray,
+    /,
+    *,
+    axis: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Sum the elements of a sparse matrix, over all of them or along an axis.
+
+    Parameters
+    ----------
+    x
+        sparse matrix *[m,n]*, in any format.
+    axis
+        axis to sum along, such that axis 1 gives the sum of each row. Default is
+        ``None``, in which case all elements are summed.
+
+    Returns
+    -------
+    ret
+        dense sum, of shape *[]*, *[n]* or *[m]*.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 2]], values=[2., 3., 4.],
+    ...                     dense_shape=[2, 3], format="coo")
+    >>> print(ivy.sparse_sum(x, axis=1))
+    ivy.array([2., 7.])
+    """
+    rows, cols, values = _sparse_coordinates(x)
+    if axis is None:
+        return ivy.sum(values)
+    axis = axis % 2
+    indices = cols if axis == 0 else rows
+    return ivy.scatter_nd(
+        ivy.expand_dims(indices, axis=-1),
+        values,
+        shape=(x.dense_shape[1 - axis],),
+        reduction="sum",
+    )
+
+
+sparse_sum.mixed_function = True
+
+
+@handle_exceptions
+def sparse_max(
+    x: SparseArray,
+    /,
+    *,
+    axis: Optional[int] = None,
+) -> ivy.Array:
+    """
+    Get the maximum of the elements of a sparse matrix, over all of them or along an
+    axis. As for the dense matrix, the elements which are not stored count as zeros.
+    The coordinates of the stored values are expected to be unique.
+
+    Parameters
+    ----------
+    x
+        sparse matrix *[m,n]*, in any format.
+    axis
+        axis to reduce along, such that axis 1 gives the maximum of each row.
+        Default is ``None``, in which case all elements are reduced.
+
+    Returns
+    -------
+    ret
+        dense maximum, of shape *[]*, *[n]* or *[m]*.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1, 1], [1, 0, 2]], values=[-2., 3., 4.],
+    ...                     dense_shape=[2, 3], format="coo")
+    >>> print(ivy.sparse_max(x, axis=1))
+    ivy.array([0., 4.])
+    """
+    rows, cols, values = _sparse_coordinates(x)
+    num_rows, num_cols = x.dense_shape
+    if axis is None:
+        if values.shape[0] == 0:
+            return ivy.zeros((), dtype=values.dtype, device=ivy.dev(values))
+        ret = ivy.max(values)
+        if values.shape[0] < num_rows * num_cols:
+            ret = ivy.maximum(ret, ivy.zeros_like(ret))
+        return ret
+    axis = axis % 2
+    indices = cols if axis == 0 else rows
+    size = x.dense_shape[1 - axis]
+    ret = ivy.scatter_nd(
+        ivy.expand_dims(indices, axis=-1), values, shape=(size,), reduction="max"
+    )
+    # the rows or columns which are not full also hold zeros
+    not_full = ivy.bincount(indices, minlength=size) < x.dense_shape[axis]
+    return ivy.where(not_full, ivy.maximum(ret, ivy.zeros_like(ret)), ret)
+
+
+sparse_max.mixed_function = True
+
+
+@handle_exceptions
+def sparse_transpose(x: SparseArray, /) -> SparseArray:
+    """
+    Transpose a sparse matrix. The compressed formats swap over, such that the
+    transpose of a CSR matrix is a CSC matrix sharing the same components.
+
+    Parameters
+    ----------
+    x
+        sparse matrix *[m,n]*, in any format.
+
+    Returns
+    -------
+    ret
+        transposed sparse matrix *[n,m]*.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(crow_indices=[0, 1, 3], col_indices=[1, 0, 2],
+    ...                     values=[2., 3., 4.], dense_shape=[2, 3], format="csr")
+    >>> y = ivy.sparse_transpose(x)
+    >>> print(y.ccol_indices, y.row_indices)
+    ivy.array([0, 1, 3]) ivy.array([1, 0, 2])
+    """
+    dense_shape = (x.dense_shape[1], x.dense_shape[0])
+    format = x._format
+    if format == "coo":
+        return SparseArray(
+            coo_indices=ivy.flip(x.coo_indices, axis=0),
+            values=x.values,
+            dense_shape=dense_shape,
+            format=format,
+            validate=False,
+        )
+    values = x.values
+    if format in ["bsr", "bsc"]:
+        values = ivy.permute_dims(values, axes=(0, 2, 1))
+    if format.endswith("r"):
+        return SparseArray(
+            ccol_indices=x.crow_indices,
+            row_indices=x.col_indices,
+            values=values,
+            dense_shape=dense_shape,
+            format=format[:-1] + "c",
+            validate=False,
+        )
+    return SparseArray(
+        crow_indices=x.ccol_indices,
+        col_indices=x.row_indices,
+        values=values,
+        dense_shape=dense_shape,
+        format=format[:-1] + "r",
+        validate=False,
+    )
+
+
+@handle_exceptions
+def sparse_add(x: SparseArray, y: SparseArray, /) -> SparseArray:
+    """
+    Add two sparse matrices, giving a sparse matrix holding the union of their
+    stored coordinates.
+
+    Parameters
+    ----------
+    x
+        first sparse matrix *[m,n]*, in any format.
+    y
+        second sparse matrix *[m,n]*, in any format.
+
+    Returns
+    -------
+    ret
+        sparse sum *[m,n]*, in the format of x for the COO, CSR and CSC formats, and in
+        the COO format otherwise.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1], [1, 0]], values=[2., 3.],
+    ...                     dense_shape=[2, 2], format="coo")
+    >>> y = ivy.SparseArray(coo_indices=[[1], [0]], values=[4.],
+    ...                     dense_shape=[2, 2], format="coo")
+    >>> print(ivy.sparse_add(x, y).values)
+    ivy.array([2., 7.])
+    """
+    ivy.utils.assertions.check_equal(
+        x.dense_shape, y.dense_shape, message="sparse arrays must have the same shape"
+    )
+    x_rows, x_cols, x_values = _sparse_coordinates(x)
+    y_rows, y_cols, y_values = _sparse_coordinates(y)
+    rows, cols, values = _coalesce_coordinates(
+        ivy.concat([x_rows, y_rows]),
+        ivy.concat([x_cols, y_cols]),
+        ivy.concat([x_values, y_values]),
+        x.dense_shape,
+    )
+    return _sparse_array_from_coordinates(
+        rows, cols, values, x.dense_shape, _elementwise_format(x)
+    )
+
+
+sparse_add.mixed_function = True
+
+
+@handle_exceptions
+def sparse_multiply(x: SparseArray, y: SparseArray, /) -> SparseArray:
+    """
+    Multiply two sparse matrices elementwise, giving a sparse matrix holding the
+    intersection of their stored coordinates.
+
+    Parameters
+    ----------
+    x
+        first sparse matrix *[m,n]*, in any format.
+    y
+        second sparse matrix *[m,n]*, in any format.
+
+    Returns
+    -------
+    ret
+        sparse product *[m,n]*, in the format of x for the COO, CSR and CSC formats,
+        and in the COO format otherwise.
+
+    Examples
+    --------
+    >>> x = ivy.SparseArray(coo_indices=[[0, 1], [1, 0]], values=[2., 3.],
+    ...                     dense_shape=[2, 2], format="coo")
+    >>> y = ivy.SparseArray(coo_indices=[[1], [0]], values=[4.],
+    ...                     dense_shape=[2, 2], format="coo")
+    >>> print(ivy.sparse_multiply(x, y).values)
+    ivy.array([12.])
+    """
+    ivy.utils.assertions.check_equal(
+        x.dense_shape, y.dense_shape, message="sparse arrays must have the same shape"
+    )
+    num_cols = x.dense_shape[1]
+    x_rows, x_cols, x_values = _coalesce_coordinates(
+        *_sparse_coordinates(x), x.dense_shape
+    )
+    y_rows, y_cols, y_values = _coalesce_coordinates(
+        *_sparse_coordinates(y), y.dense_shape
+    )
+    # the coordinates of x are looked up among the sorted coordinates of y
+    x_ids = x_rows * num_cols + x_cols
+    y_ids = y_rows * num_cols + y_cols
+    if y_ids.shape[0] == 0:
+        matches = ivy.zeros((0,), dtype="int64", device=ivy.dev(x_ids))
+        positions = matches
+    else:
+        positions = ivy.minimum(
+            ivy.searchsorted(y_ids, x_ids), ivy.array(y_ids.shape[0] - 1)
+        )
+        matches = ivy.nonzero(ivy.gather(y_ids, positions) == x_ids)[0]
+        positions = ivy.gather(positions, matches)
+    return _sparse_array_from_coordinates(
+        ivy.gather(x_rows, matches),
+        ivy.gather(x_cols, matches),
+        ivy.gather(x_values, matches) * ivy.gather(y_values, positions),
+        x.dense_shape,
+        _elementwise_format(x),
+    )
+
+
+sparse_multiply.mixed_function = True
+
+
+def _elementwise_format(x):
+    return x._format if x._format in ["coo", "csr", "csc"] else "coo"
@@ -45,7 +45,9 @@ INF = float("inf")
 TMP_DIR = "/tmp"
 
 queue_timeout_stack = list()
+attention_block_size_stack = list()
 array_mode_stack = list()
+frontend_native_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
 exception_trace_mode_stack = list()
@@ -388,6 +390,69 @@ def get_array_mode() -> bool:
     return array_mode_stack[-1]
 
 
+@handle_exceptions
+def set_frontend_native_mode(mode: bool) -> None:
+    """
+    Set the mode of whether frontend functions unwrap their inputs to native arrays
+    once, and run their body with array mode off, such that the ivy functions they
+    call work on native arrays directly and only the final result is wrapped into a
+    frontend array. This expects the frontend functions to only call ivy functions
+    on their inputs, rather than methods of ivy.Array.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to pass native arrays through frontend functions
+
+    Examples
+    --------
+    >>> ivy.set_frontend_native_mode(True)
+    >>> ivy.get_frontend_native_mode()
+    True
+    """
+    global frontend_native_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    frontend_native_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_frontend_native_mode() -> None:
+    """
+    Reset the mode of passing native arrays through frontend functions to the
+    previous state
+
+    Examples
+    --------
+    >>> ivy.set_frontend_native_mode(True)
+    >>> ivy.unset_frontend_native_mode()
+    >>> ivy.get_frontend_native_mode()
+    False
+    """
+    global frontend_native_mode_stack
+    if frontend_native_mode_stack:
+        frontend_native_mode_stack.pop(-1)
+
+
+@handle_exceptions
+def get_frontend_native_mode() -> bool:
+    """
+    Get the current state of frontend_native_mode
+
+    Examples
+    --------
+    >>> ivy.get_frontend_native_mode()
+    False
+
+    >>> ivy.set_frontend_native_mode(True)
+    >>> ivy.get_frontend_native_mode()
+    True
+    """
+    global frontend_native_mode_stack
+    if not frontend_native_mode_stack:
+        return False
+    return frontend_native_mode_stack[-1]
+
+
 @handle_exceptions
 def set_nestable_mode(mode: bool) -> None:
     """
@@ -2452,6 +2517,79 @@ def unset_queue_timeout() -> None:
         queue_timeout_stack.pop(-1)
 
 
+@handle_exceptions
+def set_attention_block_size(block_size: int) -> None:
+    """
+    Set the global number of keys per block for scaled dot-product attention.
+    When set, attention is computed blockwise over the keys with a running softmax,
+    so the full query-key score matrix is never materialized.
+
+    Parameters
+    ----------
+    block_size
+        The number of keys attended to at once.
+
+    Examples
+    --------
+    >>> ivy.set_attention_block_size(512)
+    >>> y = ivy.get_attention_block_size()
+    >>> print(y)
+    512
+
+    """
+    global attention_block_size_stack
+    ivy.utils.assertions.check_isinstance(block_size, int)
+    ivy.utils.assertions.check_greater(block_size, 0)
+    attention_block_size_stack.append(block_size)
+
+
+@handle_exceptions
+def get_attention_block_size() -> Optional[int]:
+    """
+    Get the global number of keys per block for scaled dot-product attention.
+    The default value without set_attention_block_size being called is None, in
+    which case attention is computed over all keys at once.
+
+    Returns
+    -------
+    ret
+       The global number of keys per block, or None.
+
+    Examples
+    --------
+    >>> ivy.get_attention_block_size()
+    None
+
+    >>> ivy.set_attention_block_size(512)
+    >>> y = ivy.get_attention_block_size()
+    >>> print(y)
+    512
+
+    """
+    global attention_block_size_stack
+    if not attention_block_size_stack:
+        return None
+    return attention_block_size_stack[-1]
+
+
+@handle_exceptions
+def unset_attention_block_size() -> None:
+    """
+    Reset the global number of keys per block for scaled dot-product attention to
+    the previous state
+
+    Examples
+    --------
+    >>> ivy.set_attention_block_size(512)
+    >>> ivy.unset_attention_block_size()
+    >>> ivy.get_attention_block_size()
+    None
+    """
+    global attention_block_size_stack
+    if attention_block_size_stack:
+        attention_block_size_stack.pop(-1)
+
+
 @handle_exceptions
 def get_tmp_dir():
     """
@@ -2,6 +2,7 @@
 
 # global
 from typing import Sequence, Union, Optional, Tuple, Callable
+from collections import namedtuple
 import numpy as np
 import itertools
 
@@ -36,23 +37,26 @@ def _get_duplicate_index_chains(xs):
     return duplicate_index_chains
 
 
+def _array_to_float_variable(x):
+    """Used to convert a single array to a float variable."""
+    if ivy.is_array(x, exclusive=True):
+        backend = current_backend(x)
+        if ivy.is_int_dtype(x.dtype):
+            x = ivy.astype(x, ivy.default_float_dtype())
+        elif backend.is_variable(ivy.to_native(x)):
+            x = ivy.stop_gradient(x, preserve_type=False)
+        # call the backend directly, as there is no nest to map over
+        return ivy.to_ivy(backend.variable(ivy.to_native(x)))
+    return x
+
+
 def _arrays_to_float_variables(xs, xs_grad_idxs=None):
     """Used to convert all required arrays to float variables for
     gradient calculation.
     """
-
-    def inner_fn(x):
-        if ivy.is_array(x, exclusive=True):
-            if ivy.is_int_dtype(x.dtype):
-                x = ivy.astype(x, ivy.default_float_dtype())
-            elif _is_variable(x):
-                x = ivy.stop_gradient(x, preserve_type=False)
-            return _variable(x)
-        return x
-
     # Convert all required arrays to float variables
     map_fn = lambda x: ivy.nested_map(
-        x, fn=inner_fn, include_derived=True, shallow=False
+        x, fn=_array_to_float_variable, include_derived=True, shallow=False
     )
     if xs_grad_idxs is not None:
         ivy.map_nest_at_indices(xs, xs_grad_idxs, map_fn)
@@ -101,10 +105,9 @@ def _get_required_native_variables(xs, xs_grad_idxs):
     return xs
 
 
-def _get_required_float_variables(xs, xs_grad_idxs):
+def _extract_required_float_variables(xs, xs_grad_idxs):
     """Converts all required arrays to float variables for gradient
-    calculation. Also, returns a list of duplicate index chains
-    for the nested structure.
+    calculation, by walking the full nested structure.
     """
     duplicate_index_chains = _get_duplicate_index_chains(xs)
     xs = _to_ivy(xs)
@@ -115,6 +118,211 @@ def _get_required_float_variables(xs, xs_grad_idxs):
     return xs, xs_required, required_duplicate_index_chains, duplicate_index_chains
 
 
+def _get_required_float_variables(xs, xs_grad_idxs):
+    """Converts all required arrays to float variables for gradient
+    calculation. Also, returns a list of duplicate index chains
+    for the nested structure.
+
+    The extraction plan is cached for each nest structure and set of
+    ``xs_grad_idxs``, so that repeated calls with the same structure, such
+    as every step of a training loop, only gather and convert the leaves.
+    """
+    if ivy.is_array(xs):
+        return _extract_required_float_variables(xs, xs_grad_idxs)
+    leaves, paths = [], []
+    try:
+        structure = _flatten_variables_nest(xs, (), leaves, paths)
+        grad_idxs = (
+            None if xs_grad_idxs is None else tuple(tuple(idx) for idx in xs_grad_idxs)
+        )
+        key = (structure, _leaf_identities(leaves), grad_idxs)
+        plan = _VARIABLE_PLANS.get(key, False)
+    except (_UncacheableNest, TypeError):
+        # unhashable indices or nest types which cannot be rebuilt
+        return _extract_required_float_variables(xs, xs_grad_idxs)
+    if plan:
+        return _replay_variable_plan(xs, leaves, plan)
+    ret = _extract_required_float_variables(xs, xs_grad_idxs)
+    if plan is None:
+        return ret
+    if len(_VARIABLE_PLANS) >= _MAX_VARIABLE_PLANS:
+        _VARIABLE_PLANS.clear()
+    _VARIABLE_PLANS[key] = _build_variable_plan(key, paths, ret)
+    return ret
+
+
+# Variable Extraction Plans #
+# ------------------------- #
+
+_VARIABLE_PLANS = dict()
+_MAX_VARIABLE_PLANS = 128
+
+_VariablePlan = namedtuple(
+    "_VariablePlan",
+    [
+        "converted",
+        "identities",
+        "required",
+        "required_duplicate_index_chains",
+        "duplicate_index_chains",
+    ],
+)
+_PlanLeaf = namedtuple("_PlanLeaf", ["idx"])
+_PlanContainer = namedtuple("_PlanContainer", ["dict_in", "config"])
+
+
+class _UncacheableNest(Exception):
+    pass
+
+
+def _flatten_variables_nest(x, path, leaves, paths):
+    """Collects the leaves of a nest and their index chains, and returns a
+    hashable description of the nest structure.
+    """
+    if type(x) in (list, tuple):
+        return type(x), tuple(
+            _flatten_variables_nest(v, path + (i,), leaves, paths)
+            for i, v in enumerate(x)
+        )
+    if type(x) in (dict, ivy.Container):
+        return type(x), tuple(
+            (k, _flatten_variables_nest(v, path + (k,), leaves, paths))
+            for k, v in dict.items(x)
+        )
+    if isinstance(x, (list, tuple, dict)):
+        # subclasses of the nest types might not be rebuilt faithfully
+        raise _UncacheableNest
+    leaves.append(x)
+    paths.append(path)
+    return None
+
+
+def _unflatten_variables_nest(x, leaves):
+    """Rebuilds a nest with the same structure as ``x`` from an iterator of
+    leaves.
+    """
+    if type(x) in (list, tuple):
+        return type(x)([_unflatten_variables_nest(v, leaves) for v in x])
+    if type(x) is dict:
+        return {k: _unflatten_variables_nest(v, leaves) for k, v in x.items()}
+    if type(x) is ivy.Container:
+        return ivy.Container(
+            {k: _unflatten_variables_nest(v, leaves) for k, v in dict.items(x)},
+            **x._config,
+        )
+    return next(leaves)
+
+
+def _leaf_identities(leaves):
+    """For each array leaf, returns the index of the first leaf which is the
+    same object, and None for all other leaves.
+    """
+    first_idxs = dict()
+    return tuple(
+        first_idxs.setdefault(id(leaf), i) if ivy.is_array(leaf) else None
+        for i, leaf in enumerate(leaves)
+    )
+
+
+def _required_template(x, data_idxs):
+    """Replaces the native arrays in the nest of required variables with the
+    indices of the leaves they were extracted from.
+    """
+    if ivy.is_native_array(x):
+        if id(x) not in data_idxs:
+            raise _UncacheableNest
+        return _PlanLeaf(data_idxs[id(x)])
+    if type(x) in (list, tuple):
+        return type(x)([_required_template(v, data_idxs) for v in x])
+    if type(x) is dict:
+        return {k: _required_template(v, data_idxs) for k, v in x.items()}
+    if type(x) is ivy.Container:
+        return _PlanContainer(
+            {k: _required_template(v, data_idxs) for k, v in dict.items(x)},
+            x._config,
+        )
+    raise _UncacheableNest
+
+
+def _fill_required_template(template, leaves):
+    if isinstance(template, _PlanLeaf):
+        return ivy.to_native(leaves[template.idx])
+    if isinstance(template, _PlanContainer):
+        return ivy.Container(
+            _fill_required_template(template.dict_in, leaves), **template.config
+        )
+    if type(template) in (list, tuple):
+        return type(template)([_fill_required_template(v, leaves) for v in template])
+    return {k: _fill_required_template(v, leaves) for k, v in template.items()}
+
+
+def _build_variable_plan(key, paths, ret):
+    """Derives the extraction plan from the result of a full extraction, or
+    returns None if the result cannot be reproduced by gathering leaves.
+    """
+    structure, identities, grad_idxs = key
+    xs, xs_required, required_duplicate_index_chains, duplicate_index_chains = ret
+    out_leaves = []
+    try:
+        out_structure = _flatten_variables_nest(xs, (), out_leaves, [])
+        # the extraction must preserve the structure and the duplicate leaves
+        if out_structure != structure or _leaf_identities(out_leaves) != identities:
+            return None
+        # every index must point at a leaf or a sub-nest, rather than inside an array
+        if grad_idxs is not None and not all(
+            any(path[: len(idx)] == idx for path in paths) for idx in grad_idxs
+        ):
+            return None
+        data_idxs = dict()
+        for i, leaf in enumerate(out_leaves):
+            if identities[i] is None:
+                continue
+            j = data_idxs.setdefault(id(ivy.to_native(leaf)), i)
+            if out_leaves[j] is not leaf:
+                # distinct leaves sharing the same data cannot be told apart
+                return None
+        required = _required_template(xs_required, data_idxs)
+    except _UncacheableNest:
+        return None
+    converted = tuple(
+        grad_idxs is None or any(path[: len(idx)] == idx for idx in grad_idxs)
+        for path in paths
+    )
+    return _VariablePlan(
+        converted,
+        identities,
+        required,
+        required_duplicate_index_chains,
+        duplicate_index_chains,
+    )
+
+
+def _replay_variable_plan(xs, leaves, plan):
+    """Converts the leaves of ``xs`` to float variables following a cached
+    extraction plan.
+    """
+    new_leaves = list(leaves)
+    for i, (leaf, identity, converted) in enumerate(
+        zip(leaves, plan.identities, plan.converted)
+    ):
+        if identity is None:
+            continue
+        if identity != i:
+            # duplicates share the reference of their first occurrence
+            new_leaves[i] = new_leaves[identity]
+            continue
+        leaf = ivy.to_ivy(leaf)
+        new_leaves[i] = _array_to_float_variable(leaf) if converted else leaf
+    xs = _unflatten_variables_nest(xs, iter(new_leaves))
+    xs_required = _fill_required_template(plan.required, new_leaves)
+    return (
+        xs,
+        xs_required,
+        plan.required_duplicate_index_chains,
+        plan.duplicate_index_chains,
+    )
+
+
 def _get_native_variables_and_indices(x, reshape=True, idxs=None, create_var=False):
     """Used to extract all relevant results from the output
     nested structure of a function.
@@ -250,6 +458,26 @@ _to_ivy = lambda xs: ivy.nested_map(
 )
 
 
+def _checkpoint_array_args(func, checkpoint_fn):
+    """Used to checkpoint func with a backend checkpointing function which
+    only accepts native arrays as positional arguments.
+    """
+
+    def checkpointed_fn(*args, **kwargs):
+        nest = [list(args), kwargs]
+        array_idxs = ivy.nested_argwhere(nest, ivy.is_array)
+        arrays = [ivy.to_native(x) for x in ivy.multi_index_nest(nest, array_idxs)]
+
+        def native_fn(*native_arrays):
+            nest_ = ivy.copy_nest(nest, to_mutable=True)
+            ivy.set_nest_at_indices(nest_, array_idxs, list(native_arrays))
+            return ivy.to_native(func(*nest_[0], **nest_[1]), nested=True)
+
+        return ivy.to_ivy(checkpoint_fn(native_fn, *arrays), nested=True)
+
+    return checkpointed_fn
+
+
 _non_finite_to_zero = lambda xs: ivy.nested_map(
     xs,
     lambda x: ivy.where(ivy.isfinite(x), x, 0) if ivy.is_array(x) else x,
@@ -533,6 +761,39 @@ def jac(func: Callable) -> Callable:
 jac.computes_gradients = True
 
 
+@handle_exceptions
+def checkpoint(func: Callable) -> Callable:
+    """
+    Wrap func so that its intermediate activations are not stored for the backward
+    pass, but recomputed when the gradients are computed. This trades extra compute
+    in the backward pass for a lower peak memory.
+
+    Parameters
+    ----------
+    func
+        Function to checkpoint, which should produce the same result when it is called
+        again with the same inputs.
+
+    Returns
+    -------
+    ret
+        The checkpointed function, which returns the same values as func.
+
+    Examples
+    --------
+    With :class:`ivy.Array` input:
+
+    >>> x = ivy.array([[4.6, 2.1, 5], [2.8, 1.3, 6.2]])
+    >>> func = lambda x: ivy.tanh(ivy.matmul(x, ivy.matrix_transpose(x)))
+    >>> checkpointed_fn = ivy.checkpoint(func)
+    >>> print(checkpointed_fn(x))
+    ivy.array([[1., 1.],
+               [1., 1.]])
+
+    """
+    return current_backend(None).checkpoint(func)
+
+
 @handle_exceptions
 def grad(func: Callable, argnums: Union[int, Sequence[int]] = 0) -> Callable:
     """Call function func, and return func's gradients.
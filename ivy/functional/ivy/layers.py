@@ -1,6 +1,7 @@
 """Collection of Ivy neural network layers in functional form."""
 
 # global
+import math
 from typing import Optional, Tuple, Union, Callable, Sequence
 
 # local
@@ -387,6 +388,11 @@ def scaled_dot_product_attention(
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
 
+    When a block size is set with :func:`ivy.set_attention_block_size`, the keys are
+    attended to one block at a time, with a running maximum for the softmax, so that
+    memory grows with *num_queries x block_size* rather than with
+    *num_queries x num_keys*.
+
     Returns
     -------
     ret
@@ -534,6 +540,12 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
+    block_size = ivy.get_attention_block_size()
+    if block_size is not None:
+        return _blockwise_scaled_dot_product_attention(
+            q, k, v, scale, mask, block_size, out=out
+        )
+
     # BS x Q x K
     sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
 
@@ -573,6 +585,7 @@ def multi_head_attention(
     to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    kv_cache: Optional["ivy.KVCache"] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Applies multi-head attention to inputs x.
@@ -605,6 +618,11 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    kv_cache
+        The :class:`ivy.KVCache` to append the keys and values of the context to, for
+        incremental decoding. The queries then attend over all cached keys and values
+        up to their own position, and the context only needs to hold the new tokens
+        *[batch_size,num_queries,cont_feat_dim]*. Default is ``None``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -763,6 +781,15 @@ def multi_head_attention(
     else:
         k, v = ivy.split(kv, num_or_size_splits=2, axis=-1)
 
+    # BS x L x (HxF),  BS x L x (HxF),  BS x Q x L
+    if ivy.exists(kv_cache):
+        k, v, cache_mask = kv_cache.update(k, v)
+        mask = (
+            cache_mask
+            if mask is None
+            else ivy.logical_and(ivy.astype(mask, "bool"), cache_mask)
+        )
+
     # BS x H x Q x F,  BS x H x K x F,  BS x H x K x F
     def call_einops(t):
         return ivy.einops_rearrange(t, "... n (h f) -> ... h n f", h=num_heads)
@@ -1890,6 +1917,7 @@ def lstm_update(
     *,
     bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     recurrent_bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    lengths: Optional[Union[ivy.Array, ivy.NativeArray, Sequence[int]]] = None,
 ) -> Tuple[ivy.Array, ivy.Array]:
     """Perform long-short term memory update by unrolling time dimension of input array.
 
@@ -1909,6 +1937,13 @@ def lstm_update(
         bias for cell kernel *[4 x out]*. (Default value = None)
     recurrent_bias
         bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+    lengths
+        lengths of the sequences *[batch_shape]*, each between 1 and t, for a batch of
+        padded variable-length sequences. The sequences are then processed in packed
+        form, where each step only updates the sequences which have not yet ended.
+        The hidden states past the end of each sequence are zero, and the returned
+        cell state is the one at the last step of each sequence.
+        (Default value = None)
 
     Returns
     -------
@@ -1922,58 +1957,164 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
-    x_flat = ivy.reshape(x, (-1, input_channels))
-
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
+    hidden_channels = recurrent_kernel.shape[0]
+    batch_size = math.prod(batch_shape)
+
+    # the gates are reordered as input, forget, output and cell, so that the three
+    # sigmoid gates are activated together
+    Wi = _lstm_sigmoid_gates_first(kernel)
+    Wh = _lstm_sigmoid_gates_first(recurrent_kernel)
+
+    # time-major input projection for all timesteps, with both biases added once
+    Wi_x = ivy.matmul(
+        ivy.permute_dims(
+            ivy.reshape(x, (batch_size, timesteps, input_channels)), axes=(1, 0, 2)
+        ),
+        Wi,
     )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
+    for b in (bias, recurrent_bias):
+        if b is not None:
+            Wi_x = Wi_x + _lstm_sigmoid_gates_first(b)
 
     # lstm states
-    ht = init_h
-    ct = init_c
+    ht = ivy.reshape(init_h, (batch_size, hidden_channels))
+    ct = ivy.reshape(init_c, (batch_size, hidden_channels))
+
+    # in packed form, the sequences are sorted by decreasing length, so that the
+    # sequences still running at each step are a prefix of the batch
+    if lengths is None:
+        batch_sizes = [batch_size] * timesteps
+    else:
+        order, batch_sizes = _lstm_packed_batch(lengths, batch_size, timesteps)
+        order = ivy.array(order, dtype="int64", device=ivy.dev(Wi_x))
+        Wi_x = ivy.gather(Wi_x, order, axis=1)
+        ht = ivy.gather(ht, order, axis=0)
+        ct = ivy.gather(ct, order, axis=0)
+    zeros = ivy.zeros_like(ct)
 
     # lstm outputs
     hts_list = list()
-
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
+    ended_cts = list()
+
+    # unrolled time dimension with lstm steps, with one matmul per step
+    for Wi_xt, num_running in zip(ivy.unstack(Wi_x, axis=0), batch_sizes):
+        if num_running < ct.shape[0]:
+            ended_cts.append(ct[num_running:])
+            ht = ht[:num_running]
+            ct = ct[:num_running]
+        if num_running < batch_size:
+            Wi_xt = Wi_xt[:num_running]
+
+        gates = Wi_xt + ivy.matmul(ht, Wh)
+        sigmoid_gates, gt = ivy.split(
+            gates, num_or_size_splits=[3 * hidden_channels, hidden_channels], axis=-1
         )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
+        it, ft, ot = ivy.split(
+            ivy.sigmoid(sigmoid_gates), num_or_size_splits=3, axis=-1
         )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+        ct = ft * ct + it * ivy.tanh(gt)
         ht = ot * ivy.tanh(ct)
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
+        hts_list.append(ht)
+
+    if lengths is not None:
+        # pad the ended sequences and the steps past the longest sequence with zeros
+        hts_list = [
+            ivy.concat([ht, zeros[ht.shape[0] :]], axis=0)
+            if ht.shape[0] < batch_size
+            else ht
+            for ht in hts_list
+        ] + [zeros] * (timesteps - len(hts_list))
+        ct = ivy.concat([ct] + ended_cts[::-1], axis=0)
+    hts = ivy.stack(hts_list, axis=0)
+    if lengths is not None:
+        inverse_order = ivy.argsort(order)
+        hts = ivy.gather(hts, inverse_order, axis=1)
+        ct = ivy.gather(ct, inverse_order, axis=0)
+    return (
+        ivy.reshape(
+            ivy.permute_dims(hts, axes=(1, 0, 2)),
+            batch_shape + [timesteps, hidden_channels],
+        ),
+        ivy.reshape(ct, batch_shape + [hidden_channels]),
+    )
+
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
 
 
+def _blockwise_scaled_dot_product_attention(q, k, v, scale, mask, block_size, out=None):
+    """Scaled dot-product attention over blocks of keys, with an online softmax which
+    rescales the running sum and output whenever the running maximum increases."""
+    num_keys = k.shape[-2]
+    running_max = None
+    for start in range(0, num_keys, block_size):
+        end = min(start + block_size, num_keys)
+        v_block = v[..., start:end, :]
+
+        # BS x Q x block
+        sim = ivy.einsum("... q f, ... k f -> ... q k", q, k[..., start:end, :]) * scale
+        if ivy.exists(mask):
+            mask_block = mask[..., start:end] if mask.shape[-1] != 1 else mask
+            sim = ivy.where(
+                ivy.logical_not(mask_block),
+                -ivy.ones_like(sim) * ivy.finfo(ivy.dtype(sim)).max,
+                sim,
+            )
+
+        block_max = ivy.max(sim, axis=-1, keepdims=True)
+        if running_max is None:
+            running_max = block_max
+            weights = ivy.exp(sim - running_max)
+            running_sum = ivy.sum(weights, axis=-1, keepdims=True)
+            ret = ivy.einsum("... q k, ... k f -> ... q f", weights, v_block)
+            continue
+        new_max = ivy.maximum(running_max, block_max)
+        correction = ivy.exp(running_max - new_max)
+        weights = ivy.exp(sim - new_max)
+        running_sum = running_sum * correction + ivy.sum(
+            weights, axis=-1, keepdims=True
+        )
+        ret = ret * correction + ivy.einsum(
+            "... q k, ... k f -> ... q f", weights, v_block
+        )
+        running_max = new_max
+
+    # BS x Q x F
+    return ivy.divide(ret, running_sum, out=out)
+
+
+def _lstm_sigmoid_gates_first(w):
+    # reorders the gates along the last axis from input, forget, cell, output to
+    # input, forget, output, cell
+    it, ft, gt, ot = ivy.split(w, num_or_size_splits=4, axis=-1)
+    return ivy.concat([it, ft, ot, gt], axis=-1)
+
+
+def _lstm_packed_batch(lengths, batch_size, timesteps):
+    """Get the order of the sequences by decreasing length, and the number of
+    sequences which have not yet ended at each step."""
+    lengths = ivy.to_list(ivy.reshape(ivy.asarray(lengths), (-1,)))
+    if len(lengths) != batch_size or not all(0 < n <= timesteps for n in lengths):
+        raise ivy.utils.exceptions.IvyException(
+            "expected {} sequence lengths between 1 and {}, but found {}.".format(
+                batch_size, timesteps, lengths
+            )
+        )
+    order = sorted(range(batch_size), key=lambda i: -lengths[i])
+    sorted_lengths = [lengths[i] for i in order]
+    batch_sizes = list()
+    num_running = batch_size
+    for t in range(sorted_lengths[0] if batch_size else 0):
+        while sorted_lengths[num_running - 1] <= t:
+            num_running -= 1
+        batch_sizes.append(num_running)
+    return order, batch_sizes
+
+
 def _handle_padding(x, strides, filters, padding):
     if padding == "SAME":
         if x % strides == 0:
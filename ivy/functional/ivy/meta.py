@@ -328,6 +328,110 @@ def _train_tasks_with_for_loop(
     return total_cost / num_tasks
 
 
+# backends whose vmap vectorizes the mapped function, rather than looping over the
+# mapped axis
+_VMAP_BACKENDS = ("jax", "torch")
+
+
+def _per_task_batch_fn(batch_fn, num_tasks):
+    if batch_fn is None:
+        return None
+    return lambda batch: ivy.concat(
+        [
+            batch_fn(sub_batch)
+            for sub_batch in batch.cont_unstack_conts(0, True, num_tasks)
+        ],
+        axis=0,
+    )
+
+
+def _stacked_task_cost_fn(cost_fn, num_tasks):
+    """Wraps a per-task cost function, as used when looping over the tasks, into a
+    cost function for the batch of all tasks and the variables of all tasks stacked
+    along the leading axis, which returns the mean cost across the tasks.
+
+    Only the jax and torch backends vectorize the per-task cost function with
+    ``ivy.vmap``, the other backends still call it once per task in a Python loop.
+    """
+    if cost_fn is None:
+        return None
+
+    def stacked_cost_fn(batch, v):
+        if ivy.current_backend_str() in _VMAP_BACKENDS:
+            batch_leaves = batch.cont_to_flat_list()
+            num_batch_leaves = len(batch_leaves)
+
+            def task_cost_fn(*leaves):
+                # the task axis of the batch is kept, as when looping over the tasks
+                sub_batch = batch.cont_from_flat_list(
+                    [ivy.expand_dims(x, axis=0) for x in leaves[:num_batch_leaves]]
+                )
+                sub_v = v.cont_from_flat_list(list(leaves[num_batch_leaves:]))
+                return cost_fn(sub_batch, v=sub_v)
+
+            costs = ivy.vmap(task_cost_fn)(*batch_leaves, *v.cont_to_flat_list())
+        else:
+            costs = ivy.stack(
+                [
+                    cost_fn(sub_batch, v=sub_v)
+                    for sub_batch, sub_v in zip(
+                        batch.cont_unstack_conts(0, True, num_tasks),
+                        v.cont_unstack_conts(0, False, num_tasks),
+                    )
+                ]
+            )
+        return ivy.mean(costs, axis=0)
+
+    return stacked_cost_fn
+
+
+def _train_tasks_vectorized(
+    batch,
+    inner_sub_batch_fn,
+    outer_sub_batch_fn,
+    inner_cost_fn,
+    outer_cost_fn,
+    variables,
+    inner_grad_steps,
+    inner_learning_rate,
+    inner_optimization_step,
+    order,
+    average_across_steps,
+    inner_v,
+    keep_innver_v,
+    outer_v,
+    keep_outer_v,
+    return_inner_v,
+    num_tasks,
+    stop_gradients,
+):
+    # the variables of all tasks are stacked along a leading task axis, so that each
+    # inner step adapts all tasks with a single gradient computation
+    stacked_variables = variables.cont_map(
+        lambda x, kc: ivy.repeat(ivy.expand_dims(x, axis=0), num_tasks, axis=0)
+    )
+    return _train_tasks_batched(
+        batch,
+        _per_task_batch_fn(inner_sub_batch_fn, num_tasks),
+        _per_task_batch_fn(outer_sub_batch_fn, num_tasks),
+        _stacked_task_cost_fn(inner_cost_fn, num_tasks),
+        _stacked_task_cost_fn(outer_cost_fn, num_tasks),
+        stacked_variables,
+        inner_grad_steps,
+        inner_learning_rate,
+        inner_optimization_step,
+        order,
+        average_across_steps,
+        inner_v,
+        keep_innver_v,
+        outer_v,
+        keep_outer_v,
+        return_inner_v,
+        num_tasks,
+        stop_gradients,
+    )
+
+
 def _train_tasks(
     batch,
     inner_batch_fn,
@@ -348,7 +452,29 @@ def _train_tasks(
     return_inner_v,
     num_tasks,
     stop_gradients,
+    vectorized=False,
 ):
+    if vectorized:
+        return _train_tasks_vectorized(
+            batch,
+            inner_batch_fn,
+            outer_batch_fn,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            inner_learning_rate,
+            inner_optimization_step,
+            order,
+            average_across_steps,
+            inner_v,
+            keep_innver_v,
+            outer_v,
+            keep_outer_v,
+            return_inner_v,
+            num_tasks,
+            stop_gradients,
+        )
     if batched:
         return _train_tasks_batched(
             batch,
@@ -413,6 +539,7 @@ def fomaml_step(
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
     batched: bool = True,
+    vectorized: bool = False,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -456,6 +583,15 @@ def fomaml_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to adapt all tasks at once, with the variables of all tasks stacked
+        along a leading task axis. The cost functions and variables are the same as
+        with ``batched=False``, and each cost function is vectorized across the tasks
+        with ``ivy.vmap`` on the jax and torch backends. On other backends the cost
+        functions are still called once per task in a Python loop, and only the
+        gradient computation is shared, with each inner step taking a single gradient
+        computation for all tasks. Takes precedence over ``batched``. Default is
+        ``False``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -509,6 +645,7 @@ def fomaml_step(
         return_inner_v,
         num_tasks,
         stop_gradients,
+        vectorized,
     )
     cost = rets[0]
     if stop_gradients:
@@ -534,6 +671,7 @@ def reptile_step(
     *,
     inner_optimization_step: Callable = gradient_descent_update,
     batched: bool = True,
+    vectorized: bool = False,
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
@@ -559,6 +697,15 @@ def reptile_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to adapt all tasks at once, with the variables of all tasks stacked
+        along a leading task axis. The cost functions and variables are the same as
+        with ``batched=False``, and each cost function is vectorized across the tasks
+        with ``ivy.vmap`` on the jax and torch backends. On other backends the cost
+        functions are still called once per task in a Python loop, and only the
+        gradient computation is shared, with each inner step taking a single gradient
+        computation for all tasks. Takes precedence over ``batched``. Default is
+        ``False``.
     return_inner_v
         Either 'first', 'all', or False. 'first' means the variables for the first task
         inner loop will also be returned. variables for all tasks will be returned with
@@ -598,6 +745,7 @@ def reptile_step(
         return_inner_v,
         num_tasks,
         stop_gradients,
+        vectorized,
     )
     cost = rets[0]
     if stop_gradients:
@@ -630,6 +778,7 @@ def maml_step(
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
     batched: bool = True,
+    vectorized: bool = False,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -672,6 +821,15 @@ def maml_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to adapt all tasks at once, with the variables of all tasks stacked
+        along a leading task axis. The cost functions and variables are the same as
+        with ``batched=False``, and each cost function is vectorized across the tasks
+        with ``ivy.vmap`` on the jax and torch backends. On other backends the cost
+        functions are still called once per task in a Python loop, and only the
+        gradient computation is shared, with each inner step taking a single gradient
+        computation for all tasks. Takes precedence over ``batched``. Default is
+        ``False``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -724,6 +882,7 @@ def maml_step(
             return_inner_v,
             num_tasks,
             False,
+            vectorized,
         ),
         variables.cont_at_key_chains(outer_v, ignore_none=True)
         if keep_outer_v
@@ -1,2 +1,9 @@
 # local
 from .nested_array import NestedArray
+from .bucketing import (
+    LengthBucket,
+    bucket_by_length,
+    bucket_stream,
+    restore_order,
+    padding_efficiency,
+)
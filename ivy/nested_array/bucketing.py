@@ -0,0 +1,184 @@
+# global
+import math
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Sequence, Union
+
+# local
+import ivy
+from .nested_array import NestedArray
+
+
+LengthBucket = namedtuple("LengthBucket", ["padded", "mask", "indices"])
+LengthBucket.__doc__ = """Rows of similar length, padded to the longest of them.
+
+padded holds the rows stacked along the first axis, mask flags the elements which
+belong to the rows, and indices gives the position of every row in the original order.
+"""
+
+
+def bucket_by_length(
+    x: NestedArray,
+    bucket_boundaries: Sequence[int],
+    /,
+    *,
+    pad_value: Union[int, float] = 0,
+) -> List[LengthBucket]:
+    """
+    Group the rows of a nested array into buckets by their length along the first
+    dimension, and pad every bucket only to the longest of its own rows.
+
+    Parameters
+    ----------
+    x
+        nested array to split into buckets.
+    bucket_boundaries
+        increasing row lengths at which a new bucket starts, such that the boundaries
+        [8, 32] give the buckets of lengths [0, 8), [8, 32) and [32, inf).
+    pad_value
+        value of the padded elements. Default is ``0``.
+
+    Returns
+    -------
+    ret
+        the non-empty buckets, in increasing order of length.
+
+    Examples
+    --------
+    >>> x = ivy.NestedArray.nested_array([ivy.ones(2), ivy.ones(9), ivy.ones(3)])
+    >>> buckets = ivy.bucket_by_length(x, [8])
+    >>> print([tuple(bucket.padded.shape) for bucket in buckets])
+    [(2, 3), (1, 9)]
+    >>> print(buckets[0].indices)
+    ivy.array([0, 2])
+    """
+    lengths = x.row_shapes[:, 0]
+    bucket_ids = ivy.searchsorted(
+        ivy.array(bucket_boundaries, dtype=lengths.dtype), lengths, side="right"
+    )
+    buckets = []
+    for bucket_id in ivy.unique_values(bucket_ids).to_list():
+        indices = ivy.nonzero(bucket_ids == bucket_id)[0]
+        padded, mask = x[indices].to_padded(pad_value=pad_value)
+        buckets.append(LengthBucket(padded, mask, indices))
+    return buckets
+
+
+def bucket_stream(
+    rows: Iterable[Union[ivy.Array, ivy.NativeArray]],
+    bucket_boundaries: Sequence[int],
+    batch_size: int,
+    /,
+    *,
+    pad_value: Union[int, float] = 0,
+) -> Iterator[LengthBucket]:
+    """
+    Group a stream of rows into buckets by their length along the first dimension,
+    yielding each bucket as soon as it holds batch_size rows, and the partly filled
+    buckets once the stream is exhausted.
+
+    Parameters
+    ----------
+    rows
+        iterable of arrays, with the same number of dimensions.
+    bucket_boundaries
+        increasing row lengths at which a new bucket starts.
+    batch_size
+        number of rows in a full bucket.
+    pad_value
+        value of the padded elements. Default is ``0``.
+
+    Returns
+    -------
+    ret
+        generator of buckets, whose indices are the positions of the rows in the
+        stream.
+
+    Examples
+    --------
+    >>> rows = (ivy.ones(n) for n in [2, 9, 3, 12])
+    >>> for bucket in ivy.bucket_stream(rows, [8], 2):
+    ...     print(bucket.indices)
+    ivy.array([0, 2])
+    ivy.array([1, 3])
+    """
+    pending = [([], []) for _ in range(len(bucket_boundaries) + 1)]
+
+    def _emit(bucket_rows, bucket_indices):
+        padded, mask = NestedArray.nested_array(bucket_rows).to_padded(
+            pad_value=pad_value
+        )
+        return LengthBucket(padded, mask, ivy.array(bucket_indices, dtype="int64"))
+
+    for index, row in enumerate(rows):
+        length = row.shape[0]
+        bucket_rows, bucket_indices = pending[
+            sum(boundary <= length for boundary in bucket_boundaries)
+        ]
+        bucket_rows.append(row)
+        bucket_indices.append(index)
+        if len(bucket_rows) == batch_size:
+            yield _emit(bucket_rows, bucket_indices)
+            bucket_rows.clear()
+            bucket_indices.clear()
+    for bucket_rows, bucket_indices in pending:
+        if bucket_rows:
+            yield _emit(bucket_rows, bucket_indices)
+
+
+def restore_order(
+    outputs: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    buckets: Sequence[LengthBucket],
+    /,
+) -> ivy.Array:
+    """
+    Put the outputs computed for every bucket back into the original order of the
+    rows.
+
+    Parameters
+    ----------
+    outputs
+        one array per bucket, whose first axis runs over the rows of the bucket.
+    buckets
+        the buckets the outputs were computed from.
+
+    Returns
+    -------
+    ret
+        the outputs of all rows, concatenated along the first axis in their original
+        order.
+
+    Examples
+    --------
+    >>> x = ivy.NestedArray.nested_array([ivy.ones(2), ivy.ones(9), ivy.ones(3)])
+    >>> buckets = ivy.bucket_by_length(x, [8])
+    >>> print(ivy.restore_order([ivy.sum(b.padded, axis=1) for b in buckets], buckets))
+    ivy.array([2., 9., 3.])
+    """
+    indices = ivy.concat([bucket.indices for bucket in buckets])
+    return ivy.gather(ivy.concat(outputs), ivy.argsort(indices), axis=0)
+
+
+def padding_efficiency(buckets: Sequence[LengthBucket], /) -> float:
+    """
+    Get the share of the elements of padded buckets which belong to the rows, rather
+    than to the padding.
+
+    Parameters
+    ----------
+    buckets
+        buckets as returned by ``bucket_by_length`` or ``bucket_stream``.
+
+    Returns
+    -------
+    ret
+        real elements divided by padded elements, which is 1.0 without any padding.
+
+    Examples
+    --------
+    >>> x = ivy.NestedArray.nested_array([ivy.ones(2), ivy.ones(9), ivy.ones(3)])
+    >>> print(round(ivy.padding_efficiency(ivy.bucket_by_length(x, [8])), 3))
+    0.933
+    """
+    real = sum(int(ivy.sum(ivy.astype(bucket.mask, "int64"))) for bucket in buckets)
+    padded = sum(math.prod(bucket.mask.shape) for bucket in buckets)
+    return real / padded if padded else 1.0
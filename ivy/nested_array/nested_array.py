@@ -1,5 +1,7 @@
 # global
 import abc
+import math
+import operator
 from typing import List
 
 # local
@@ -7,16 +9,26 @@ import ivy
 
 
 class NestedArray(abc.ABC):
-    """Base class for nested array objects."""
+    """
+    Base class for nested array objects.
 
-    def __init__(self, data, dtype, device, internal=False):
+    The rows are stored packed: the elements of every row, flattened, are held one row
+    after the other in a single values buffer, and row_splits gives the offsets at
+    which each row starts and ends, such that operations apply to the whole buffer at
+    once rather than row by row. The shape of every row is kept in row_shapes.
+    """
+
+    def __init__(self, values, row_splits, row_shapes, dtype, device, internal=False):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
-        self._data = data
+        self._values = values
+        self._row_splits = row_splits
+        self._row_shapes = row_shapes
+        self._row_ids = None
         self._shape = self._generate_shape()
         self._dtype = dtype
         self._device = device
@@ -29,86 +41,303 @@ class NestedArray(abc.ABC):
         if ivy.is_ivy_array(data):
             data = [data]
         elif isinstance(data, (list, tuple)):
-            data = ivy.to_ivy(data)
+            data = [ivy.array(row) if not ivy.is_array(row) else row for row in data]
         elif ivy.is_native_array(data):
             data = [ivy.to_ivy(data)]
         elif isinstance(data, cls):
-            data = data._data
+            return cls._from_packed(
+                ivy.to_device(ivy.astype(data._values, dtype), device),
+                data._row_splits,
+                data._row_shapes,
+            )
         else:
             raise TypeError(
                 "Input data must be ivy.Array, ivy.NativeArray"
                 " or a list of either, got: {}".format(type(data))
             )
-        for i in range(len(data)):
-            data[i] = ivy.astype(data[i], dtype)
-            data[i] = ivy.to_device(data[i], device)
-        return cls(data, dtype, device, internal=True)
+        ndims = [len(row.shape) for row in data]
+        if ndims.count(ndims[0]) != len(ndims):
+            raise RuntimeError(
+                "All arrays in a nested array must have the same number of dimensions."
+            )
+        sizes = [math.prod(row.shape) for row in data]
+        values = ivy.concat([ivy.reshape(row, (-1,)) for row in data])
+        # the dtype and device are set once for the whole buffer
+        values = ivy.to_device(ivy.astype(values, dtype), device)
+        return cls._from_packed(
+            values,
+            ivy.cumsum(ivy.array([0] + sizes, dtype="int64", device=device)),
+            ivy.array(
+                [list(row.shape) for row in data], dtype="int64", device=device
+            ).reshape((len(data), ndims[0])),
+        )
+
+    @classmethod
+    def _from_packed(cls, values, row_splits, row_shapes):
+        return cls(
+            values,
+            row_splits,
+            row_shapes,
+            values.dtype,
+            ivy.dev(values),
+            internal=True,
+        )
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        values = ivy.array(values)
+        row_lengths = ivy.array(row_lengths, dtype="int64")
+        inner_shape = list(values.shape[1:])
+        inner_size = math.prod(inner_shape)
+        # every row is a slice of the values along the first axis
+        row_splits = ivy.concat(
+            [ivy.zeros((1,), dtype="int64"), ivy.cumsum(row_lengths * inner_size)]
+        )
+        row_shapes = ivy.concat(
+            [
+                ivy.expand_dims(row_lengths, axis=-1),
+                ivy.tile(
+                    ivy.array([inner_shape], dtype="int64"), (row_lengths.shape[0], 1)
+                ),
+            ],
+            axis=-1,
+        )
+        return cls._from_packed(ivy.reshape(values, (-1,)), row_splits, row_shapes)
 
     @classmethod
     def from_row_split(cls, values, row_split):
-        row_lengths = list()
-        for i in range(1, len(row_split)):
-            row_lengths.append(row_split[i] - row_split[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
+        row_split = ivy.array(row_split, dtype="int64")
+        return cls.from_row_lengths(values, row_split[1:] - row_split[:-1])
+
+    @classmethod
+    def from_padded(cls, padded, mask):
+        """
+        Build a nested array from a padded dense array and a boolean mask of the same
+        shape, which selects a block at the start of each row, as returned by
+        ``to_padded``.
+        """
+        padded = ivy.array(padded)
+        mask = ivy.array(mask, dtype="bool")
+        # argwhere visits the elements row by row, in the order of the packed values
+        values = ivy.gather_nd(padded, ivy.argwhere(mask))
+        row_sizes = ivy.sum(ivy.reshape(mask, (mask.shape[0], -1)), axis=-1)
+        row_splits = ivy.concat(
+            [ivy.zeros((1,), dtype="int64"), ivy.cumsum(ivy.astype(row_sizes, "int64"))]
+        )
+        # the extent of each row along a dimension is how many of its slices are used
+        ndim = len(mask.shape)
+        row_shapes = ivy.stack(
+            [
+                ivy.sum(
+                    ivy.any(mask, axis=tuple(a for a in range(1, ndim) if a != axis))
+                    if ndim > 2
+                    else mask,
+                    axis=-1,
+                )
+                for axis in range(1, ndim)
+            ],
+            axis=-1,
+        )
+        return cls._from_packed(values, row_splits, ivy.astype(row_shapes, "int64"))
 
     def _generate_shape(
         self,
     ):
-        final_shape = [len(self._data)]
-        shapes = list()
-        ndims = list()
-        for arr in self._data:
-            shapes.append(arr.shape)
-            ndims.append(arr.ndim)
-        if ndims.count(ndims[0]) != len(ndims):
-            raise RuntimeError(
-                "All arrays in a nested array must have the same number of dimensions."
-            )
-        for i in range(ndims[0]):
-            same_shape = True
-            current_shape = shapes[0][i]
-            for j in range(final_shape[0]):
-                if shapes[j][i] != current_shape:
-                    same_shape = False
-                    break
-            if same_shape:
-                final_shape.append(current_shape)
-            else:
-                final_shape.append(None)
+        num_rows, ndim = self._row_shapes.shape
+        final_shape = [num_rows]
+        if num_rows == 0:
+            return final_shape + [None] * ndim
+        same_shape = ivy.all(self._row_shapes == self._row_shapes[:1], axis=0)
+        for same, size in zip(same_shape.to_list(), self._row_shapes[0].to_list()):
+            final_shape.append(size if same else None)
         return final_shape
 
+    def _row_sizes(self):
+        return self._row_splits[1:] - self._row_splits[:-1]
+
+    def _get_row_ids(self):
+        # the row of every packed value, which is cached as most operations use it
+        if self._row_ids is None:
+            self._row_ids = ivy.repeat(
+                ivy.arange(self._shape[0], dtype="int64"), self._row_sizes()
+            )
+        return self._row_ids
+
+    def _with_values(self, values):
+        ret = self._from_packed(values, self._row_splits, self._row_shapes)
+        ret._row_ids = self._row_ids
+        return ret
+
     def unbind(self):
-        return tuple(self._data)
+        if self._shape[0] == 0:
+            return ()
+        rows = ivy.split(
+            self._values, num_or_size_splits=self._row_sizes().to_list(), axis=0
+        )
+        return tuple(
+            ivy.reshape(row, shape)
+            for row, shape in zip(rows, self._row_shapes.to_list())
+        )
 
     def reshape(self, shape):
         assert shape[0] == self._shape[0], "batch dimension is not changeable"
-        for i in range(0, shape[0]):
-            new_shape = list()
-            for j in range(1, len(shape)):
-                if shape[j] == -1:
-                    new_shape.append(self._data[i].shape[j - 1])
-                else:
-                    new_shape.append(shape[j])
-            self._data[i] = self._data[i].reshape(new_shape)
-            print(self._data[i].shape)
+        new_shapes = list()
+        for j in range(1, len(shape)):
+            if shape[j] == -1:
+                new_shapes.append(self._row_shapes[:, j - 1])
+            else:
+                new_shapes.append(ivy.full((shape[0],), shape[j], dtype="int64"))
+        row_shapes = ivy.stack(new_shapes, axis=-1)
+        assert ivy.all(
+            ivy.prod(row_shapes, axis=-1) == self._row_sizes()
+        ), "the new shape must keep the number of elements of every row"
+        # the packed values are unchanged, only the shapes of the rows are
+        self._row_shapes = row_shapes
         self._shape = self._generate_shape()
         return self
 
+    def to_padded(self, pad_value=0):
+        """
+        Convert to a dense array, padding every row to the largest size along each
+        dimension, along with a boolean mask of the elements which belong to the rows.
+        """
+        num_rows, ndim = self._row_shapes.shape
+        max_shape = ivy.max(self._row_shapes, axis=0).to_list() if num_rows else []
+        row_ids = self._get_row_ids()
+        # position of every value within its row, unravelled with the shape of its row
+        offsets = ivy.arange(self._values.shape[0], dtype="int64") - ivy.gather(
+            self._row_splits, row_ids
+        )
+        shapes = ivy.gather(self._row_shapes, row_ids, axis=0)
+        strides = ivy.flip(
+            ivy.cumprod(ivy.flip(shapes, axis=-1), axis=-1, exclusive=True), axis=-1
+        )
+        indices = ivy.concat(
+            [
+                ivy.expand_dims(row_ids, axis=-1),
+                (ivy.expand_dims(offsets, axis=-1) // strides) % shapes,
+            ],
+            axis=-1,
+        )
+        shape = [num_rows] + max_shape
+        mask = ivy.scatter_nd(
+            indices, ivy.ones_like(offsets, dtype="bool"), shape, reduction="replace"
+        )
+        padded = ivy.scatter_nd(indices, self._values, shape, reduction="replace")
+        if pad_value != 0:
+            padded = ivy.where(mask, padded, ivy.array(pad_value, dtype=self._dtype))
+        return padded, mask
+
+    def bucket_by_length(self, bucket_boundaries, pad_value=0):
+        return ivy.bucket_by_length(self, bucket_boundaries, pad_value=pad_value)
+
+    # Row Reductions #
+    # -------------- #
+
+    def _reduce_rows(self, reduction, initial):
+        dtype = self._values.dtype
+        out = ivy.full((self._shape[0],), _cast_scalar(initial, dtype), dtype=dtype)
+        return ivy.scatter_nd(
+            ivy.expand_dims(self._get_row_ids(), axis=-1),
+            self._values,
+            reduction=reduction,
+            out=out,
+        )
+
+    def sum(self):
+        """Sum of the elements of every row."""
+        return self._reduce_rows("sum", 0)
+
+    def mean(self):
+        """Mean of the elements of every row."""
+        return self.sum() / ivy.astype(self._row_sizes(), self._values.dtype)
+
+    def max(self):
+        """Maximum of the elements of every row, the lowest value for empty rows."""
+        return self._reduce_rows("max", _lowest(self._values.dtype))
+
+    def min(self):
+        """Minimum of the elements of every row, the highest value for empty rows."""
+        return self._reduce_rows("min", _highest(self._values.dtype))
+
+    # Elementwise Operations #
+    # ---------------------- #
+
+    def _elementwise(self, fn, other, reverse=False):
+        if isinstance(other, NestedArray):
+            assert ivy.array_equal(
+                self._row_shapes, other._row_shapes
+            ), "nested arrays must have the same row shapes"
+            other = other._values
+        args = (other, self._values) if reverse else (self._values, other)
+        return self._with_values(fn(*args))
+
+    def __add__(self, other):
+        return self._elementwise(operator.add, other)
+
+    def __radd__(self, other):
+        return self._elementwise(operator.add, other, reverse=True)
+
+    def __sub__(self, other):
+        return self._elementwise(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._elementwise(operator.sub, other, reverse=True)
+
+    def __mul__(self, other):
+        return self._elementwise(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._elementwise(operator.mul, other, reverse=True)
+
+    def __truediv__(self, other):
+        return self._elementwise(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._elementwise(operator.truediv, other, reverse=True)
+
+    def __pow__(self, other):
+        return self._elementwise(operator.pow, other)
+
+    def __neg__(self):
+        return self._with_values(-self._values)
+
+    def __abs__(self):
+        return self._with_values(ivy.abs(self._values))
+
+    def astype(self, dtype):
+        return self._with_values(ivy.astype(self._values, dtype))
+
+    def to_device(self, device):
+        return self._from_packed(
+            ivy.to_device(self._values, device),
+            ivy.to_device(self._row_splits, device),
+            ivy.to_device(self._row_shapes, device),
+        )
+
     # Properties #
     # ---------- #
 
     @property
-    def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
-        return self._data
+    def data(self) -> List[ivy.Array]:
+        """The rows of the nested array."""
+        return list(self.unbind())
+
+    @property
+    def values(self) -> ivy.Array:
+        """The flattened elements of all rows, packed one row after the other."""
+        return self._values
+
+    @property
+    def row_splits(self) -> ivy.Array:
+        """The offsets in values at which every row starts, followed by the size of
+        values."""
+        return self._row_splits
+
+    @property
+    def row_shapes(self) -> ivy.Array:
+        """The shape of every row."""
+        return self._row_shapes
 
     @property
     def dtype(self) -> ivy.Dtype:
@@ -134,11 +363,59 @@ class NestedArray(abc.ABC):
     # ----------#
 
     def __repr__(self):
+        rows = self.unbind()
         arrays_repr = "\t"
         for i in range(self._shape[0] - 1):
-            arrays_repr += repr(self._data[i]) + "\n\t"
-        arrays_repr += repr(self._data[-1])
+            arrays_repr += repr(rows[i]) + "\n\t"
+        arrays_repr += repr(rows[-1])
         return self._pre_repr + self.__class__.__name__ + "([\n" + arrays_repr + "\n])"
 
     def __getitem__(self, query):
-        return self._data[query]
+        if isinstance(query, int):
+            query = query % self._shape[0]
+            start, end = self._row_splits[query : query + 2].to_list()
+            return ivy.reshape(
+                self._values[start:end], self._row_shapes[query].to_list()
+            )
+        if isinstance(query, slice):
+            rows = ivy.arange(*query.indices(self._shape[0]), dtype="int64")
+        else:
+            rows = ivy.array(query, dtype="int64") % self._shape[0]
+        # the values of the selected rows are gathered in a single call
+        sizes = ivy.gather(self._row_sizes(), rows)
+        row_splits = ivy.concat([ivy.zeros((1,), dtype="int64"), ivy.cumsum(sizes)])
+        shifts = ivy.gather(self._row_splits, rows) - row_splits[:-1]
+        positions = ivy.arange(int(row_splits[-1]), dtype="int64") + ivy.repeat(
+            shifts, sizes
+        )
+        return self._from_packed(
+            ivy.gather(self._values, positions),
+            row_splits,
+            ivy.gather(self._row_shapes, rows, axis=0),
+        )
+
+
+def _cast_scalar(value, dtype):
+    if ivy.is_float_dtype(dtype):
+        return float(value)
+    if ivy.is_int_dtype(dtype):
+        return int(value)
+    if ivy.is_complex_dtype(dtype):
+        return complex(value)
+    return bool(value)
+
+
+def _lowest(dtype):
+    if ivy.is_float_dtype(dtype):
+        return -float("inf")
+    if ivy.is_int_dtype(dtype):
+        return ivy.iinfo(dtype).min
+    return False
+
+
+def _highest(dtype):
+    if ivy.is_float_dtype(dtype):
+        return float("inf")
+    if ivy.is_int_dtype(dtype):
+        return ivy.iinfo(dtype).max
+    return True
@@ -1,7 +1,9 @@
-"""Base class for helper module methods"""
+"""Base class for helper module methods, and the flat variable layout shared by
+modules and optimizers"""
 
 # global
 import abc
+import math
 import numpy as np
 import termcolor
 
@@ -9,6 +11,111 @@ import termcolor
 import ivy
 
 
+# Flat Layout #
+# ------------#
+
+
+class _FlatGroup:
+    def __init__(self, idxs, sizes):
+        self.idxs = idxs
+        self.sizes = sizes
+        self._segment_ids = None
+
+    @property
+    def segment_ids(self):
+        # index of the leaf each element of the flat buffer belongs to, used for
+        # per-leaf reductions over the buffer
+        if self._segment_ids is None:
+            self._segment_ids = ivy.repeat(
+                ivy.arange(len(self.sizes), dtype="int64"), self.sizes
+            )
+        return self._segment_ids
+
+
+class FlatLayout:
+    def __init__(self, signature, config):
+        """Layout of the leaves of a container within one contiguous flat buffer
+        per dtype, or per dtype and device.
+
+        Parameters
+        ----------
+        signature
+            Tuple of the key chain, shape and group of each leaf, where the group
+            is either the dtype, or a tuple of the dtype and device.
+        config
+            Config of the containers rebuilt from the flat buffers.
+
+        """
+        self.signature = signature
+        self.key_chains = [kc for kc, _, _ in signature]
+        self.shapes = [shape for _, shape, _ in signature]
+        self._config = config
+        groups = dict()
+        for i, (_, shape, dtype) in enumerate(signature):
+            groups.setdefault(dtype, list()).append(i)
+        self.groups = {
+            dtype: _FlatGroup(idxs, [math.prod(self.shapes[i]) for i in idxs])
+            for dtype, idxs in groups.items()
+        }
+
+    def flatten(self, leaves):
+        """Concatenate the flattened leaves of each dtype into one buffer."""
+        return {
+            dtype: ivy.concat([ivy.reshape(leaves[i], (-1,)) for i in group.idxs])
+            for dtype, group in self.groups.items()
+        }
+
+    def flatten_container(self, cont):
+        """Gather the leaves of a container at the key chains of the layout, and
+        concatenate them into one buffer per dtype."""
+        return self.flatten([cont.cont_at_key_chain(kc) for kc in self.key_chains])
+
+    def unflatten(self, buffers):
+        """Split the flat buffers back into a container of leaves, which are views
+        of the buffers wherever the backend supports it."""
+        leaves = [None] * len(self.key_chains)
+        for dtype, group in self.groups.items():
+            chunks = ivy.split(buffers[dtype], num_or_size_splits=group.sizes)
+            for i, chunk in zip(group.idxs, chunks):
+                leaves[i] = ivy.reshape(chunk, self.shapes[i])
+        dict_in = dict()
+        for kc, leaf in zip(self.key_chains, leaves):
+            *keys, key = kc.split("/")
+            sub_dict = dict_in
+            for k in keys:
+                sub_dict = sub_dict.setdefault(k, dict())
+            sub_dict[key] = leaf
+        return ivy.Container(dict_in, **self._config)
+
+    def segment_sum(self, dtype, x):
+        """Sum the elements of a flat buffer which belong to each leaf."""
+        group = self.groups[dtype]
+        return ivy.scatter_flat(
+            group.segment_ids, x, size=len(group.sizes), reduction="sum"
+        )
+
+    def expand(self, dtype, x):
+        """Broadcast one value per leaf to every element of the leaf."""
+        return ivy.gather(x, self.groups[dtype].segment_ids)
+
+
+def container_signature(cont, with_device=False):
+    # leaves are grouped by dtype, and also by device if with_device is set
+    leaves = list()
+    signature = list()
+    for kc, leaf in cont.cont_to_iterator():
+        leaves.append(leaf)
+        group = str(leaf.dtype)
+        if with_device:
+            group = (group, ivy.dev(leaf))
+        signature.append((kc, tuple(leaf.shape), group))
+    return tuple(signature), leaves
+
+
+# Module Helpers #
+# ---------------#
+
+
 class ModuleHelpers(abc.ABC):
     # Private #
     # --------#
@@ -204,6 +311,13 @@ class ModuleHelpers(abc.ABC):
             if ivy.exists(expected_submod_rets)
             else expected_submod_rets
         )
+        self._submod_tracking = bool(
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(submod_depth)
+            or ivy.exists(submods_to_track)
+            or ivy.exists(expected_submod_rets)
+        )
 
     def _unset_submod_flags(self):
         """Unset flags of the submodule."""
@@ -212,6 +326,7 @@ class ModuleHelpers(abc.ABC):
         self._submods_to_track = None
         self._track_submod_call_order = False
         self.expected_submod_rets = None
+        self._submod_tracking = False
 
     def get_mod_key(self, /, *, top_mod=None):
         """
@@ -192,6 +192,156 @@ class Dropout(Module):
 # ----------#
 
 
+class KVCache:
+    def __init__(
+        self,
+        batch_size,
+        max_length,
+        feat_dim,
+        /,
+        *,
+        device=None,
+        dtype=None,
+    ):
+        """
+        Cache of the attention keys and values of the tokens seen so far, for
+        incremental decoding. The keys and values are held in preallocated ring
+        buffers, so each call only projects and appends the new tokens. Once a
+        sequence holds more than max_length tokens, its oldest tokens are
+        overwritten, and the tokens are then appended one at a time.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences decoded together.
+        max_length
+            The number of tokens held for each sequence.
+        feat_dim
+            The dimension of the keys and values, across all heads.
+        device
+            device on which to create the buffers 'cuda:0', 'cuda:1', 'cpu' etc.
+            Default is cpu.
+        dtype
+            the data type of the keys and values. Default is ``None``.
+        """
+        self._max_length = max_length
+        self.keys = ivy.zeros(
+            (batch_size, max_length, feat_dim), device=device, dtype=dtype
+        )
+        self.values = ivy.zeros(
+            (batch_size, max_length, feat_dim), device=device, dtype=dtype
+        )
+        # position in its sequence of the token held in each slot, -1 when empty
+        self.positions = ivy.full(
+            (batch_size, max_length), -1, dtype="int64", device=device
+        )
+        # number of tokens seen so far by each sequence
+        self.offsets = ivy.zeros((batch_size,), dtype="int64", device=device)
+
+    def update(self, keys, values):
+        """
+        Append the keys and values of new tokens to each sequence, at its own offset.
+
+        Parameters
+        ----------
+        keys
+            The keys of the new tokens *[batch_size,num_new,feat_dim]*.
+        values
+            The values of the new tokens *[batch_size,num_new,feat_dim]*.
+
+        Returns
+        -------
+        ret
+            The cached keys and values *[batch_size,max_length,feat_dim]*, and the
+            mask of the cached tokens each new token attends to, which are those up
+            to and including itself *[batch_size,num_new,max_length]*.
+        """
+        batch_size, num_new = keys.shape[:2]
+        if num_new > self._max_length:
+            raise ivy.utils.exceptions.IvyException(
+                "cannot append {} tokens to a cache of length {}".format(
+                    num_new, self._max_length
+                )
+            )
+        # the new tokens are all written before their mask is built, so a chunk which
+        # wraps around the buffers would overwrite the tokens its earlier queries
+        # attend to, whereas a single token only overwrites one out of its reach
+        if num_new > 1 and ivy.any(self.offsets + num_new > self._max_length):
+            raise ivy.utils.exceptions.IvyException(
+                "cannot append {} tokens at once past the cache length of {}, they "
+                "must be appended one at a time".format(num_new, self._max_length)
+            )
+        device = ivy.dev(self.keys)
+
+        # BS x N
+        query_positions = ivy.expand_dims(self.offsets, axis=-1) + ivy.arange(
+            num_new, dtype="int64", device=device
+        )
+        slots = query_positions % self._max_length
+        batch_indices = ivy.broadcast_to(
+            ivy.expand_dims(
+                ivy.arange(batch_size, dtype="int64", device=device), axis=-1
+            ),
+            slots.shape,
+        )
+        # (BSxN) x 2
+        indices = ivy.reshape(ivy.stack([batch_indices, slots], axis=-1), (-1, 2))
+        feat_dim = self.keys.shape[-1]
+        self.keys = ivy.scatter_nd(
+            indices,
+            ivy.reshape(ivy.astype(keys, self.keys.dtype), (-1, feat_dim)),
+            reduction="replace",
+            out=self.keys,
+        )
+        self.values = ivy.scatter_nd(
+            indices,
+            ivy.reshape(ivy.astype(values, self.values.dtype), (-1, feat_dim)),
+            reduction="replace",
+            out=self.values,
+        )
+        self.positions = ivy.scatter_nd(
+            indices,
+            ivy.reshape(query_positions, (-1,)),
+            reduction="replace",
+            out=self.positions,
+        )
+        self.offsets = self.offsets + num_new
+
+        # BS x N x L
+        slot_positions = ivy.expand_dims(self.positions, axis=-2)
+        mask = ivy.logical_and(
+            slot_positions >= 0,
+            slot_positions <= ivy.expand_dims(query_positions, axis=-1),
+        )
+        return self.keys, self.values, mask
+
+    def truncate(self, lengths):
+        """
+        Drop the tokens of each sequence past the given length, such as the padding
+        of a batch of prompts of different lengths, so that the following tokens of
+        each sequence are appended straight after its last token.
+
+        Parameters
+        ----------
+        lengths
+            The number of tokens to keep for each sequence *[batch_size]*.
+        """
+        lengths = ivy.astype(
+            ivy.asarray(lengths, device=ivy.dev(self.offsets)), "int64"
+        )
+        self.positions = ivy.where(
+            self.positions < ivy.expand_dims(lengths, axis=-1),
+            self.positions,
+            ivy.full_like(self.positions, -1),
+        )
+        self.offsets = ivy.minimum(self.offsets, lengths)
+
+    def reset(self):
+        """Empty the cache, for decoding new sequences."""
+        self.positions = ivy.full_like(self.positions, -1)
+        self.offsets = ivy.zeros_like(self.offsets)
+
+
 class MultiHeadAttention(Module):
     def __init__(
         self,
@@ -267,6 +417,7 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._kv_cache = None
         ivy.Module.__init__(
             self,
             device=device,
@@ -320,7 +471,34 @@ class MultiHeadAttention(Module):
         else:
             return {}
 
-    def _forward(self, inputs, context=None, mask=None):
+    def init_kv_cache(self, batch_size, max_length, /):
+        """
+        Create a cache of the keys and values of this layer, which is then used by
+        each call until cleared, for incremental decoding.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences decoded together.
+        max_length
+            The number of tokens held for each sequence.
+
+        Returns
+        -------
+        ret
+            The new :class:`KVCache`.
+        """
+        feat_dim = self._inner_dim if self._with_to_kv_fn else self._context_dim // 2
+        self._kv_cache = KVCache(
+            batch_size, max_length, feat_dim, device=self._dev, dtype=self._dtype
+        )
+        return self._kv_cache
+
+    def clear_kv_cache(self):
+        """Stop caching the keys and values of this layer."""
+        self._kv_cache = None
+
+    def _forward(self, inputs, context=None, mask=None, kv_cache=None):
         """
         Perform forward pass of the MultiHeadAttention layer.
 
@@ -333,6 +511,10 @@ class MultiHeadAttention(Module):
             *[batch_shape,num_values,cont_feats]*.
         mask
             (Default value = None)
+        kv_cache
+            The :class:`KVCache` to append the keys and values of the context to, and
+            attend over. Default is ``None``, in which case the cache created by
+            ``init_kv_cache`` is used, if any.
 
         Returns
         -------
@@ -355,6 +537,7 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            kv_cache=ivy.default(kv_cache, self._kv_cache),
         )
 
 
@@ -1388,7 +1571,7 @@ class LSTM(Module):
         return {"input": input_weights, "recurrent": recurrent_weights}
 
     @handle_nestable
-    def _forward(self, inputs, initial_state=None):
+    def _forward(self, inputs, initial_state=None, lengths=None):
         """Perform forward pass of the LSTM layer.
 
         Parameters
@@ -1399,6 +1582,11 @@ class LSTM(Module):
             2-tuple of lists of the hidden states h and c for each layer,
             each of dimension *[batch_shape,out]*.
             Created internally if None. (Default value = None)
+        lengths
+            Lengths of the sequences *[batch_shape]*, for padded variable-length
+            inputs. The outputs past the end of each sequence are zero, and the
+            returned states are those at the last step of each sequence.
+            (Default value = None)
 
         Returns
         -------
@@ -1411,6 +1599,14 @@ class LSTM(Module):
             initial_state = self.get_initial_state(
                 inputs.shape[:-2], dtype=inputs.dtype
             )
+        if lengths is not None:
+            # selects the last step of each sequence, for the final hidden states
+            lengths = ivy.asarray(lengths)
+            last_steps = ivy.astype(
+                ivy.arange(inputs.shape[-2], device=ivy.dev(lengths))
+                == ivy.expand_dims(lengths - 1, axis=-1),
+                inputs.dtype,
+            )
         h_n_list = list()
         c_n_list = list()
         h_t = inputs
@@ -1421,12 +1617,15 @@ class LSTM(Module):
             self.v.recurrent.items(),
         ):
             h_t, c_n = ivy.lstm_update(
-                h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w
+                h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w, lengths=lengths
             )
-            h_n_list.append(h_t[..., -1, :])
+            if lengths is None:
+                h_n_list.append(h_t[..., -1, :])
+            else:
+                h_n_list.append(ivy.einsum("...t,...to->...o", last_steps, h_t))
             c_n_list.append(c_n)
         if not self._return_sequence:
-            h_t = h_t[..., -1, :]
+            h_t = h_n_list[-1]
         if not self._return_state:
             return h_t
         return h_t, (h_n_list, c_n_list)
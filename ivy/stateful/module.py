@@ -10,7 +10,7 @@ from typing import Optional, List, Tuple, Dict
 import ivy
 from ivy.data_classes.container import Container
 from ivy.func_wrapper import _get_first_array
-from ivy.stateful.helpers import ModuleHelpers
+from ivy.stateful.helpers import ModuleHelpers, FlatLayout, container_signature
 from ivy.stateful.converters import ModuleConverters
 
 
@@ -108,12 +108,11 @@ class Module(ModuleConverters, ModuleHelpers):
         self._submods_to_track = None
         self._track_submod_call_order = False
         self.expected_submod_rets = None
+        self._submod_tracking = False
         self.submod_dict = dict()
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # the tracking containers are only created once they are accessed
+        self._submod_rets = None
+        self._submod_call_order = None
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
@@ -121,6 +120,10 @@ class Module(ModuleConverters, ModuleHelpers):
         self._module_graph = None
         self._target = None
         self._lazy_compiled = False
+        self._checkpoint_activations = False
+        self._flat_layout = None
+        self._flat_buffers = None
+        self._flat_views = None
         if build_mode != "on_init":
             return
         self.build(*args, dynamic_backend=dynamic_backend, **kwargs)
@@ -393,9 +396,11 @@ class Module(ModuleConverters, ModuleHelpers):
         ret
             Result of the forward pass of the layer.
         """
+        if not (ivy.exists(self.top_mod) and self.top_mod()._submod_tracking):
+            return self._forward_maybe_checkpointed(*args, **kwargs)
         if self.track_submod_call_order():
             self._add_submod_enter()
-        ret = self._forward(*args, **kwargs)
+        ret = self._forward_maybe_checkpointed(*args, **kwargs)
         track_submod_rets = self.track_submod_rets()
         check_submod_rets = self.check_submod_rets()
         if track_submod_rets or check_submod_rets:
@@ -404,6 +409,101 @@ class Module(ModuleConverters, ModuleHelpers):
             self._check_submod_ret()
         return ret
 
+    def _forward_maybe_checkpointed(self, *args, **kwargs):
+        """
+        Forward pass, with the activations checkpointed if this was enabled with
+        ``checkpoint_activations``.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        if self._checkpoint_activations:
+            return ivy.checkpoint(self._forward_with_v(self.v))(*args, **kwargs)
+        return self._forward(*args, **kwargs)
+
+    def _forward_with_v(self, v, /):
+        """
+        Bind the variables used by the forward pass, so that the forward pass can be
+        recomputed with the same variables after they have been restored.
+
+        Parameters
+        ----------
+        v
+            The variables to use for the forward pass.
+
+        Returns
+        -------
+        ret
+            The forward pass of the layer, with the variables bound.
+        """
+
+        def _forward(*args, **kwargs):
+            v_orig = self.v
+            self.v = v
+            try:
+                return self._forward(*args, **kwargs)
+            finally:
+                self.v = v_orig
+
+        return _forward
+
+    def _set_flat_v(self, layout, buffers, /):
+        """
+        Store the variables as views into the given flat buffers.
+
+        Parameters
+        ----------
+        layout
+            Layout of the variables within the flat buffers.
+        buffers
+            One contiguous buffer per dtype and device.
+        """
+        self._flat_layout = layout
+        self._flat_buffers = buffers
+        self.v = layout.unflatten(buffers)
+        self._flat_views = [self.v.cont_at_key_chain(kc) for kc in layout.key_chains]
+
+    def _sync_flat_v(self):
+        """
+        Move any variables which were replaced since the last synchronization, for
+        example by an optimizer step, back into the flat buffers. The layout is only
+        rebuilt if the structure, shapes, dtypes or devices of the variables changed.
+        """
+        if self._flat_layout is None:
+            raise ivy.utils.exceptions.IvyException(
+                "the variables of the module have not been flattened, "
+                "call flatten_variables first."
+            )
+        signature, leaves = container_signature(self.v, with_device=True)
+        if signature != self._flat_layout.signature:
+            layout = FlatLayout(signature, self.v.cont_config)
+            self._set_flat_v(layout, self._new_flat_buffers(layout, leaves))
+            return
+        changed = [
+            i
+            for i, (leaf, view) in enumerate(zip(leaves, self._flat_views))
+            if leaf is not view
+        ]
+        if not changed:
+            return
+        if ivy.inplace_arrays_supported():
+            # only the replaced variables are copied, straight into their views
+            for i in changed:
+                ivy.inplace_update(self._flat_views[i], leaves[i])
+            buffers = self._flat_buffers
+        else:
+            buffers = self._new_flat_buffers(self._flat_layout, leaves)
+        self._set_flat_v(self._flat_layout, buffers)
+
+    @staticmethod
+    def _new_flat_buffers(layout, leaves, /):
+        return {
+            group: ivy.stop_gradient(buffer)
+            for group, buffer in layout.flatten(leaves).items()
+        }
+
     def _call(self, *args, v=None, **kwargs):
         """
         The forward pass of the layer,
@@ -495,11 +595,23 @@ class Module(ModuleConverters, ModuleHelpers):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
-        with ivy.utils.backend.ContextManager("numpy") as backend:
-            self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
-            self.submod_call_order = ivy.Container(
-                alphabetical_keys=False, ivyh=backend
-            )
+        # reset the tracked values of any previous call
+        self._submod_rets = None
+        self._submod_call_order = None
+        if not (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(submod_depth)
+            or ivy.exists(submods_to_track)
+            or ivy.exists(expected_submod_rets)
+        ):
+            # fast path, without any submodule tracking
+            if self._submod_tracking:
+                self._unset_submod_flags()
+            if v is None:
+                return self._call(*args, **kwargs)
+            return self._call(*args, v=ivy.to_native(v), **kwargs)
+
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -514,21 +626,187 @@ class Module(ModuleConverters, ModuleHelpers):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def checkpoint_activations(self, enabled=True, /):
+        """
+        Enable or disable activation checkpointing for the forward pass of this
+        module. When enabled, the intermediate activations inside the module are not
+        kept for the backward pass, but recomputed when the gradients are computed,
+        trading extra compute for a lower peak memory. Can be enabled on any
+        submodule, such as each layer of a deep ``Sequential``.
+
+        Parameters
+        ----------
+        enabled
+            Whether to checkpoint the activations. Default is ``True``.
+
+        Returns
+        -------
+        ret
+            This module, to allow chaining.
+        """
+        self._checkpoint_activations = enabled
+        return self
+
+    def flatten_variables(self):
+        """
+        Store all variables of this module as views into one contiguous buffer per
+        dtype and device. Operations over the whole model, such as gradient
+        clipping, weight decay or moving averages, can then run on the flat buffers
+        given by ``flat_v``. The variables stay in the buffers when they are updated
+        in-place, and variables replaced by out-of-place updates, such as
+        ``self.v = optimizer.step(self.v, grads)``, are moved back into the buffers
+        the next time ``flat_v`` is accessed. Backends without in-place updates
+        rebuild the buffers instead, and their variables are copies rather than
+        views of the buffers.
+
+        Returns
+        -------
+        ret
+            This module, to allow chaining.
+        """
+        if not self._built:
+            raise ivy.utils.exceptions.IvyException(
+                "the module must be built before its variables can be flattened."
+            )
+        signature, leaves = container_signature(self.v, with_device=True)
+        layout = FlatLayout(signature, self.v.cont_config)
+        self._set_flat_v(layout, self._new_flat_buffers(layout, leaves))
+        return self
+
+    def flatten_like_v(self, x, /):
         """
-        Save the weights on the Module.
+        Flatten a container with the same structure as the variables, such as their
+        gradients, into buffers with the same layout as ``flat_v``.
+
+        Parameters
+        ----------
+        x
+            Container with the same key chains as the variables.
+
+        Returns
+        -------
+        ret
+            Dict of one flat buffer per dtype and device of the variables.
+        """
+        self._sync_flat_v()
+        return self._flat_layout.flatten_container(x)
+
+    def unflatten_like_v(self, buffers, /):
+        """
+        Split flat buffers with the same layout as ``flat_v`` back into a container
+        with the same structure as the variables.
+
+        Parameters
+        ----------
+        buffers
+            Dict of one flat buffer per dtype and device of the variables.
+
+        Returns
+        -------
+        ret
+            Container of views of the buffers, wherever the backend supports it.
+        """
+        self._sync_flat_v()
+        return self._flat_layout.unflatten(buffers)
+
+    def save_weights(
+        self,
+        weights_path,
+        /,
+        *,
+        sharded=False,
+        optimizer=None,
+        shard_size=None,
+        asynchronous=False,
+    ):
+        """
+        Save the weights on the Module, and optionally the state of an optimizer.
 
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The hdf5 file, or the checkpoint directory if ``sharded`` is set, for
+            saving the weights.
+        sharded
+            Whether to save a directory holding a sharded checkpoint, made of a json
+            index and raw array shards, which ``load_weights`` can memory-map,
+            rather than a single hdf5 file. Default is ``False``.
+        optimizer
+            Optimizer whose state and step count are saved along with the weights,
+            only supported for sharded checkpoints. Default is ``None``.
+        shard_size
+            Maximum size of each shard in bytes, unless a single array is larger.
+            Default is ``None``, for 1GB shards.
+        asynchronous
+            Whether to write the sharded checkpoint on a background thread. The
+            weights are copied before returning, so training can continue while the
+            write is in progress. Default is ``False``.
 
         Returns
         -------
-        None
+        ret
+            ``None``, or a ``concurrent.futures.Future`` which completes once the
+            checkpoint is written, if ``asynchronous`` is set.
+        """
+        if not sharded:
+            if ivy.exists(optimizer) or ivy.exists(shard_size) or asynchronous:
+                raise ivy.utils.exceptions.IvyException(
+                    "optimizer states, shard sizes and asynchronous saving are only "
+                    "supported for sharded checkpoints, set sharded=True to use them."
+                )
+            os.makedirs(os.path.dirname(weights_path) or ".", exist_ok=True)
+            self.v.cont_to_disk_as_hdf5(weights_path)
+            return None
+        checkpoint = {"v": self.v}
+        if ivy.exists(optimizer):
+            checkpoint["optimizer"] = {
+                "state": optimizer.state,
+                "step_count": optimizer._count,
+            }
+        return Container(checkpoint).cont_to_disk_as_shards(
+            weights_path, shard_size=shard_size, asynchronous=asynchronous
+        )
+
+    def load_weights(self, weights_path, /, *, optimizer=None, mmap_mode=True):
+        """
+        Load the weights saved by ``save_weights`` into the Module, and optionally
+        restore the state of an optimizer.
+
+        Parameters
+        ----------
+        weights_path
+            The hdf5 file or sharded checkpoint directory the weights were saved to.
+        optimizer
+            Optimizer whose state and step count are restored, if they were saved
+            with the weights. Default is ``None``.
+        mmap_mode
+            Whether to memory-map the shards of a sharded checkpoint rather than
+            reading them into memory, so that the weights are only read from disk
+            once they are used. With the numpy backend, the loaded weights are then
+            copy-on-write views of the mapped files. Default is ``True``.
+
+        Returns
+        -------
+        ret
+            The loaded weights, which are also set as the variables of the Module.
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        if not os.path.isdir(weights_path):
+            v = Container.cont_from_disk_as_hdf5(weights_path)
+        else:
+            checkpoint = Container.cont_from_disk_as_shards(
+                weights_path, mmap_mode=mmap_mode
+            )
+            # empty containers are not saved, so missing keys are restored as empty
+            v = checkpoint["v"] if "v" in checkpoint else Container()
+            if ivy.exists(optimizer) and "optimizer" in checkpoint:
+                saved = checkpoint.optimizer
+                optimizer.set_state(saved.state if "state" in saved else Container())
+                optimizer._count = saved.step_count
+        if self.v:
+            ivy.Container.cont_assert_identical_structure([self.v, v])
+            v = Container(v, **self.v.cont_config)
+        self.v = v
+        return self.v
 
     def build(
         self,
@@ -659,6 +937,24 @@ class Module(ModuleConverters, ModuleHelpers):
     def built_(self):
         return self._built
 
+    @property
+    def flat_v(self):
+        """Dict of the flat buffers holding the variables, keyed by dtype and device."""
+        self._sync_flat_v()
+        return self._flat_buffers
+
+    @property
+    def submod_rets(self):
+        if self._submod_rets is None:
+            self._submod_rets = ivy.Container(alphabetical_keys=False)
+        return self._submod_rets
+
+    @property
+    def submod_call_order(self):
+        if self._submod_call_order is None:
+            self._submod_call_order = ivy.Container(alphabetical_keys=False)
+        return self._submod_call_order
+
     def show_graph(
         self,
         *args,
@@ -7,6 +7,73 @@ from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.stateful.helpers import FlatLayout, container_signature
+
+
+# Helpers #
+# --------#
+
+
+def _flat_adam_step(g, mw, vw, step, beta1, beta2, epsilon):
+    """Adam step over flat buffers, updating the moment buffers in-place."""
+    step = float(step)
+    ivy.add(beta1 * mw, (1 - beta1) * g, out=mw)
+    ivy.add(beta2 * vw, (1 - beta2) * g**2, out=vw)
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    return alpha * mw / (ivy.maximum(vw, 0.0) ** 0.5 + epsilon)
+
+
+def _flat_norms(layout, dtype, x):
+    return ivy.sqrt(layout.segment_sum(dtype, x**2))
+
+
+def _stochastic_round(x, dtype):
+    """Round to a lower precision dtype, up or down at random with probabilities
+    proportional to the distance to either neighbour, so that small updates are not
+    systematically lost."""
+    nearest = ivy.astype(x, dtype)
+    error = x - ivy.astype(nearest, x.dtype)
+    towards = ivy.where(
+        error > 0,
+        ivy.full_like(nearest, float("inf")),
+        ivy.full_like(nearest, -float("inf")),
+    )
+    neighbour = ivy.nextafter(nearest, towards)
+    gap = ivy.abs(ivy.astype(neighbour, x.dtype) - ivy.astype(nearest, x.dtype))
+    prob = ivy.abs(error) / gap
+    return ivy.where(
+        ivy.random_uniform(shape=x.shape, dtype=x.dtype, device=ivy.dev(x)) < prob,
+        neighbour,
+        nearest,
+    )
+
+
+def _compress_moment(x, dtype, rounding, factored):
+    """Store a moment leaf with the given dtype and rounding, or as the row and
+    column means of a 2-D leaf if factored."""
+    if factored and len(x.shape) == 2 and min(x.shape) > 1:
+        return ivy.Container(
+            {
+                "row": ivy.mean(x, axis=1, keepdims=True),
+                "col": ivy.mean(x, axis=0, keepdims=True),
+            }
+        )
+    if dtype is None or ivy.as_ivy_dtype(x.dtype) == ivy.as_ivy_dtype(dtype):
+        return x
+    if rounding == "stochastic":
+        return _stochastic_round(x, dtype)
+    return ivy.astype(x, dtype)
+
+
+def _expand_moment(x, grad):
+    """Recover a full moment leaf with the dtype of the gradient."""
+    if isinstance(x, ivy.Container):
+        # the row means of the rebuilt leaf are exactly the stored row means, and
+        # likewise for the columns
+        x = x.row * x.col / ivy.mean(x.row)
+    if x.dtype != grad.dtype:
+        x = ivy.astype(x, grad.dtype)
+    return x
 
 
 # Base #
@@ -14,6 +81,13 @@ import ivy
 
 
 class Optimizer(abc.ABC):
+    # names of the nested optimizer states, which are kept flat in foreach mode
+    _state_names = ()
+    # storage of the moments, for optimizers which keep them
+    _moment_dtype = None
+    _moment_rounding = "nearest"
+    _factored_second_moment = False
+
     def __init__(
         self,
         lr: Union[float, Callable],
@@ -23,6 +97,9 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        accumulation_steps: int = 1,
+        accumulation_reduction: str = "mean",
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,7 +127,20 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to flatten all variables, gradients and optimizer states of the
+            same dtype into contiguous buffers, and update them with a few vectorized
+            operations rather than leaf by leaf. Only applies to containers.
+            Default is ``False``.
+        accumulation_steps
+            Number of calls to ``step`` over which the gradients are accumulated
+            in-place, before the update is applied. Default is ``1``, for an update
+            on every call.
+        accumulation_reduction
+            How the accumulated gradients are reduced, either ``"mean"`` or
+            ``"sum"``. Default is ``"mean"``.
         """
+        ivy.utils.assertions.check_elem_in_list(accumulation_reduction, ["mean", "sum"])
         self._lr = lr
         self._inplace = inplace
         self._stop_gradients = stop_gradients
@@ -62,6 +152,13 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._compiled_step_fn = None
         self._compiled = False
+        self._foreach = foreach
+        self._flat_layout = None
+        self._flat_state = dict()
+        self._accumulation_steps = accumulation_steps
+        self._accumulation_reduction = accumulation_reduction
+        self._accumulated_grads = None
+        self._num_accumulated = 0
 
     # Private #
     # --------#
@@ -92,6 +189,204 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    def _flat_buffers(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Flatten the variables and gradients into contiguous buffers per dtype,
+        rebuilding the flat layout and the flat optimizer state whenever the
+        structure of the variables changes.
+
+        Parameters
+        ----------
+        v
+            Nested variables to flatten.
+        grads
+            Nested gradients to flatten.
+
+        Returns
+        -------
+        ret
+            The flat layout, and the flat variables and gradients.
+
+        """
+        signature, leaves = container_signature(v)
+        if self._flat_layout is None or self._flat_layout.signature != signature:
+            states = {name: self._get_flat_state(name) for name in self._state_names}
+            self._flat_layout = FlatLayout(signature, v.cont_config)
+            for name, value in states.items():
+                self._set_flat_state(name, value)
+        return (
+            self._flat_layout,
+            self._flat_layout.flatten(leaves),
+            self._flat_layout.flatten_container(grads),
+        )
+
+    def _set_flat_state(self, name: str, value: Optional[ivy.Container]):
+        """
+        Set one of the optimizer states from a container. In foreach mode, the
+        state is flattened with the layout of the variables once it is known.
+
+        Parameters
+        ----------
+        name
+            Name of the state.
+        value
+            Nested state to set.
+        """
+        if self._foreach and self._flat_layout is not None and value is not None:
+            self._flat_state[name] = self._flat_layout.flatten_container(value)
+            value = None
+        else:
+            self._flat_state.pop(name, None)
+        setattr(self, "_" + name, value)
+
+    def _get_flat_state(self, name: str):
+        """
+        Get one of the optimizer states as a container.
+
+        Parameters
+        ----------
+        name
+            Name of the state.
+
+        Returns
+        -------
+        ret
+            The nested state.
+        """
+        if name in self._flat_state:
+            # copy, since the flat state is updated in-place by the following steps
+            return self._flat_layout.unflatten(
+                {k: ivy.copy_array(x) for k, x in self._flat_state[name].items()}
+            )
+        return getattr(self, "_" + name)
+
+    def _accumulate(self, grads: ivy.Container):
+        """
+        Add the gradients into the accumulation buffers in-place. Gradients for
+        keys which are not yet accumulated are copied into new buffers.
+
+        Parameters
+        ----------
+        grads
+            Nested gradients to accumulate.
+        """
+        if self._accumulated_grads is None:
+            self._accumulated_grads = ivy.nested_map(
+                grads, ivy.copy_array, include_derived=True, shallow=False
+            )
+        elif isinstance(grads, ivy.Container):
+            for kc, grad in grads.cont_to_iterator():
+                if self._accumulated_grads.cont_has_key_chain(kc):
+                    acc = self._accumulated_grads.cont_at_key_chain(kc)
+                    ivy.add(acc, grad, out=acc)
+                else:
+                    self._accumulated_grads.cont_set_at_key_chain(
+                        kc, ivy.copy_array(grad), inplace=True
+                    )
+        else:
+            ivy.add(self._accumulated_grads, grads, out=self._accumulated_grads)
+        self._num_accumulated += 1
+
+    def _load_moments(self, mw: ivy.Container, vw: ivy.Container, grads):
+        """
+        Recover full precision first and second moments from their stored form,
+        at the key chains of the gradients.
+
+        Parameters
+        ----------
+        mw
+            Nested stored first moments.
+        vw
+            Nested stored second moments.
+        grads
+            Nested gradients, giving the key chains and dtypes of the moments.
+
+        Returns
+        -------
+        ret
+            The first and second moments.
+        """
+        if self._moment_dtype is None and not self._factored_second_moment:
+            return mw, vw
+        if not isinstance(grads, ivy.Container):
+            return _expand_moment(mw, grads), _expand_moment(vw, grads)
+        return (
+            grads.cont_map(lambda g, kc: _expand_moment(mw.cont_at_key_chain(kc), g)),
+            grads.cont_map(lambda g, kc: _expand_moment(vw.cont_at_key_chain(kc), g)),
+        )
+
+    def _store_moments(self, mw: ivy.Container, vw: ivy.Container):
+        """
+        Convert first and second moments into their stored form, with reduced
+        precision or factored second moments.
+
+        Parameters
+        ----------
+        mw
+            Nested first moments.
+        vw
+            Nested second moments.
+
+        Returns
+        -------
+        ret
+            The stored first and second moments.
+        """
+        if self._moment_dtype is None and not self._factored_second_moment:
+            return mw, vw
+        args = (self._moment_dtype, self._moment_rounding)
+        if not isinstance(mw, ivy.Container):
+            return (
+                _compress_moment(mw, *args, False),
+                _compress_moment(vw, *args, self._factored_second_moment),
+            )
+        return (
+            mw.cont_map(lambda x, _: _compress_moment(x, *args, False)),
+            vw.cont_map(
+                lambda x, _: _compress_moment(x, *args, self._factored_second_moment)
+            ),
+        )
+
+    def _load_flat_moments(self, dtype: str):
+        """
+        Get the flat first and second moments of the given variable dtype, in the
+        precision of the variables.
+
+        Parameters
+        ----------
+        dtype
+            Dtype of the flat variable buffer.
+
+        Returns
+        -------
+        ret
+            The flat first and second moments, which can be updated in-place.
+        """
+        mw = self._flat_state["mw"][dtype]
+        vw = self._flat_state["vw"][dtype]
+        if self._moment_dtype is not None:
+            mw, vw = ivy.astype(mw, dtype), ivy.astype(vw, dtype)
+        return mw, vw
+
+    def _store_flat_moments(self, dtype: str, mw: ivy.Array, vw: ivy.Array):
+        """
+        Store the updated flat first and second moments of the given variable
+        dtype, with reduced precision if required.
+
+        Parameters
+        ----------
+        dtype
+            Dtype of the flat variable buffer.
+        mw
+            Flat first moments.
+        vw
+            Flat second moments.
+        """
+        if self._moment_dtype is not None:
+            args = (self._moment_dtype, self._moment_rounding, False)
+            self._flat_state["mw"][dtype] = _compress_moment(mw, *args)
+            self._flat_state["vw"][dtype] = _compress_moment(vw, *args)
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -152,9 +447,52 @@ class Optimizer(abc.ABC):
         Returns
         -------
         ret
-            The updated variables, following update step.
+            The updated variables, following update step. When accumulating
+            gradients, the variables are returned unchanged until the update is
+            applied.
 
         """
+        if self._accumulation_steps > 1:
+            self._accumulate(grads)
+            if self._num_accumulated < self._accumulation_steps:
+                return v
+            return self.apply(v, ignore_missing)
+        self._count += 1
+        self._initialized = True
+        return self._step_fn(v, grads, ignore_missing)
+
+    def apply(self, v: ivy.Container, ignore_missing: bool = False):
+        """
+        Apply an update step with the gradients accumulated so far, even if fewer
+        than ``accumulation_steps`` calls to ``step`` have been made, and reset the
+        accumulation. Gradients of keys missing from some of the accumulated calls
+        count as zero for those calls.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        ignore_missing
+            Whether to ignore keys missing from the gradients which exist in
+            the variables.
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            The updated variables, following update step, or the unchanged variables
+            if no gradients have been accumulated.
+
+        """
+        if self._num_accumulated == 0:
+            return v
+        grads = self._accumulated_grads
+        if self._accumulation_reduction == "mean":
+            grads = grads / self._num_accumulated
+        # the buffers are handed over to the update, which might keep references to
+        # them as optimizer state, so new buffers are created for the next round
+        self._accumulated_grads = None
+        self._num_accumulated = 0
         self._count += 1
         self._initialized = True
         return self._step_fn(v, grads, ignore_missing)
@@ -171,6 +509,9 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        foreach: bool = False,
+        accumulation_steps: int = 1,
+        accumulation_reduction: str = "mean",
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -189,9 +530,25 @@ class SGD(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all variables of the same dtype as one flat buffer.
+            Default is ``False``.
+        accumulation_steps
+            Number of calls to ``step`` over which the gradients are accumulated,
+            before the update is applied. Default is ``1``.
+        accumulation_reduction
+            How the accumulated gradients are reduced, either ``"mean"`` or
+            ``"sum"``. Default is ``"mean"``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            foreach=foreach,
+            accumulation_steps=accumulation_steps,
+            accumulation_reduction=accumulation_reduction,
         )
 
     # Custom Step
@@ -214,6 +571,20 @@ class SGD(Optimizer):
             The new updated variables container, following gradient descent step.
 
         """
+        if self._foreach and isinstance(v, ivy.Container):
+            layout, flat_v, flat_grads = self._flat_buffers(v, grads)
+            lr = self._lr if isinstance(self._lr, float) else self._lr()
+            return layout.unflatten(
+                {
+                    dtype: ivy.optimizer_update(
+                        w,
+                        flat_grads[dtype],
+                        lr,
+                        stop_gradients=self._stop_gradients,
+                    )
+                    for dtype, w in flat_v.items()
+                }
+            )
         return ivy.gradient_descent_update(
             v,
             grads,
@@ -245,6 +616,9 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        foreach: bool = False,
+        accumulation_steps: int = 1,
+        accumulation_reduction: str = "mean",
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -265,10 +639,26 @@ class LARS(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all variables of the same dtype as one flat buffer.
+            Default is ``False``.
+        accumulation_steps
+            Number of calls to ``step`` over which the gradients are accumulated,
+            before the update is applied. Default is ``1``.
+        accumulation_reduction
+            How the accumulated gradients are reduced, either ``"mean"`` or
+            ``"sum"``. Default is ``"mean"``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            foreach=foreach,
+            accumulation_steps=accumulation_steps,
+            accumulation_reduction=accumulation_reduction,
         )
 
     # Custom Step
@@ -291,6 +681,25 @@ class LARS(Optimizer):
             The new updated variables container, following LARS step.
 
         """
+        if self._foreach and isinstance(v, ivy.Container):
+            layout, flat_v, flat_grads = self._flat_buffers(v, grads)
+            lr = self._lr if isinstance(self._lr, float) else self._lr()
+            new_flat_v = dict()
+            for dtype, w in flat_v.items():
+                # per-leaf learning rates, from segment norms over the flat buffers
+                w_norm = _flat_norms(layout, dtype, w)
+                layer_lr = ivy.stable_divide(
+                    w_norm * lr, _flat_norms(layout, dtype, flat_grads[dtype])
+                )
+                if self._decay_lambda > 0:
+                    layer_lr /= w_norm * self._decay_lambda
+                new_flat_v[dtype] = ivy.optimizer_update(
+                    w,
+                    flat_grads[dtype],
+                    layout.expand(dtype, layer_lr),
+                    stop_gradients=self._stop_gradients,
+                )
+            return layout.unflatten(new_flat_v)
         return ivy.lars_update(
             v,
             grads,
@@ -316,6 +725,8 @@ class LARS(Optimizer):
 
 
 class Adam(Optimizer):
+    _state_names = ("mw", "vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -326,6 +737,12 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        accumulation_steps: int = 1,
+        accumulation_reduction: str = "mean",
+        moment_dtype: Optional[Union[ivy.Dtype, str]] = None,
+        moment_rounding: str = "stochastic",
+        factored_second_moment: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -354,6 +771,26 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all variables and moments of the same dtype as one flat
+            buffer, with the moments updated in-place. Default is ``False``.
+        accumulation_steps
+            Number of calls to ``step`` over which the gradients are accumulated,
+            before the update is applied. Default is ``1``.
+        accumulation_reduction
+            How the accumulated gradients are reduced, either ``"mean"`` or
+            ``"sum"``. Default is ``"mean"``.
+        moment_dtype
+            Reduced precision dtype in which the moments are stored, such as
+            ``"float16"`` or ``"bfloat16"``. Default is ``None``, for the dtype of the
+            variables.
+        moment_rounding
+            How the moments are rounded to ``moment_dtype``, either ``"nearest"``, or
+            ``"stochastic"`` for unbiased rounding. Default is ``"stochastic"``.
+        factored_second_moment
+            Whether to store the second moments of 2-D variables as their row and
+            column means only, which are combined into a rank-1 estimate at each
+            step. Not supported in foreach mode. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -362,9 +799,28 @@ class Adam(Optimizer):
         self._vw = None
         self._first_pass = True
         self._should_compile = False
+        ivy.utils.assertions.check_elem_in_list(
+            moment_rounding, ["nearest", "stochastic"]
+        )
+        if foreach and factored_second_moment:
+            raise ivy.utils.exceptions.IvyException(
+                "factored second moments are not supported in foreach mode"
+            )
+        self._moment_dtype = moment_dtype
+        self._moment_rounding = moment_rounding
+        self._factored_second_moment = factored_second_moment
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            foreach=foreach,
+            accumulation_steps=accumulation_steps,
+            accumulation_reduction=accumulation_reduction,
         )
 
     # Custom Step
@@ -387,23 +843,53 @@ class Adam(Optimizer):
             The updated variables, following Adam update step.
 
         """
+        if self._foreach and isinstance(v, ivy.Container):
+            layout, flat_v, flat_grads = self._flat_buffers(v, grads)
+            if self._first_pass:
+                self._flat_state["mw"] = {
+                    dtype: ivy.copy_array(g) for dtype, g in flat_grads.items()
+                }
+                self._flat_state["vw"] = {
+                    dtype: g**2 for dtype, g in flat_grads.items()
+                }
+                self._first_pass = False
+            lr = self._lr if isinstance(self._lr, float) else self._lr()
+            new_flat_v = dict()
+            for dtype, w in flat_v.items():
+                mw, vw = self._load_flat_moments(dtype)
+                eff_grads = _flat_adam_step(
+                    flat_grads[dtype],
+                    mw,
+                    vw,
+                    self._count,
+                    self._beta1,
+                    self._beta2,
+                    self._epsilon,
+                )
+                self._store_flat_moments(dtype, mw, vw)
+                new_flat_v[dtype] = ivy.optimizer_update(
+                    w, eff_grads, lr, stop_gradients=self._stop_gradients
+                )
+            return layout.unflatten(new_flat_v)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.adam_update(
+        mw, vw = self._load_moments(self._mw, self._vw, grads)
+        new_v, mw, vw = ivy.adam_update(
             v,
             grads,
             self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
+            mw,
+            vw,
             self._count,
             beta1=self._beta1,
             beta2=self._beta2,
             epsilon=self._epsilon,
             stop_gradients=self._stop_gradients,
         )
+        self._mw, self._vw = self._store_moments(mw, vw)
         return new_v
 
     def set_state(self, state: ivy.Container):
@@ -415,15 +901,21 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._set_flat_state("mw", state.mw)
+        self._set_flat_state("vw", state.vw)
+        # the moments are set, so the first step must not reinitialize them
+        self._first_pass = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._get_flat_state("mw"), "vw": self._get_flat_state("vw")}
+        )
 
 
 class LAMB(Optimizer):
+    _state_names = ("mw", "vw")
+
     def __init__(
         self,
         lr: float = 1e-4,
@@ -436,6 +928,12 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
+        accumulation_steps: int = 1,
+        accumulation_reduction: str = "mean",
+        moment_dtype: Optional[Union[ivy.Dtype, str]] = None,
+        moment_rounding: str = "stochastic",
+        factored_second_moment: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -469,9 +967,38 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all variables and moments of the same dtype as one flat
+            buffer, with the moments updated in-place. Default is ``False``.
+        accumulation_steps
+            Number of calls to ``step`` over which the gradients are accumulated,
+            before the update is applied. Default is ``1``.
+        accumulation_reduction
+            How the accumulated gradients are reduced, either ``"mean"`` or
+            ``"sum"``. Default is ``"mean"``.
+        moment_dtype
+            Reduced precision dtype in which the moments are stored, such as
+            ``"float16"`` or ``"bfloat16"``. Default is ``None``, for the dtype of the
+            variables.
+        moment_rounding
+            How the moments are rounded to ``moment_dtype``, either ``"nearest"``, or
+            ``"stochastic"`` for unbiased rounding. Default is ``"stochastic"``.
+        factored_second_moment
+            Whether to store the second moments of 2-D variables as their row and
+            column means only, which are combined into a rank-1 estimate at each
+            step. Not supported in foreach mode. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            foreach=foreach,
+            accumulation_steps=accumulation_steps,
+            accumulation_reduction=accumulation_reduction,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -481,6 +1008,16 @@ class LAMB(Optimizer):
         self._max_trust_ratio = max_trust_ratio
         self._decay_lambda = decay_lambda
         self._first_pass = True
+        ivy.utils.assertions.check_elem_in_list(
+            moment_rounding, ["nearest", "stochastic"]
+        )
+        if foreach and factored_second_moment:
+            raise ivy.utils.exceptions.IvyException(
+                "factored second moments are not supported in foreach mode"
+            )
+        self._moment_dtype = moment_dtype
+        self._moment_rounding = moment_rounding
+        self._factored_second_moment = factored_second_moment
 
     # Custom Step
 
@@ -501,17 +1038,56 @@ class LAMB(Optimizer):
         ret
             The updated variables, following LAMB update step.
         """
+        if self._foreach and isinstance(v, ivy.Container):
+            layout, flat_v, flat_grads = self._flat_buffers(v, grads)
+            if self._first_pass:
+                self._flat_state["mw"] = {
+                    dtype: ivy.copy_array(g) for dtype, g in flat_grads.items()
+                }
+                self._flat_state["vw"] = {
+                    dtype: g**2 for dtype, g in flat_grads.items()
+                }
+                self._first_pass = False
+            lr = self._lr if isinstance(self._lr, float) else self._lr()
+            new_flat_v = dict()
+            for dtype, w in flat_v.items():
+                mw, vw = self._load_flat_moments(dtype)
+                eff_grads = _flat_adam_step(
+                    flat_grads[dtype],
+                    mw,
+                    vw,
+                    self._count,
+                    self._beta1,
+                    self._beta2,
+                    self._epsilon,
+                )
+                self._store_flat_moments(dtype, mw, vw)
+                # per-leaf trust ratios, from segment norms over the flat buffers
+                r1 = _flat_norms(layout, dtype, w)
+                if self._decay_lambda > 0:
+                    r2 = _flat_norms(layout, dtype, eff_grads + self._decay_lambda * w)
+                else:
+                    r2 = _flat_norms(layout, dtype, eff_grads)
+                r = ivy.minimum(ivy.stable_divide(r1, r2), self._max_trust_ratio)
+                new_flat_v[dtype] = ivy.optimizer_update(
+                    w,
+                    eff_grads,
+                    layout.expand(dtype, r * lr),
+                    stop_gradients=self._stop_gradients,
+                )
+            return layout.unflatten(new_flat_v)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.lamb_update(
+        mw, vw = self._load_moments(self._mw, self._vw, grads)
+        new_v, mw, vw = ivy.lamb_update(
             v,
             grads,
             self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
+            mw,
+            vw,
             self._count,
             beta1=self._beta1,
             beta2=self._beta2,
@@ -520,6 +1096,7 @@ class LAMB(Optimizer):
             decay_lambda=self._decay_lambda,
             stop_gradients=self._stop_gradients,
         )
+        self._mw, self._vw = self._store_moments(mw, vw)
         return new_v
 
     def set_state(self, state: ivy.Container):
@@ -530,9 +1107,13 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._set_flat_state("mw", state.mw)
+        self._set_flat_state("vw", state.vw)
+        # the moments are set, so the first step must not reinitialize them
+        self._first_pass = False
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._get_flat_state("mw"), "vw": self._get_flat_state("vw")}
+        )
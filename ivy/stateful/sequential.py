@@ -1,11 +1,12 @@
 """Base class for deriving trainable modules"""
 
 # global
-from typing import Union, Optional
+from typing import Union, Optional, List
 
 # local
 import ivy
 from ivy.stateful.module import Module
+from ivy.stateful.layers import KVCache, MultiHeadAttention
 
 
 class Sequential(Module):
@@ -46,6 +47,59 @@ class Sequential(Module):
         self._submodules = list(sub_modules)
         Module.__init__(self, device=device, v=v, dtype=dtype)
 
+    def _attention_layers(self):
+        # the attention layers nested anywhere in the submodules, in the order in
+        # which they were assigned
+        layers = list()
+        visited = set()
+        stack = [self._submodules]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in visited:
+                continue
+            visited.add(id(obj))
+            if isinstance(obj, MultiHeadAttention):
+                layers.append(obj)
+            if isinstance(obj, Module):
+                children = list(obj.__dict__.values())
+            elif isinstance(obj, (list, tuple)):
+                children = list(obj)
+            elif isinstance(obj, dict) and not isinstance(obj, ivy.Container):
+                children = list(obj.values())
+            else:
+                continue
+            stack.extend(reversed(children))
+        return layers
+
+    def init_kv_caches(self, batch_size: int, max_length: int, /) -> List[KVCache]:
+        """
+        Create a key-value cache for each attention layer in the sequence, for
+        incremental decoding. Each call to the sequence then only needs the new
+        tokens, whose keys and values are appended to the caches of all layers.
+
+        Parameters
+        ----------
+        batch_size
+            The number of sequences decoded together.
+        max_length
+            The number of tokens held for each sequence.
+
+        Returns
+        -------
+        ret
+            The caches of the attention layers, in order. Calling ``truncate`` on
+            each of them after a batch of padded prompts drops the padding.
+        """
+        return [
+            layer.init_kv_cache(batch_size, max_length)
+            for layer in self._attention_layers()
+        ]
+
+    def clear_kv_caches(self):
+        """Stop caching the keys and values of the attention layers in the sequence."""
+        for layer in self._attention_layers():
+            layer.clear_kv_cache()
+
     def _forward(self, inputs):
         """
         Perform forward pass of the Linear layer.
@@ -1,5 +1,6 @@
 # global
 from hypothesis import given, strategies as st
+import numpy as np
 import platform
 
 # local
@@ -218,3 +219,32 @@ def _dtype_helper(draw):
 def test_handle_numpy_dtype(dtype):
     ret_dtype = handle_numpy_dtype(_fn)(None, dtype=dtype)
     assert isinstance(ret_dtype, ivy.Dtype)
+
+
+@given(
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", prune_function=False),
+        num_arrays=2,
+        shared_dtype=True,
+        min_value=-10,
+        max_value=10,
+        shape=(3, 3),
+    ),
+    fn_name=st.sampled_from(["add", "matmul", "mean"]),
+)
+def test_frontend_native_mode_functions(dtype_and_x, fn_name):
+    x_dtype, x = dtype_and_x
+    x1 = np_frontend.array(x[0], dtype=x_dtype[0])
+    x2 = np_frontend.array(x[1], dtype=x_dtype[0])
+    fn = getattr(np_frontend, fn_name)
+    args = (x1,) if fn_name == "mean" else (x1, x2)
+
+    expected = fn(*args)
+    ivy.set_frontend_native_mode(True)
+    try:
+        output = fn(*args)
+    finally:
+        ivy.unset_frontend_native_mode()
+    assert isinstance(output, ndarray)
+    assert output.dtype == expected.dtype
+    assert np.allclose(ivy.to_numpy(output.ivy_array), ivy.to_numpy(expected.ivy_array))
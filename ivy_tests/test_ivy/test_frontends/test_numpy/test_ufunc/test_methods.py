@@ -3,6 +3,7 @@ from hypothesis import assume, strategies as st, given
 import numpy as np
 
 # local
+import ivy
 import ivy.functional.frontends.numpy as np_frontend
 from ivy.functional.frontends.numpy.ufunc import (
     ufuncs,
@@ -65,3 +66,62 @@ def test_numpy_ufunc_identity(
     frontend_ufunc = getattr(np_frontend, ufunc_name)
     np_ufunc = getattr(np, ufunc_name)
     assert frontend_ufunc.identity == np_ufunc.identity
+
+
+# reduce, accumulate, reduceat, outer and at
+@given(
+    ufunc_name=st.sampled_from(
+        ["add", "multiply", "maximum", "fmax", "subtract", "divide", "logaddexp"]
+    ),
+    x=st.lists(st.integers(min_value=-5, max_value=5), min_size=1, max_size=12),
+    indices=st.lists(st.integers(min_value=0, max_value=11), min_size=1, max_size=6),
+)
+def test_numpy_ufunc_methods(ufunc_name, x, indices):
+    x = np.array(x, dtype="float64").reshape(len(x), 1) / 2 + 0.25
+    indices = [index % x.shape[0] for index in indices]
+    frontend_ufunc = getattr(np_frontend, ufunc_name)
+    np_ufunc = getattr(np, ufunc_name)
+
+    def _assert_close(ret, expected):
+        assert np.allclose(ivy.to_numpy(ret.ivy_array), expected)
+
+    _assert_close(frontend_ufunc.reduce(x, axis=0), np_ufunc.reduce(x, axis=0))
+    _assert_close(frontend_ufunc.accumulate(x), np_ufunc.accumulate(x))
+    _assert_close(frontend_ufunc.reduceat(x, indices), np_ufunc.reduceat(x, indices))
+    _assert_close(
+        frontend_ufunc.outer(x[:, 0], x[:4, 0]), np_ufunc.outer(x[:, 0], x[:4, 0])
+    )
+
+    a = np_frontend.array(x[:, 0])
+    expected = x[:, 0].copy()
+    frontend_ufunc.at(a, np.array(indices), x[indices, 0])
+    np_ufunc.at(expected, indices, x[indices, 0])
+    _assert_close(a, expected)
+
+
+# fmax and fmin ignore nan in their reductions
+@given(
+    ufunc_name=st.sampled_from(["fmax", "fmin", "maximum"]),
+    x=st.lists(
+        st.one_of(st.just(np.nan), st.floats(min_value=-5, max_value=5)),
+        min_size=1,
+        max_size=8,
+    ),
+)
+def test_numpy_ufunc_methods_nan(ufunc_name, x):
+    x = np.array(x, dtype="float64")
+    indices = [0, x.shape[0] // 2]
+    frontend_ufunc = getattr(np_frontend, ufunc_name)
+    np_ufunc = getattr(np, ufunc_name)
+
+    def _assert_close(ret, expected):
+        assert np.allclose(ivy.to_numpy(ret.ivy_array), expected, equal_nan=True)
+
+    _assert_close(frontend_ufunc.reduce(x), np_ufunc.reduce(x))
+    _assert_close(frontend_ufunc.reduceat(x, indices), np_ufunc.reduceat(x, indices))
+
+    a = np_frontend.array(np.full((2,), np.nan))
+    expected = np.full((2,), np.nan)
+    frontend_ufunc.at(a, np.array([0, 1, 0]), x[:1].repeat(3))
+    np_ufunc.at(expected, [0, 1, 0], x[:1].repeat(3))
+    _assert_close(a, expected)
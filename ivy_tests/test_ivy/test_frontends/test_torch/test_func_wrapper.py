@@ -1,5 +1,6 @@
 # global
-from hypothesis import given
+from hypothesis import given, strategies as st
+import numpy as np
 
 # local
 import ivy
@@ -142,3 +143,64 @@ def test_to_ivy_arrays_and_back(dtype_and_x, dtype):
     assert ivy.all(input_frontend.ivy_array == output.ivy_array)
 
     assert ivy.default_float_dtype_stack == ivy.default_int_dtype_stack == []
+
+
+@given(
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", prune_function=False),
+        num_arrays=2,
+        shared_dtype=True,
+    ),
+)
+def test_frontend_native_mode(dtype_and_x):
+    x_dtype, x = dtype_and_x
+    x1, x2 = Tensor(x[0]), Tensor(x[1])
+    x1.ivy_array = ivy.array(x[0], dtype=x_dtype[0])
+    x2.ivy_array = ivy.array(x[1], dtype=x_dtype[0])
+
+    def _add(a, b):
+        # the inputs reach the body, and the ivy functions return, as native arrays
+        assert ivy.is_native_array(a) and ivy.is_native_array(b)
+        ret = ivy.add(a, b)
+        assert ivy.is_native_array(ret)
+        return ret
+
+    ivy.set_frontend_native_mode(True)
+    try:
+        output = to_ivy_arrays_and_back(_add)(x1, x2)
+    finally:
+        ivy.unset_frontend_native_mode()
+    assert isinstance(output, Tensor)
+    assert ivy.get_array_mode()
+    expected = ivy.add(x1.ivy_array, x2.ivy_array)
+    assert str(output.dtype) == str(expected.dtype)
+    assert ivy.all(output.ivy_array == expected)
+
+
+@given(
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", prune_function=False),
+        num_arrays=2,
+        shared_dtype=True,
+        min_value=-10,
+        max_value=10,
+        shape=(3, 3),
+    ),
+    fn_name=st.sampled_from(["add", "matmul", "mean"]),
+)
+def test_frontend_native_mode_functions(dtype_and_x, fn_name):
+    x_dtype, x = dtype_and_x
+    x1 = torch_frontend.tensor(x[0], dtype=x_dtype[0])
+    x2 = torch_frontend.tensor(x[1], dtype=x_dtype[0])
+    fn = getattr(torch_frontend, fn_name)
+    args = (x1,) if fn_name == "mean" else (x1, x2)
+
+    expected = fn(*args)
+    ivy.set_frontend_native_mode(True)
+    try:
+        output = fn(*args)
+    finally:
+        ivy.unset_frontend_native_mode()
+    assert isinstance(output, Tensor)
+    assert str(output.dtype) == str(expected.dtype)
+    assert np.allclose(ivy.to_numpy(output.ivy_array), ivy.to_numpy(expected.ivy_array))
@@ -826,6 +826,37 @@ def test_default_int_dtype(
     assert ivy.default_int_dtype() == ivy.int32
 
 
+# FrontendDtypeContext
+@handle_test(
+    fn_tree="functional.ivy.default_float_dtype",  # dummy fn_tree
+    int_dtype=helpers.get_dtypes("signed_integer", full=False),
+    float_dtype=helpers.get_dtypes("float", full=False),
+)
+def test_frontend_dtype_context(
+    *,
+    int_dtype,
+    float_dtype,
+):
+    context = ivy.FrontendDtypeContext(int_dtype[0], float_dtype[0])
+    ivy.set_default_float_dtype("float16")
+    previous = context.activate()
+    try:
+        assert ivy.default_int_dtype() == int_dtype[0]
+        assert ivy.default_float_dtype() == float_dtype[0]
+        assert ivy.default_float_dtype(input=[1.0]) == float_dtype[0]
+        assert ivy.default_float_dtype(float_dtype="float16") == "float16"
+        nested_previous = ivy.FrontendDtypeContext("int32", "float32").activate()
+        assert ivy.default_float_dtype() == "float32"
+        ivy.FrontendDtypeContext.restore(nested_previous)
+        assert ivy.default_float_dtype() == float_dtype[0]
+    finally:
+        ivy.FrontendDtypeContext.restore(previous)
+    assert ivy.default_float_dtype_stack == ["float16"]
+    assert ivy.default_int_dtype_stack == []
+    ivy.unset_default_float_dtype()
+    assert ivy.default_float_dtype() == ivy.float32
+
+
 # default_complex_dtype
 @handle_test(
     fn_tree="functional.ivy.default_complex_dtype",
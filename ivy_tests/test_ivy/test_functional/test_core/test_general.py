@@ -1989,6 +1989,28 @@ def test_get_queue_timeout(x):
     assert ret == x
 
 
+# set_attention_block_size
+@given(
+    block_size=st.integers(min_value=1, max_value=1024),
+)
+def test_set_attention_block_size(block_size):
+    ivy.set_attention_block_size(block_size)
+    ret = ivy.get_attention_block_size()
+    ivy.unset_attention_block_size()
+    assert ret == block_size
+    assert ivy.get_attention_block_size() is None
+
+
+# set_frontend_native_mode
+@given(mode=st.booleans())
+def test_set_frontend_native_mode(mode):
+    ivy.set_frontend_native_mode(mode)
+    ret = ivy.get_frontend_native_mode()
+    ivy.unset_frontend_native_mode()
+    assert ret == mode
+    assert ivy.get_frontend_native_mode() is False
+
+
 # get_tmp_dir
 def test_get_tmp_dir():
     ret = ivy.get_tmp_dir()
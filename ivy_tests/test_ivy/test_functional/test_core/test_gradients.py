@@ -7,7 +7,11 @@ import numpy as np
 
 # local
 import ivy
-from ivy.functional.ivy.gradients import _variable
+from ivy.functional.ivy.gradients import (
+    _variable,
+    _get_required_float_variables,
+    _extract_required_float_variables,
+)
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -155,6 +159,31 @@ def test_execute_with_gradients(
     )
 
 
+# execute_with_gradients with a cached variable extraction plan
+@pytest.mark.parametrize("xs_grad_idxs", [None, [["b"]], [["a"]]])
+def test_execute_with_gradients_cached_plan(xs_grad_idxs, backend_fw):
+    fw = backend_fw.current_backend_str()
+    ivy.set_backend(fw)
+    w = ivy.array([1.0, 2.0])
+
+    def make_xs():
+        return ivy.Container({"a": w, "b": {"c": ivy.array([3, 4]), "d": w, "e": 5}})
+
+    expected = _extract_required_float_variables(make_xs(), xs_grad_idxs)
+    # the first call builds the plan, and the following calls replay it
+    for _ in range(3):
+        ret = _get_required_float_variables(make_xs(), xs_grad_idxs)
+        assert ret[0].b.d is ret[0].a
+        assert ret[0].b.e == 5
+        assert ivy.is_float_dtype(ret[0].b.c) == ivy.is_float_dtype(expected[0].b.c)
+        assert ret[0].cont_all_key_chains() == expected[0].cont_all_key_chains()
+        assert ret[1].cont_all_key_chains() == expected[1].cont_all_key_chains()
+        assert all(ivy.is_native_array(v) for v in ret[1].cont_to_flat_list())
+        assert ret[2] == expected[2]
+        assert ret[3] == expected[3]
+    ivy.previous_backend()
+
+
 # value_and_grad
 @pytest.mark.parametrize(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
@@ -26,6 +26,7 @@ from ivy_tests.test_ivy.helpers import handle_test
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -39,6 +40,7 @@ def test_fomaml_step_unique_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
     backend_fw,
 ):
     # Numpy does not support gradients, and jax does not support gradients on
@@ -50,7 +52,7 @@ def test_fomaml_step_unique_vars(
     inner_learning_rate = 1e-2
 
     # create variables
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -148,6 +150,7 @@ def test_fomaml_step_unique_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         outer_v="weight",
         return_inner_v=return_inner_v,
@@ -175,6 +178,7 @@ def test_fomaml_step_unique_vars(
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -188,6 +192,7 @@ def test_fomaml_step_shared_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
     backend_fw,
 ):
     # Numpy does not support gradients, jax does not support gradients on custom
@@ -199,7 +204,7 @@ def test_fomaml_step_shared_vars(
     inner_learning_rate = 1e-2
 
     # create variable
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -318,6 +323,7 @@ def test_fomaml_step_shared_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -343,6 +349,7 @@ def test_fomaml_step_shared_vars(
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -356,6 +363,7 @@ def test_fomaml_step_overlapping_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
     backend_fw,
 ):
     # Numpy does not support gradients, jax does not support gradients on custom
@@ -367,7 +375,7 @@ def test_fomaml_step_overlapping_vars(
     inner_learning_rate = 1e-2
 
     # create variables
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -470,6 +478,7 @@ def test_fomaml_step_overlapping_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
@@ -496,8 +505,15 @@ def test_fomaml_step_overlapping_vars(
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
+@pytest.mark.parametrize("vectorized", [True, False])
 def test_reptile_step(
-    on_device, inner_grad_steps, batched, stop_gradients, num_tasks, return_inner_v
+    on_device,
+    inner_grad_steps,
+    batched,
+    stop_gradients,
+    num_tasks,
+    return_inner_v,
+    vectorized,
 ):
     if ivy.current_backend_str() == "numpy":
         # Numpy does not support gradients, jax does not support gradients on custom
@@ -508,7 +524,7 @@ def test_reptile_step(
     inner_learning_rate = 1e-2
 
     # create variable
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -579,6 +595,7 @@ def test_reptile_step(
         inner_grad_steps,
         inner_learning_rate,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -609,6 +626,7 @@ def test_reptile_step(
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
+@pytest.mark.parametrize("vectorized", [True, False])
 def test_maml_step_unique_vars(
     on_device,
     inner_grad_steps,
@@ -618,6 +636,7 @@ def test_maml_step_unique_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
 ):
     if ivy.current_backend_str() == "numpy":
         # Numpy does not support gradients, jax does not support gradients on custom
@@ -632,7 +651,7 @@ def test_maml_step_unique_vars(
     inner_learning_rate = 1e-2
 
     # create variables
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -728,6 +747,7 @@ def test_maml_step_unique_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         outer_v="weight",
         return_inner_v=return_inner_v,
@@ -756,6 +776,7 @@ def test_maml_step_unique_vars(
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
+@pytest.mark.parametrize("vectorized", [True, False])
 def test_maml_step_shared_vars(
     on_device,
     inner_grad_steps,
@@ -765,6 +786,7 @@ def test_maml_step_shared_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
 ):
     if ivy.current_backend_str() == "numpy":
         # Numpy does not support gradients, jax does not support gradients on custom
@@ -779,7 +801,7 @@ def test_maml_step_shared_vars(
     inner_learning_rate = 1e-2
 
     # create variable
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -942,6 +964,7 @@ def test_maml_step_shared_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -973,6 +996,7 @@ def test_maml_step_shared_vars(
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
+@pytest.mark.parametrize("vectorized", [True, False])
 def test_maml_step_overlapping_vars(
     on_device,
     inner_grad_steps,
@@ -982,6 +1006,7 @@ def test_maml_step_overlapping_vars(
     stop_gradients,
     num_tasks,
     return_inner_v,
+    vectorized,
 ):
     if ivy.current_backend_str() == "numpy":
         # Numpy does not support gradients, jax does not support gradients on custom
@@ -995,7 +1020,7 @@ def test_maml_step_overlapping_vars(
     inner_learning_rate = 1e-2
 
     # create variables
-    if batched:
+    if batched and not vectorized:
         variables = ivy.Container(
             {
                 "latent": _variable(
@@ -1098,6 +1123,7 @@ def test_maml_step_overlapping_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
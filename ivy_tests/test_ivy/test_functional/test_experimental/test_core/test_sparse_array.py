@@ -1,7 +1,10 @@
 # global
-from hypothesis import strategies as st
+import numpy as np
+import hypothesis.extra.numpy as nph
+from hypothesis import assume, given, strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 
@@ -355,3 +358,96 @@ def test_sparse_bsr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+def _sparse_array_from_dense(x, format):
+    if format in ["bsr", "bsc"]:
+        # 2x2 blocks, stored when any of their elements is non-zero
+        blocks = x.reshape(x.shape[0] // 2, 2, x.shape[1] // 2, 2).swapaxes(1, 2)
+        if format == "bsc":
+            blocks = blocks.swapaxes(0, 1)
+        stored = np.any(blocks != 0, axis=(2, 3))
+        compressed = np.concatenate([[0], np.cumsum(stored.sum(axis=1))])
+        indices = np.nonzero(stored)[1]
+        values = blocks[stored]
+    else:
+        compressed_x = x.T if format == "csc" else x
+        rows, cols = np.nonzero(compressed_x)
+        values = compressed_x[rows, cols]
+        if format == "coo":
+            return ivy.SparseArray(
+                coo_indices=np.stack([rows, cols]),
+                values=values,
+                dense_shape=x.shape,
+                format=format,
+            )
+        counts = np.bincount(rows, minlength=compressed_x.shape[0])
+        compressed = np.concatenate([[0], np.cumsum(counts)])
+        indices = cols
+    if format.endswith("r"):
+        return ivy.SparseArray(
+            crow_indices=compressed,
+            col_indices=indices,
+            values=values,
+            dense_shape=x.shape,
+            format=format,
+        )
+    return ivy.SparseArray(
+        ccol_indices=compressed,
+        row_indices=indices,
+        values=values,
+        dense_shape=x.shape,
+        format=format,
+    )
+
+
+# sparse operations against their dense equivalents
+@given(
+    x=nph.arrays("float64", (4, 4), elements=st.sampled_from([0.0, -1.0, 2.0, 3.0])),
+    y=nph.arrays("float64", (4, 4), elements=st.sampled_from([0.0, -1.0, 2.0, 3.0])),
+    format=st.sampled_from(["coo", "csr", "csc", "bsr", "bsc"]),
+    axis=st.sampled_from([None, 0, 1, -1]),
+)
+def test_sparse_operations(x, y, format, axis):
+    assume(np.any(x) and np.any(y))
+    sparse_x = _sparse_array_from_dense(x, format)
+    sparse_y = _sparse_array_from_dense(y, format)
+    dense_y = ivy.array(y)
+
+    def _assert_close(ret, expected):
+        if ivy.is_ivy_sparse_array(ret):
+            if ret.values.shape[0] == 0:
+                ret = np.zeros_like(expected)
+            else:
+                ret = ret.to_dense_array()
+        assert np.allclose(ivy.to_numpy(ret), expected)
+
+    _assert_close(sparse_x @ dense_y, x @ y)
+    _assert_close(sparse_x @ dense_y[:, 0], x @ y[:, 0])
+    _assert_close(sparse_x.sum(axis=axis), np.sum(x, axis=axis))
+    _assert_close(sparse_x.max(axis=axis), np.max(x, axis=axis))
+    _assert_close(sparse_x.transpose(), x.T)
+    _assert_close(sparse_x + sparse_y, x + y)
+    _assert_close(sparse_x * sparse_y, x * y)
+
+
+# conversions between every pair of formats
+@given(
+    x=nph.arrays("float64", (4, 6), elements=st.sampled_from([0.0, -1.0, 2.0, 3.0])),
+    format=st.sampled_from(["coo", "csr", "csc", "bsr", "bsc"]),
+    target=st.sampled_from(["coo", "csr", "csc", "bsr", "bsc"]),
+    blocksize=st.sampled_from([(1, 1), (2, 3), (4, 2)]),
+)
+def test_sparse_format_conversion(x, format, target, blocksize):
+    assume(np.any(x))
+    sparse_x = _sparse_array_from_dense(x, format)
+    if target in ["bsr", "bsc"]:
+        ret = getattr(sparse_x, "to_" + target)(blocksize)
+        assert tuple(ret.values.shape[-2:]) == blocksize
+    else:
+        ret = getattr(sparse_x, "to_" + target)()
+    assert ret._format == target
+    assert np.allclose(ivy.to_numpy(ret.to_dense_array()), x)
+    # the coordinates are cached, and reused by the next conversion
+    assert ret._coordinates is not None
+    assert np.allclose(ivy.to_numpy(ret.to_coo().to_dense_array()), x)
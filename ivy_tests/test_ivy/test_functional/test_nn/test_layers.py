@@ -4,6 +4,7 @@
 from hypothesis import strategies as st, assume
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 from ivy.functional.ivy.layers import _deconv_length
@@ -156,10 +157,10 @@ def test_dropout(
 
 
 @st.composite
-def x_and_scaled_attention(draw, dtypes):
+def x_and_scaled_attention(draw, dtypes, max_num_keys=2):
     dtype = draw(dtypes)
     num_queries = draw(helpers.ints(min_value=1, max_value=2))
-    num_keys = draw(helpers.ints(min_value=1, max_value=2))
+    num_keys = draw(helpers.ints(min_value=1, max_value=max_num_keys))
     feat_dim = draw(helpers.ints(min_value=1, max_value=2))
     scale = draw(helpers.floats(min_value=0.1, max_value=1))
 
@@ -225,6 +226,48 @@ def test_scaled_dot_product_attention(
     )
 
 
+# scaled_dot_product_attention with the keys split into blocks
+@handle_test(
+    fn_tree="functional.ivy.scaled_dot_product_attention",
+    dtype_q_k_v_mask_scale=x_and_scaled_attention(
+        dtypes=helpers.get_dtypes("float", full=False),
+        max_num_keys=8,
+    ),
+    block_size=helpers.ints(min_value=1, max_value=3),
+    ground_truth_backend="jax",
+)
+def test_blockwise_scaled_dot_product_attention(
+    *,
+    dtype_q_k_v_mask_scale,
+    block_size,
+    test_flags,
+    backend_fw,
+    fn_name,
+    on_device,
+    ground_truth_backend,
+):
+    dtype, q, k, v, mask, scale = dtype_q_k_v_mask_scale
+    ivy.set_attention_block_size(block_size)
+    try:
+        helpers.test_function(
+            ground_truth_backend=ground_truth_backend,
+            input_dtypes=dtype,
+            test_flags=test_flags,
+            fw=backend_fw,
+            fn_name=fn_name,
+            on_device=on_device,
+            rtol_=1e-02,
+            atol_=1e-02,
+            q=q,
+            k=k,
+            v=v,
+            scale=scale,
+            mask=mask,
+        )
+    finally:
+        ivy.unset_attention_block_size()
+
+
 @st.composite
 def x_and_mha(draw, dtypes):
     dtype = draw(dtypes)
@@ -853,9 +896,9 @@ def test_conv_general_transpose(
 @st.composite
 def x_and_lstm(draw, dtypes):
     dtype = draw(dtypes)
-    batch_shape = (1,)
+    batch_shape = (draw(helpers.ints(min_value=1, max_value=3)),)
 
-    t = draw(helpers.ints(min_value=1, max_value=2))
+    t = draw(helpers.ints(min_value=1, max_value=3))
     _in_ = draw(helpers.ints(min_value=1, max_value=2))
     _out_ = draw(helpers.ints(min_value=1, max_value=2))
 
@@ -900,6 +943,14 @@ def x_and_lstm(draw, dtypes):
             dtype=dtype[0], shape=recurrent_bias_shape, min_value=0, max_value=1
         )
     )
+    lengths = draw(
+        st.none()
+        | st.lists(
+            helpers.ints(min_value=1, max_value=t),
+            min_size=batch_shape[0],
+            max_size=batch_shape[0],
+        )
+    )
     return (
         dtype,
         x_lstm,
@@ -909,6 +960,7 @@ def x_and_lstm(draw, dtypes):
         recurrent_kernel,
         lstm_bias,
         recurrent_bias,
+        lengths,
     )
 
 
@@ -938,6 +990,7 @@ def test_lstm_update(
         recurrent_kernel,
         bias,
         recurrent_bias,
+        lengths,
     ) = dtype_lstm
     helpers.test_function(
         ground_truth_backend=ground_truth_backend,
@@ -955,4 +1008,5 @@ def test_lstm_update(
         recurrent_kernel=recurrent_kernel,
         bias=bias,
         recurrent_bias=recurrent_bias,
+        lengths=lengths,
     )
@@ -1124,6 +1124,39 @@ def test_container_at_key_chain(on_device):
     assert np.allclose(ivy.to_numpy(sub_container), np.array([2]))
 
 
+def test_container_at_key_chain_after_modification(on_device):
+    dict_in = {
+        "a": ivy.array([1], device=on_device),
+        "b": {
+            "c": ivy.array([2], device=on_device),
+            "d": {"e": ivy.array([3], device=on_device)},
+        },
+    }
+    container = Container(dict_in)
+
+    # repeated lookups are served from the key chain index
+    for _ in range(3):
+        assert np.allclose(ivy.to_numpy(container["b/d/e"]), np.array([3]))
+        assert np.allclose(ivy.to_numpy(container["b.c"]), np.array([2]))
+    assert container._cont_key_chain_index is not None
+
+    # modifying nested containers in any way is reflected in later lookups
+    container.b.d.e = ivy.array([4], device=on_device)
+    assert np.allclose(ivy.to_numpy(container["b/d/e"]), np.array([4]))
+    container["b/f"] = ivy.array([5], device=on_device)
+    for _ in range(3):
+        assert np.allclose(ivy.to_numpy(container["b/f"]), np.array([5]))
+    del container.b["c"]
+    assert container.cont_at_key_chain("b/c", ignore_key_errors=True) is None
+    assert not container.cont_has_key_chain("b/c")
+    container.b.d.pop("e")
+    assert not container.cont_has_key_chain("b/d/e")
+    container.b.d.update({"g": ivy.array([6], device=on_device)})
+    assert np.allclose(ivy.to_numpy(container["b/d/g"]), np.array([6]))
+    with pytest.raises(IvyException):
+        container.cont_at_key_chain("b/d/e")
+
+
 def test_container_at_key_chains(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
@@ -2580,6 +2613,47 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_shuffle_h5_file_blockwise_and_virtual(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    out_filepath = "container_on_disk_shuffled.hdf5"
+    data = np.arange(10)
+    container = Container(
+        {
+            "a": ivy.array(data, device=on_device),
+            "b": {"c": ivy.array(data * 2, device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, max_batch_size=10)
+
+    # expected order, matching random.shuffle applied to the rows
+    expected = data.copy()
+    random.seed(1)
+    random.shuffle(expected)
+
+    # out-of-place, in blocks smaller than the dataset
+    Container.shuffle_h5_file(save_filepath, 1, out_filepath, block_size=3)
+    shuffled = Container.cont_from_disk_as_hdf5(out_filepath)
+    assert (ivy.to_numpy(shuffled.a) == expected).all()
+    assert (ivy.to_numpy(shuffled.b.c) == expected * 2).all()
+    unshuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert (ivy.to_numpy(unshuffled.a) == data).all()
+
+    # virtual, with the permutation applied when reading
+    Container.shuffle_h5_file(save_filepath, 1, virtual=True)
+    virtual = Container.cont_from_disk_as_hdf5(save_filepath, slice(2, 5))
+    assert (ivy.to_numpy(virtual.a) == expected[2:5]).all()
+    assert (ivy.to_numpy(virtual.b.c) == expected[2:5] * 2).all()
+    file_size, batch_size = Container.h5_file_size(save_filepath)
+    assert file_size == 20 * data.dtype.itemsize
+    assert batch_size == 10
+
+    os.remove(save_filepath)
+    os.remove(out_filepath)
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2637,6 +2711,83 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_pickled_out_of_band(on_device):
+    save_filepath = "container_on_disk.pickled"
+    container = Container(
+        {
+            "a": ivy.array([np.float32(1.0), np.float32(2.0)], device=on_device),
+            "b": {"c": ivy.array([[1, 2], [3, 4]], device=on_device)},
+        }
+    )
+
+    # saving
+    container.cont_to_disk_as_pickled(save_filepath, out_of_band=True)
+    assert os.path.exists(save_filepath)
+
+    # loading, with and without memory-mapping
+    for mmap_mode in [False, True]:
+        loaded = Container.cont_from_disk_as_pickled(save_filepath, mmap_mode=mmap_mode)
+        assert np.array_equal(ivy.to_numpy(loaded.a), ivy.to_numpy(container.a))
+        assert np.array_equal(ivy.to_numpy(loaded.b.c), ivy.to_numpy(container.b.c))
+
+    # in-memory pickling with out-of-band buffers
+    buffers = []
+    pickled = pickle.dumps(container, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    unpickled = pickle.loads(pickled, buffers=buffers)
+    assert np.array_equal(ivy.to_numpy(unpickled.a), ivy.to_numpy(container.a))
+    assert np.array_equal(ivy.to_numpy(unpickled.b.c), ivy.to_numpy(container.b.c))
+
+    os.remove(save_filepath)
+
+
+def test_container_to_and_from_disk_as_shards(on_device, tmp_path):
+    save_dir = str(tmp_path / "container_on_disk")
+    container = Container(
+        {
+            "a": ivy.array([np.float32(1.0), np.float32(2.0)], device=on_device),
+            "b": {
+                "c": ivy.array([[1, 2], [3, 4]], device=on_device),
+                "d": ivy.array(np.float64(3.0), device=on_device),
+                "e": None,
+            },
+        }
+    )
+
+    # saving, with one shard per array
+    container.cont_to_disk_as_shards(save_dir, shard_size=8)
+    assert len([f for f in os.listdir(save_dir) if f.startswith("shard_")]) == 3
+
+    # loading, with and without memory-mapping
+    for mmap_mode in [False, True]:
+        loaded = Container.cont_from_disk_as_shards(save_dir, mmap_mode=mmap_mode)
+        assert np.array_equal(ivy.to_numpy(loaded.a), ivy.to_numpy(container.a))
+        assert np.array_equal(ivy.to_numpy(loaded.b.c), ivy.to_numpy(container.b.c))
+        assert np.array_equal(ivy.to_numpy(loaded.b.d), ivy.to_numpy(container.b.d))
+        assert loaded.b.e is None
+
+    # asynchronous saving, into a single shard which replaces the previous ones
+    container.cont_to_disk_as_shards(save_dir, asynchronous=True).result()
+    assert len([f for f in os.listdir(save_dir) if f.startswith("shard_")]) == 1
+    loaded = Container.cont_from_disk_as_shards(save_dir)
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), ivy.to_numpy(container.b.c))
+
+    # saving into the directory of memory-mapped arrays leaves them unchanged
+    other = Container(
+        {
+            "a": ivy.zeros((1,), device=on_device),
+            "b": {"c": ivy.zeros((1,), dtype="int64", device=on_device)},
+        }
+    )
+    other.cont_to_disk_as_shards(save_dir, shard_size=8)
+    assert np.array_equal(ivy.to_numpy(loaded.a), ivy.to_numpy(container.a))
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), ivy.to_numpy(container.b.c))
+    assert np.array_equal(ivy.to_numpy(loaded.b.d), ivy.to_numpy(container.b.d))
+    reloaded = Container.cont_from_disk_as_shards(save_dir)
+    assert np.array_equal(ivy.to_numpy(reloaded.b.c), ivy.to_numpy(other.b.c))
+    assert len([f for f in os.listdir(save_dir) if f.startswith("shard_")]) == 2
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2867,6 +3018,72 @@ def test_container_from_queues(on_device):
     del container
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_container_queue_loader(ordered, on_device):
+    def load_fn(chunk_idx):
+        return {"a": [ivy.to_native(ivy.array([1.0, 2.0], device=on_device))] * 2}
+
+    with ivy.ContainerQueueLoader(
+        load_fn, [2, 2, 2], num_workers=2, prefetch_depth=2, ordered=ordered
+    ) as loader:
+        container = loader.container(queue_timeout=5.0)
+        for i in range(6):
+            assert np.allclose(ivy.to_numpy(container[i].a), np.array([1.0, 2.0]))
+        # consumed chunks are released
+        assert list(container._loaded_containers_from_queues) == [2]
+        stats = loader.stats()
+        assert stats["load"]["chunks"] == 3
+        assert stats["load"]["items"] == 6
+        assert stats["consume"]["chunks"] == 3
+        assert stats["consume"]["items"] == 6
+
+        # every chunk has been consumed
+        queue_was_empty = False
+        try:
+            loader.get(0, timeout=0.1)
+        except queue.Empty:
+            queue_was_empty = True
+        assert queue_was_empty
+
+    # a chunk beyond the prefetch depth is loaded once requested
+    with ivy.ContainerQueueLoader(load_fn, [2, 2, 2], prefetch_depth=1) as loader:
+        chunk = loader.get(2, timeout=5.0)
+        assert np.allclose(ivy.to_numpy(chunk["a"][0]), np.array([1.0, 2.0]))
+
+
+def test_container_shared_memory_queue(on_device):
+    if "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    def worker_fn(out_queue):
+        out_queue.put(
+            Container(
+                {
+                    "a": ivy.array([1.0, 2.0, 3.0], device=on_device),
+                    "b": {"c": [ivy.array([[1, 2]], device=on_device), "d"]},
+                }
+            )
+        )
+
+    shm_queue = ivy.SharedMemoryQueue()
+    worker = multiprocessing.Process(target=worker_fn, args=(shm_queue,))
+    worker.start()
+    received = shm_queue.get(timeout=10)
+    worker.join()
+    assert np.allclose(ivy.to_numpy(received.a), np.array([1.0, 2.0, 3.0]))
+    assert np.array_equal(ivy.to_numpy(received.b.c[0]), np.array([[1, 2]]))
+    assert received.b.c[1] == "d"
+
+    # arrays round trip through a handle to the shared memory block
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device)
+    handle = Container({"x": x}).cont_to_shared_memory()
+    loaded = Container.cont_from_shared_memory(handle)
+    assert np.allclose(ivy.to_numpy(loaded.x), ivy.to_numpy(x))
+    shm_queue.close()
+
+
 def test_container_reduce(on_device):
     container_a = ivy.Container(
         {
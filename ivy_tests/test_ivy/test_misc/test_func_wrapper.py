@@ -145,3 +145,27 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+@pytest.mark.parametrize(
+    "view_fn",
+    [
+        lambda x: ivy.permute_dims(x, axes=(1, 0)),
+        lambda x: ivy.get_item(ivy.swapaxes(x, 0, 1), (slice(1, None),)),
+        lambda x: ivy.get_item(x, (slice(None, None, 2), slice(1, None))),
+        lambda x: ivy.reshape(x, (3, 4)),
+    ],
+)
+def test_inplace_update_strided_views(view_fn):
+    base = ivy.array(np.arange(12, dtype="float32").reshape((4, 3)))
+    view = view_fn(base)
+    sibling = ivy.expand(ivy.get_item(base, (slice(1, 2),)), (2, 3))
+    # the values of a view of the indices are the flat positions it covers
+    positions = ivy.to_numpy(view_fn(ivy.arange(12).reshape((4, 3)))).flatten()
+    expected = np.arange(12, dtype="float32")
+    expected[positions] += 10
+    expected = expected.reshape((4, 3))
+    ivy.inplace_update(view, view + 10)
+    assert np.allclose(ivy.to_numpy(base), expected)
+    assert np.allclose(ivy.to_numpy(view), ivy.to_numpy(view_fn(ivy.array(expected))))
+    assert np.allclose(ivy.to_numpy(sibling), np.broadcast_to(expected[1:2], (2, 3)))
@@ -0,0 +1,82 @@
+# global
+import numpy as np
+from hypothesis import given, strategies as st
+
+# local
+import ivy
+
+
+# Tests #
+# ------#
+
+
+# packed rows against the same operations applied row by row
+@given(
+    row_lengths=st.lists(st.integers(min_value=1, max_value=5), min_size=1, max_size=6),
+    inner_dim=st.integers(min_value=1, max_value=3),
+)
+def test_nested_array_packed_rows(row_lengths, inner_dim, on_device):
+    rng = np.random.RandomState(0)
+    rows = [rng.uniform(-1, 1, (length, inner_dim)) for length in row_lengths]
+    x = ivy.NestedArray.nested_array(
+        [ivy.array(row) for row in rows], dtype="float64", device=on_device
+    )
+    ragged = len(set(row_lengths)) > 1
+    assert x.shape == [len(rows), None if ragged else row_lengths[0], inner_dim]
+
+    def _assert_rows(nested, expected):
+        for row, expected_row in zip(nested.unbind(), expected):
+            assert np.allclose(ivy.to_numpy(row), expected_row)
+
+    _assert_rows(x, rows)
+    _assert_rows(
+        ivy.NestedArray.from_row_lengths(np.concatenate(rows), row_lengths), rows
+    )
+    _assert_rows(x * 2 + x, [row * 3 for row in rows])
+    _assert_rows(x[1:], rows[1:])
+    _assert_rows(x[[-1, 0]], [rows[-1], rows[0]])
+    assert np.allclose(ivy.to_numpy(x[-1]), rows[-1])
+    assert np.allclose(ivy.to_numpy(x.sum()), [np.sum(row) for row in rows])
+    assert np.allclose(ivy.to_numpy(x.max()), [np.max(row) for row in rows])
+    assert np.allclose(ivy.to_numpy(x.mean()), [np.mean(row) for row in rows])
+
+    padded, mask = x.to_padded(pad_value=-9)
+    for i, row in enumerate(rows):
+        assert np.allclose(ivy.to_numpy(padded[i, : row.shape[0]]), row)
+        assert np.all(ivy.to_numpy(padded[i, row.shape[0] :]) == -9)
+        assert ivy.to_numpy(mask[i]).sum() == row.size
+    _assert_rows(ivy.NestedArray.from_padded(padded, mask), rows)
+
+
+# bucketed rows, padded per bucket and restored to their original order
+@given(
+    row_lengths=st.lists(
+        st.integers(min_value=1, max_value=20), min_size=1, max_size=12
+    ),
+    bucket_boundaries=st.lists(
+        st.integers(min_value=2, max_value=16), max_size=3, unique=True
+    ).map(sorted),
+    batch_size=st.integers(min_value=1, max_value=4),
+)
+def test_nested_array_bucketing(row_lengths, bucket_boundaries, batch_size, on_device):
+    rows = [np.arange(length, dtype="float64") + 1 for length in row_lengths]
+    x = ivy.NestedArray.nested_array(
+        [ivy.array(row) for row in rows], dtype="float64", device=on_device
+    )
+    expected = np.array([np.sum(row) for row in rows])
+    streamed = list(
+        ivy.bucket_stream(
+            (ivy.array(row) for row in rows), bucket_boundaries, batch_size
+        )
+    )
+    for buckets in [x.bucket_by_length(bucket_boundaries), streamed]:
+        for bucket in buckets:
+            lengths = [row_lengths[i] for i in ivy.to_numpy(bucket.indices)]
+            assert bucket.padded.shape[1] == max(lengths)
+            bucket_ids = np.searchsorted(bucket_boundaries, lengths, side="right")
+            assert np.all(bucket_ids == bucket_ids[0])
+        sums = [ivy.sum(bucket.padded, axis=1) for bucket in buckets]
+        assert np.allclose(ivy.to_numpy(ivy.restore_order(sums, buckets)), expected)
+        efficiency = ivy.padding_efficiency(buckets)
+        assert 0 < efficiency <= 1
+    assert len(streamed) >= len(row_lengths) // batch_size
@@ -1,6 +1,7 @@
 import pickle
 import numpy as np
 import os
+import pytest
 
 from hypothesis import given, assume
 
@@ -61,3 +62,18 @@ def test_pickle_to_and_from_disk(dtype_and_x, on_device):
 
     # check for equality
     assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(unpickled_arr))
+
+
+# pickling array test with out-of-band buffers
+@pytest.mark.parametrize("shape", [(), (0,), (3,), (2, 3)])
+def test_pickle_out_of_band(shape, on_device):
+    x = ivy.reshape(ivy.arange(int(np.prod(shape)), device=on_device), shape)
+
+    buffers = []
+    pickled_arr = pickle.dumps(x, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    unpickled_arr = pickle.loads(pickled_arr, buffers=buffers)
+
+    # check for equality
+    assert unpickled_arr.shape == x.shape
+    assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(unpickled_arr))
@@ -2,7 +2,8 @@
 
 # global
 import numpy as np
-from hypothesis import strategies as st, assume
+import pytest
+from hypothesis import given, strategies as st, assume
 
 # local
 import ivy
@@ -315,6 +316,68 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+# multi_head_attention with a key-value cache
+@given(
+    batch_size=st.integers(min_value=1, max_value=3),
+    prompt_len=st.integers(min_value=1, max_value=3),
+    num_steps=st.integers(min_value=1, max_value=3),
+    padding=st.integers(min_value=0, max_value=2),
+)
+def test_multi_head_attention_kv_cache(
+    batch_size, prompt_len, num_steps, padding, on_device
+):
+    query_dim = 4
+    seq_len = prompt_len + num_steps
+    layers = [
+        ivy.MultiHeadAttention(
+            query_dim, num_heads=2, head_dim=2, device=on_device, dtype="float32"
+        )
+        for _ in range(2)
+    ]
+    model = ivy.Sequential(*layers, device=on_device)
+    x = np.random.uniform(-1, 1, (batch_size, seq_len, query_dim)).astype("float32")
+    causal_mask = ivy.array(np.tril(np.ones((batch_size, seq_len, seq_len), bool)))
+    expected = ivy.array(x)
+    for layer in layers:
+        expected = layer(expected, mask=causal_mask)
+    expected = ivy.to_numpy(expected)
+
+    caches = model.init_kv_caches(batch_size, seq_len + padding)
+    assert len(caches) == 2
+
+    # prefill with padded prompts, whose padding is then dropped from the caches
+    prompt = np.concatenate(
+        [x[:, :prompt_len], np.ones((batch_size, padding, query_dim), "float32")],
+        axis=1,
+    )
+    rets = [ivy.to_numpy(model(ivy.array(prompt)))[:, :prompt_len]]
+    for cache in caches:
+        cache.truncate([prompt_len] * batch_size)
+    for t in range(prompt_len, seq_len):
+        rets.append(ivy.to_numpy(model(ivy.array(x[:, t : t + 1]))))
+    model.clear_kv_caches()
+    assert np.allclose(np.concatenate(rets, axis=1), expected, rtol=1e-4, atol=1e-5)
+
+    # past the cache length, each token attends to the last max_length tokens
+    max_length = 2
+    window_mask = np.tril(np.triu(np.ones((seq_len, seq_len), bool), 1 - max_length))
+    window_mask = np.broadcast_to(window_mask, (batch_size, seq_len, seq_len))
+    expected = ivy.array(x)
+    for layer in layers:
+        expected = layer(expected, mask=ivy.array(window_mask))
+    expected = ivy.to_numpy(expected)
+    model.init_kv_caches(batch_size, max_length)
+    rets = [ivy.to_numpy(model(ivy.array(x[:, t : t + 1]))) for t in range(seq_len)]
+    assert np.allclose(np.concatenate(rets, axis=1), expected, rtol=1e-4, atol=1e-5)
+
+    # chunks which wrap around the caches would overwrite the tokens they attend to
+    model.init_kv_caches(batch_size, max_length)
+    model(ivy.array(x[:, :1]))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        model(ivy.array(np.concatenate([x, x], axis=1)[:, 1:3]))
+    model.clear_kv_caches()
+
+
 # Convolutions #
 # -------------#
 
@@ -1,8 +1,11 @@
 """Collection of tests for Ivy modules."""
 
 # global
+import os
+
 from hypothesis import given, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -1009,3 +1012,184 @@ def test_module_track_submod_call_order(
             module._dl0._l0.v.cont_flatten_key_chains().to_numpy(),
         ]
     )
+
+
+# module with checkpointed activations
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_checkpoint_activations(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    ret = module(x)
+    assert module.checkpoint_activations() is module
+    checkpointed_ret = module(x)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(checkpointed_ret))
+
+    # variables passed to the call are used by the recomputed forward pass
+    v = module.v * 2
+    assert np.allclose(
+        ivy.to_numpy(module(x, v=v)),
+        ivy.to_numpy(module.checkpoint_activations(False)(x, v=v)),
+    )
+    if ivy.current_backend_str() == "numpy":
+        # NumPy does not support gradients
+        return
+
+    def loss_fn(v_):
+        return ivy.mean(module(x, v=v_))
+
+    module.checkpoint_activations()
+    loss, grads = ivy.execute_with_gradients(loss_fn, module.v)
+    module.checkpoint_activations(False)
+    expected_loss, expected_grads = ivy.execute_with_gradients(loss_fn, module.v)
+    assert np.allclose(ivy.to_numpy(loss), ivy.to_numpy(expected_loss))
+    assert ivy.Container.cont_all_true(
+        ivy.Container.cont_multi_map(
+            lambda xs, _: np.allclose(ivy.to_numpy(xs[0]), ivy.to_numpy(xs[1])),
+            [grads, expected_grads],
+        )
+    )
+
+
+# module call without tracking
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_call_without_tracking(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+    ret = module(x, track_submod_rets=True, track_submod_call_order=True)
+    sm_rets = module.submod_rets
+    for submod in [module._dl0, module._dl1, module._dl0._l0, module._dl1._l1]:
+        for sm_ret in sm_rets[submod.get_mod_key()]:
+            assert sm_ret.shape == tuple(list(batch_shape) + [64])
+    assert len(module.submod_call_order) > 0
+
+    # a call without tracking clears the tracked values, and gives the same result
+    untracked_ret = module(x)
+    assert np.allclose(ivy.to_numpy(untracked_ret), ivy.to_numpy(ret))
+    assert isinstance(module.submod_rets, ivy.Container)
+    assert len(module.submod_rets) == 0
+    assert len(module.submod_call_order) == 0
+    assert not module._submod_tracking
+
+    # overriding the variables does not require tracking either
+    v = module.v * 0
+    assert np.allclose(ivy.to_numpy(module(x, v=v)), 0)
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+
+
+# module with flat variables
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_flatten_variables(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+    ret = module(x)
+    v = module.v.cont_copy()
+    assert module.flatten_variables() is module
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+
+    # one buffer holds all the variables, in the layout of flatten_like_v
+    flat_v = module.flat_v
+    assert len(flat_v) == 1
+    (buffer,) = flat_v.values()
+    num_params = sum(int(np.prod(leaf.shape)) for leaf in v.cont_to_flat_list())
+    assert buffer.shape == (num_params,)
+    assert np.allclose(
+        ivy.to_numpy(buffer), ivy.to_numpy(list(module.flatten_like_v(v).values())[0])
+    )
+    assert ivy.Container.cont_identical(
+        [module.unflatten_like_v(flat_v), v], same_arrays=False
+    )
+
+    # variables replaced by an optimizer step are moved back into the buffer
+    expected = ivy.to_numpy(buffer) - 0.1
+    module.v = ivy.SGD(lr=0.1).step(module.v, module.v * 0 + 1)
+    assert np.allclose(ivy.to_numpy(module.flat_v[list(flat_v)[0]]), expected)
+    if ivy.inplace_arrays_supported():
+        assert module.flat_v[list(flat_v)[0]] is buffer
+    assert ivy.Container.cont_identical(
+        [module.unflatten_like_v(module.flat_v), module.v], same_arrays=False
+    )
+
+
+# save and load weights
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_module_save_and_load_weights(asynchronous, tmp_path, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+    x = ivy.array([[0.5, -1.0, 2.0]])
+    module = WithNestedModules(3, 4)
+    optimizer = ivy.Adam(lr=1e-2)
+    module.v = optimizer.step(module.v, module.v * 0 + 1)
+    path = str(tmp_path / "weights")
+    ret = module.save_weights(
+        path,
+        sharded=True,
+        optimizer=optimizer,
+        shard_size=1024,
+        asynchronous=asynchronous,
+    )
+    if asynchronous:
+        ret.result()
+    assert len([f for f in os.listdir(path) if f.startswith("shard_")]) > 1
+
+    loaded = WithNestedModules(3, 4)
+    loaded_optimizer = ivy.Adam(lr=1e-2)
+    loaded.load_weights(path, optimizer=loaded_optimizer)
+    assert np.allclose(ivy.to_numpy(loaded(x)), ivy.to_numpy(module(x)))
+    # saving another checkpoint to the same path leaves the loaded weights unchanged
+    ivy.Linear(4, 3).save_weights(path, sharded=True, shard_size=1024)
+    assert np.allclose(ivy.to_numpy(loaded(x)), ivy.to_numpy(module(x)))
+    assert ivy.Container.cont_identical(
+        [loaded_optimizer.state, optimizer.state], same_arrays=False
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_optimizer._count), ivy.to_numpy(optimizer._count)
+    )
+    # the optimizer continues from the restored state
+    grads = module.v * 0 + 5
+    assert ivy.Container.cont_identical(
+        [
+            loaded_optimizer.step(loaded.v, grads).to_numpy(),
+            optimizer.step(module.v, grads).to_numpy(),
+        ],
+        same_arrays=False,
+    )
+
+    # without sharded, the weights are saved as a single hdf5 file
+    hdf5_path = str(tmp_path / "weights_hdf5")
+    module.save_weights(hdf5_path)
+    assert os.path.isfile(hdf5_path)
+    loaded.load_weights(hdf5_path)
+    assert np.allclose(ivy.to_numpy(loaded(x)), ivy.to_numpy(module(x)))
+    ivy.previous_backend()
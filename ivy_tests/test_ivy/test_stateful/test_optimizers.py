@@ -3,8 +3,11 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -244,3 +247,142 @@ def test_lamb_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer_class", "kwargs"),
+    [
+        (ivy.SGD, {}),
+        (ivy.LARS, {"decay_lambda": 0.1}),
+        (ivy.Adam, {}),
+        (ivy.LAMB, {"decay_lambda": 0.1}),
+    ],
+)
+def test_optimizer_foreach(optimizer_class, kwargs, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+
+    def make_container(seed):
+        rng = np.random.RandomState(seed)
+        return ivy.Container(
+            {
+                "a": {
+                    "w": ivy.array(rng.uniform(-1, 1, (3, 4)), dtype="float32"),
+                    "b": ivy.array(rng.uniform(-1, 1, (4,)), dtype="float32"),
+                },
+                "c": ivy.array(rng.uniform(-1, 1, (2, 2)), dtype="float64"),
+            }
+        )
+
+    optimizer = optimizer_class(lr=0.1, **kwargs)
+    foreach_optimizer = optimizer_class(lr=0.1, foreach=True, **kwargs)
+    v = foreach_v = make_container(0)
+    for step in range(3):
+        grads = make_container(step + 1)
+        v = optimizer.step(v, grads)
+        foreach_v = foreach_optimizer.step(foreach_v, grads)
+    assert foreach_v.c.dtype == v.c.dtype
+    assert foreach_v.cont_all_key_chains() == v.cont_all_key_chains()
+    for expected, ret in zip(v.cont_to_flat_list(), foreach_v.cont_to_flat_list()):
+        assert np.allclose(ivy.to_numpy(expected), ivy.to_numpy(ret), atol=1e-5)
+    for expected, ret in zip(
+        optimizer.state.cont_to_flat_list(),
+        foreach_optimizer.state.cont_to_flat_list(),
+    ):
+        assert np.allclose(ivy.to_numpy(expected), ivy.to_numpy(ret), atol=1e-5)
+    ivy.previous_backend()
+
+
+# gradient accumulation
+@pytest.mark.parametrize("accumulation_reduction", ["mean", "sum"])
+def test_optimizer_gradient_accumulation(accumulation_reduction, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+
+    def make_container(seed):
+        rng = np.random.RandomState(seed)
+        return ivy.Container(
+            {
+                "w": ivy.array(rng.uniform(-1, 1, (3, 4)), dtype="float32"),
+                "b": ivy.array(rng.uniform(-1, 1, (4,)), dtype="float32"),
+            }
+        )
+
+    optimizer = ivy.Adam(
+        lr=0.1, accumulation_steps=3, accumulation_reduction=accumulation_reduction
+    )
+    reference_optimizer = ivy.Adam(lr=0.1)
+    v = make_container(0)
+    grads = [make_container(seed) for seed in range(1, 4)]
+    for grad in grads[:2]:
+        assert optimizer.step(v, grad) is v
+    new_v = optimizer.step(v, grads[2])
+    assert int(ivy.to_numpy(optimizer._count)[0]) == 1
+
+    summed_grads = grads[0] + grads[1] + grads[2]
+    if accumulation_reduction == "mean":
+        summed_grads = summed_grads / 3
+    expected_v = reference_optimizer.step(v, summed_grads)
+    for expected, ret in zip(expected_v.cont_to_flat_list(), new_v.cont_to_flat_list()):
+        assert np.allclose(ivy.to_numpy(expected), ivy.to_numpy(ret), atol=1e-5)
+
+    # partial accumulation, with gradients missing for some of the variables
+    assert optimizer.apply(new_v) is new_v
+    optimizer = ivy.SGD(
+        lr=0.1, accumulation_steps=3, accumulation_reduction=accumulation_reduction
+    )
+    optimizer.step(new_v, grads[0].cont_at_key_chains(["w"]), ignore_missing=True)
+    applied_v = optimizer.apply(new_v, ignore_missing=True)
+    assert int(ivy.to_numpy(optimizer._count)[0]) == 1
+    assert np.allclose(ivy.to_numpy(applied_v.b), ivy.to_numpy(new_v.b))
+    assert not np.allclose(ivy.to_numpy(applied_v.w), ivy.to_numpy(new_v.w))
+    ivy.previous_backend()
+
+
+# reduced precision and factored moments
+@pytest.mark.parametrize("optimizer_class", [ivy.Adam, ivy.LAMB])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"moment_dtype": "float16"},
+        {"moment_dtype": "float16", "moment_rounding": "nearest"},
+        {"moment_dtype": "float16", "foreach": True},
+        {"factored_second_moment": True},
+    ],
+)
+def test_optimizer_compact_moments(optimizer_class, kwargs, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+
+    def make_container(seed):
+        rng = np.random.RandomState(seed)
+        return ivy.Container(
+            {
+                "w": ivy.array(rng.uniform(-1, 1, (8, 4)), dtype="float32"),
+                "b": ivy.array(rng.uniform(-1, 1, (4,)), dtype="float32"),
+            }
+        )
+
+    optimizer = optimizer_class(lr=0.01, **kwargs)
+    reference_optimizer = optimizer_class(lr=0.01)
+    v = reference_v = make_container(0)
+    for step in range(3):
+        grads = make_container(step + 1)
+        v = optimizer.step(v, grads)
+        reference_v = reference_optimizer.step(reference_v, grads)
+    state = optimizer.state
+    if "moment_dtype" in kwargs:
+        assert all(x.dtype == "float16" for x in state.cont_to_flat_list())
+        atol = 1e-3
+    else:
+        assert state.vw.w.row.shape == (8, 1)
+        assert state.vw.w.col.shape == (1, 4)
+        assert state.vw.b.shape == (4,)
+        atol = 0.2
+    assert np.allclose(ivy.to_numpy(v.w), ivy.to_numpy(reference_v.w), atol=atol)
+
+    # the compact state can be restored into a new optimizer
+    restored_optimizer = optimizer_class(lr=0.01, **kwargs)
+    restored_optimizer.step(v, make_container(4))
+    restored_optimizer.set_state(state)
+    restored_optimizer._count = optimizer._count
+    restored_optimizer.step(v, make_container(5))
+    ivy.previous_backend()
@@ -0,0 +1,74 @@
+"""Measure the peak memory and time of ivy.scaled_dot_product_attention over increasing
+sequence lengths, with the full score matrix and with blockwise attention."""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+import ivy
+
+
+def _run(backend, seq_len, num_heads, feat_dim, block_size, results):
+    ivy.set_backend(backend)
+    rng = np.random.RandomState(0)
+    q, k, v = (
+        ivy.array(rng.uniform(-1, 1, (num_heads, seq_len, feat_dim)), dtype="float32")
+        for _ in range(3)
+    )
+    mask = ivy.array(np.tril(np.ones((seq_len, seq_len), dtype=bool)))
+    if block_size is not None:
+        ivy.set_attention_block_size(block_size)
+
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    ivy.scaled_dot_product_attention(q, k, v, feat_dim**-0.5, mask=mask)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on linux
+    results.put(((peak_rss - start_rss) * 1024, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--seq_lens", type=int, nargs="+", default=[1024, 4096, 16384])
+    parser.add_argument("--num_heads", type=int, default=4)
+    parser.add_argument("--feat_dim", type=int, default=64)
+    parser.add_argument("--block_size", type=int, default=512)
+    args = parser.parse_args()
+
+    # each configuration runs in a fresh process, so that the peaks are independent
+    context = multiprocessing.get_context("spawn")
+    print(
+        "{:<10}{:<12}{:>20}{:>12}".format(
+            "seq len", "attention", "peak memory (MB)", "time (s)"
+        )
+    )
+    for seq_len in args.seq_lens:
+        for name, block_size in (("full", None), ("blockwise", args.block_size)):
+            results = context.Queue()
+            process = context.Process(
+                target=_run,
+                args=(
+                    args.backend,
+                    seq_len,
+                    args.num_heads,
+                    args.feat_dim,
+                    block_size,
+                    results,
+                ),
+            )
+            process.start()
+            peak, elapsed = results.get()
+            process.join()
+            print(
+                "{:<10}{:<12}{:>20.1f}{:>12.3f}".format(
+                    seq_len, name, peak / 1e6, elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
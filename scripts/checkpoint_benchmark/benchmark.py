@@ -0,0 +1,71 @@
+"""Measure the peak memory and time of a forward and backward pass through a deep
+Sequential stack, with and without activation checkpointing of its layers."""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+import ivy
+
+
+def _run(backend, depth, width, batch_size, checkpoint, results):
+    ivy.set_backend(backend)
+    layers = [ivy.Linear(width, width) for _ in range(depth)]
+    if checkpoint:
+        for layer in layers:
+            layer.checkpoint_activations()
+    model = ivy.Sequential(*layers)
+    x = ivy.array(np.random.uniform(-1, 1, (batch_size, width)), dtype="float32")
+
+    def loss_fn(v):
+        return ivy.mean(model(x, v=v) ** 2)
+
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    ivy.execute_with_gradients(loss_fn, model.v)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if "gpu" in ivy.default_device() and backend == "torch":
+        import torch
+
+        peak = torch.cuda.max_memory_allocated()
+    else:
+        # ru_maxrss is in kilobytes on linux
+        peak = (peak_rss - start_rss) * 1024
+    results.put((peak, elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--depth", type=int, default=64)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--batch_size", type=int, default=512)
+    args = parser.parse_args()
+
+    # each configuration runs in a fresh process, so that the peaks are independent
+    context = multiprocessing.get_context("spawn")
+    print("{:<16}{:>20}{:>12}".format("checkpointing", "peak memory (MB)", "time (s)"))
+    for checkpoint in (False, True):
+        results = context.Queue()
+        process = context.Process(
+            target=_run,
+            args=(
+                args.backend,
+                args.depth,
+                args.width,
+                args.batch_size,
+                checkpoint,
+                results,
+            ),
+        )
+        process.start()
+        peak, elapsed = results.get()
+        process.join()
+        print("{:<16}{:>20.1f}{:>12.3f}".format(str(checkpoint), peak / 1e6, elapsed))
+
+
+if __name__ == "__main__":
+    main()
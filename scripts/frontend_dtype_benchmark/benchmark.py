@@ -0,0 +1,69 @@
+"""Time small creation functions of the torch and numpy frontends against the ivy
+functions they call, to measure the per-call overhead of the frontend wrappers."""
+
+import argparse
+import time
+
+import ivy
+import ivy.functional.frontends.numpy as np_frontend
+import ivy.functional.frontends.torch as torch_frontend
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=10000)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    n = args.size
+    data = list(range(n))
+    calls = {
+        "torch.zeros": (
+            lambda: ivy.zeros((n, n), dtype="float32"),
+            lambda: torch_frontend.zeros(n, n),
+        ),
+        "torch.arange": (
+            lambda: ivy.arange(n, dtype="int64"),
+            lambda: torch_frontend.arange(n),
+        ),
+        "torch.tensor": (
+            lambda: ivy.array(data, dtype="int64"),
+            lambda: torch_frontend.tensor(data),
+        ),
+        "numpy.zeros": (
+            lambda: ivy.zeros((n, n), dtype="float64"),
+            lambda: np_frontend.zeros((n, n)),
+        ),
+        "numpy.arange": (
+            lambda: ivy.arange(n, dtype="int64"),
+            lambda: np_frontend.arange(n),
+        ),
+    }
+
+    print(
+        "{:<16}{:>12}{:>16}{:>16}".format(
+            "function", "ivy (us)", "frontend (us)", "overhead (us)"
+        )
+    )
+    for name, (ivy_call, frontend_call) in calls.items():
+        direct = _time(ivy_call, args.repeats)
+        frontend = _time(frontend_call, args.repeats)
+        print(
+            "{:<16}{:>12.2f}{:>16.2f}{:>16.2f}".format(
+                name, direct * 1e6, frontend * 1e6, (frontend - direct) * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare the decoding throughput of a stack of attention layers when the whole
+sequence is recomputed for each new token, and when the keys and values are cached."""
+
+import argparse
+import time
+
+import numpy as np
+import ivy
+
+
+def _decode(model, layers, prompt, num_tokens, cached):
+    batch_size, prompt_len, _ = prompt.shape
+    x = prompt
+    if cached:
+        model.init_kv_caches(batch_size, prompt_len + num_tokens)
+        new = model(x)[:, -1:]
+    for _ in range(num_tokens):
+        if cached:
+            # only the new token is projected, and attends over the caches
+            new = model(new)
+            continue
+        seq_len = x.shape[-2]
+        mask = ivy.array(np.tril(np.ones((batch_size, seq_len, seq_len), bool)))
+        h = x
+        for layer in layers:
+            h = layer(h, mask=mask)
+        x = ivy.concat([x, h[:, -1:]], axis=-2)
+    if cached:
+        model.clear_kv_caches()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--context_lens", type=int, nargs="+", default=[1024, 4096])
+    parser.add_argument("--num_tokens", type=int, default=16)
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--num_layers", type=int, default=4)
+    parser.add_argument("--query_dim", type=int, default=256)
+    parser.add_argument("--num_heads", type=int, default=4)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    layers = [
+        ivy.MultiHeadAttention(
+            args.query_dim,
+            num_heads=args.num_heads,
+            head_dim=args.query_dim // args.num_heads,
+        )
+        for _ in range(args.num_layers)
+    ]
+    model = ivy.Sequential(*layers)
+    print("{:<14}{:<12}{:>16}".format("context len", "kv cache", "tokens / s"))
+    for context_len in args.context_lens:
+        prompt = ivy.array(
+            np.random.uniform(-1, 1, (args.batch_size, context_len, args.query_dim)),
+            dtype="float32",
+        )
+        for cached in (False, True):
+            start = time.perf_counter()
+            _decode(model, layers, prompt, args.num_tokens, cached)
+            elapsed = time.perf_counter() - start
+            print(
+                "{:<14}{:<12}{:>16.1f}".format(
+                    context_len,
+                    str(cached),
+                    args.batch_size * args.num_tokens / elapsed,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
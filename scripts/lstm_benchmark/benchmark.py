@@ -0,0 +1,73 @@
+"""Measure the throughput of ivy.lstm_update over increasing sequence lengths, for the
+backend's fused kernel and the compositional implementation, with full-length and
+packed variable-length sequences."""
+
+import argparse
+import time
+
+import numpy as np
+import ivy
+
+
+def _make_inputs(batch_size, timesteps, input_channels, hidden_channels):
+    rng = np.random.RandomState(0)
+
+    def uniform(*shape):
+        return ivy.array(rng.uniform(-1, 1, shape), dtype="float32")
+
+    x = uniform(batch_size, timesteps, input_channels)
+    init_h = uniform(batch_size, hidden_channels)
+    init_c = uniform(batch_size, hidden_channels)
+    kernel = uniform(input_channels, 4 * hidden_channels)
+    recurrent_kernel = uniform(hidden_channels, 4 * hidden_channels)
+    bias = uniform(4 * hidden_channels)
+    lengths = rng.randint(1, timesteps + 1, (batch_size,)).tolist()
+    return (x, init_h, init_c, kernel, recurrent_kernel), bias, lengths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--input_channels", type=int, default=64)
+    parser.add_argument("--hidden_channels", type=int, default=128)
+    parser.add_argument("--timesteps", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--steps", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    fused = ivy.lstm_update
+    # the compositional implementation is kept on the backend function when the
+    # backend has a fused kernel of its own
+    compositional = getattr(fused, "compos", fused)
+
+    print(
+        "{:<10}{:<16}{:<10}{:>14}{:>18}".format(
+            "timesteps", "implementation", "lengths", "call (s)", "timesteps / s"
+        )
+    )
+    for timesteps in args.timesteps:
+        arrays, bias, lengths = _make_inputs(
+            args.batch_size, timesteps, args.input_channels, args.hidden_channels
+        )
+        for name, fn in (("fused", fused), ("compositional", compositional)):
+            for packed in (False, True):
+                kwargs = {"bias": bias, "lengths": lengths if packed else None}
+                fn(*arrays, **kwargs)
+                start = time.perf_counter()
+                for _ in range(args.steps):
+                    fn(*arrays, **kwargs)
+                call_time = (time.perf_counter() - start) / args.steps
+                print(
+                    "{:<10}{:<16}{:<10}{:>14.4f}{:>18.1f}".format(
+                        timesteps,
+                        name,
+                        "packed" if packed else "full",
+                        call_time,
+                        args.batch_size * timesteps / call_time,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the throughput of the Reptile and first-order MAML steps when looping over
+the tasks, and when adapting all tasks at once with the vectorized inner loop."""
+
+import argparse
+import time
+
+import numpy as np
+import ivy
+
+
+def _make_problem(num_tasks, batch_size, in_features, hidden_features):
+    rng = np.random.RandomState(0)
+    variables = ivy.Container(
+        {
+            "w0": ivy.array(
+                rng.uniform(-1, 1, (in_features, hidden_features)), dtype="float32"
+            ),
+            "w1": ivy.array(rng.uniform(-1, 1, (hidden_features, 1)), dtype="float32"),
+        }
+    )
+    batch = ivy.Container(
+        {
+            "x": ivy.array(
+                rng.uniform(-1, 1, (num_tasks, batch_size, in_features)),
+                dtype="float32",
+            ),
+            "y": ivy.array(
+                rng.uniform(-1, 1, (num_tasks, batch_size, 1)), dtype="float32"
+            ),
+        }
+    )
+
+    def cost_fn(batch_in, v):
+        # the batch keeps its task axis of size one
+        hidden = ivy.tanh(ivy.matmul(batch_in["x"][0], v["w0"]))
+        return ivy.mean((ivy.matmul(hidden, v["w1"]) - batch_in["y"][0]) ** 2)
+
+    return batch, cost_fn, variables
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--algorithm", default="reptile", choices=["reptile", "fomaml"])
+    parser.add_argument("--num_tasks", type=int, default=32)
+    parser.add_argument("--batch_size", type=int, default=16)
+    parser.add_argument("--in_features", type=int, default=32)
+    parser.add_argument("--hidden_features", type=int, default=64)
+    parser.add_argument("--inner_grad_steps", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    batch, cost_fn, variables = _make_problem(
+        args.num_tasks, args.batch_size, args.in_features, args.hidden_features
+    )
+    if args.algorithm == "reptile":
+
+        def step(vectorized):
+            return ivy.reptile_step(
+                batch,
+                cost_fn,
+                variables,
+                args.inner_grad_steps,
+                1e-2,
+                batched=False,
+                vectorized=vectorized,
+            )
+
+    else:
+
+        def step(vectorized):
+            return ivy.fomaml_step(
+                batch,
+                cost_fn,
+                None,
+                variables,
+                args.inner_grad_steps,
+                1e-2,
+                batched=False,
+                vectorized=vectorized,
+            )
+
+    print("{:<14}{:>14}{:>16}".format("inner loop", "step (s)", "tasks / s"))
+    for name, vectorized in (("for loop", False), ("vectorized", True)):
+        step(vectorized)
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            step(vectorized)
+        step_time = (time.perf_counter() - start) / args.steps
+        print(
+            "{:<14}{:>14.4f}{:>16.1f}".format(
+                name, step_time, args.num_tasks / step_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure the overhead of ivy.Module.__call__ per module, for a deep stack of
+modules whose forward pass does no work, with and without submodule tracking."""
+
+import argparse
+import time
+
+import ivy
+
+
+class _Identity(ivy.Module):
+    def __init__(self):
+        ivy.Module.__init__(self)
+
+    def _create_variables(self, device, dtype=None):
+        return {}
+
+    def _forward(self, x):
+        return x
+
+
+class _Stack(ivy.Module):
+    def __init__(self, depth):
+        self._layers = [_Identity() for _ in range(depth)]
+        ivy.Module.__init__(self)
+
+    def _forward(self, x):
+        for layer in self._layers:
+            x = layer(x)
+        return x
+
+
+CONFIGS = {
+    "no tracking": {},
+    "v override": {"v": True},
+    "track returns": {"track_submod_rets": True},
+    "track call order": {"track_submod_call_order": True},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--depth", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    model = _Stack(args.depth)
+    x = ivy.array([1.0])
+    print("{:<20}{:>22}".format("call", "overhead (us/module)"))
+    for name, kwargs in CONFIGS.items():
+        if kwargs.get("v"):
+            kwargs = dict(kwargs, v=model.v)
+        model(x, **kwargs)
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            model(x, **kwargs)
+        elapsed = (time.perf_counter() - start) / args.repeats
+        print("{:<20}{:>22.2f}".format(name, elapsed / (args.depth + 1) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
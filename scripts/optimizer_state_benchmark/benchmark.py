@@ -0,0 +1,84 @@
+"""Compare the memory taken by the state of the Adam and LAMB optimizers, for the
+different moment storage layouts."""
+
+import argparse
+import time
+
+import numpy as np
+import ivy
+
+
+CONFIGS = {
+    "full precision": {},
+    "float16 moments": {"moment_dtype": "float16"},
+    "bfloat16 moments": {"moment_dtype": "bfloat16"},
+    "factored second moments": {"factored_second_moment": True},
+    "float16 + factored": {"moment_dtype": "float16", "factored_second_moment": True},
+}
+
+
+def _make_variables(vocab_size, embedding_dim, num_layers, dtype):
+    rng = np.random.RandomState(0)
+    variables = {
+        "token_embeddings": ivy.array(
+            rng.uniform(-1, 1, (vocab_size, embedding_dim)), dtype=dtype
+        )
+    }
+    for i in range(num_layers):
+        variables["layer{}".format(i)] = {
+            "w": ivy.array(
+                rng.uniform(-1, 1, (embedding_dim, embedding_dim)), dtype=dtype
+            ),
+            "b": ivy.array(rng.uniform(-1, 1, (embedding_dim,)), dtype=dtype),
+        }
+    return ivy.Container(variables)
+
+
+def _nbytes(cont):
+    return sum(
+        int(np.prod(x.shape)) * ivy.dtype_bits(x.dtype) // 8
+        for x in cont.cont_to_flat_list()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--optimizer", default="Adam", choices=["Adam", "LAMB"])
+    parser.add_argument("--vocab_size", type=int, default=50000)
+    parser.add_argument("--embedding_dim", type=int, default=256)
+    parser.add_argument("--num_layers", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=5)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    v = _make_variables(args.vocab_size, args.embedding_dim, args.num_layers, "float32")
+    grads = v * 1e-3
+    param_bytes = _nbytes(v)
+    print("parameters: {:.1f} MB".format(param_bytes / 1e6))
+    print(
+        "{:<26}{:>14}{:>18}{:>14}".format(
+            "moment storage", "state (MB)", "x parameters", "step (s)"
+        )
+    )
+    for name, kwargs in CONFIGS.items():
+        try:
+            optimizer = getattr(ivy, args.optimizer)(lr=1e-3, **kwargs)
+            new_v = optimizer.step(v, grads)
+            start = time.perf_counter()
+            for _ in range(args.steps):
+                new_v = optimizer.step(new_v, grads)
+            step_time = (time.perf_counter() - start) / args.steps
+        except Exception as e:
+            print("{:<26}unsupported by the backend: {}".format(name, e))
+            continue
+        state_bytes = _nbytes(optimizer.state)
+        print(
+            "{:<26}{:>14.1f}{:>18.2f}{:>14.4f}".format(
+                name, state_bytes / 1e6, state_bytes / param_bytes, step_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time the reduce, accumulate, reduceat, outer and at methods of the numpy frontend
+ufuncs against native numpy."""
+
+import argparse
+import time
+
+import numpy as np
+import ivy
+import ivy.functional.frontends.numpy as np_frontend
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--ufuncs", nargs="+", default=["add", "maximum", "subtract"])
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--num_segments", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    rng = np.random.RandomState(0)
+    x = rng.uniform(1, 2, args.size)
+    segments = np.sort(rng.choice(args.size, args.num_segments, replace=False))
+    scatter_indices = rng.randint(0, args.num_segments, args.size)
+    outer_x = x[:1000]
+
+    print(
+        "{:<12}{:<12}{:>14}{:>14}{:>10}".format(
+            "ufunc", "method", "numpy (ms)", "ivy (ms)", "ratio"
+        )
+    )
+    for name in args.ufuncs:
+        np_ufunc = getattr(np, name)
+        frontend_ufunc = getattr(np_frontend, name)
+        frontend_x = np_frontend.array(x)
+        calls = {
+            "reduce": (
+                lambda: np_ufunc.reduce(x),
+                lambda: frontend_ufunc.reduce(frontend_x),
+            ),
+            "accumulate": (
+                lambda: np_ufunc.accumulate(x),
+                lambda: frontend_ufunc.accumulate(frontend_x),
+            ),
+            "reduceat": (
+                lambda: np_ufunc.reduceat(x, segments),
+                lambda: frontend_ufunc.reduceat(frontend_x, segments),
+            ),
+            "outer": (
+                lambda: np_ufunc.outer(outer_x, outer_x),
+                lambda: frontend_ufunc.outer(outer_x, outer_x),
+            ),
+            "at": (
+                lambda: np_ufunc.at(np.zeros(args.num_segments), scatter_indices, x),
+                lambda: frontend_ufunc.at(
+                    np_frontend.zeros(args.num_segments), scatter_indices, x
+                ),
+            ),
+        }
+        for method, (native_call, frontend_call) in calls.items():
+            native = _time(native_call, args.repeats)
+            frontend = _time(frontend_call, args.repeats)
+            print(
+                "{:<12}{:<12}{:>14.3f}{:>14.3f}{:>10.1f}".format(
+                    name, method, native * 1e3, frontend * 1e3, frontend / native
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
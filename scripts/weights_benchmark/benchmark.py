@@ -0,0 +1,99 @@
+"""Compare the time taken to save and load the weights of a module, as a single hdf5
+file and as a sharded checkpoint, with and without memory-mapping."""
+
+import argparse
+from concurrent.futures import Future
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import ivy
+
+
+class _Model(ivy.Module):
+    def __init__(self, num_layers, width):
+        self._num_layers = num_layers
+        self._width = width
+        ivy.Module.__init__(self)
+
+    def _create_variables(self, device, dtype=None):
+        rng = np.random.RandomState(0)
+        return {
+            "layer{}".format(i): {
+                "w": ivy.array(
+                    rng.uniform(-1, 1, (self._width, self._width)), dtype="float32"
+                ),
+                "b": ivy.array(rng.uniform(-1, 1, (self._width,)), dtype="float32"),
+            }
+            for i in range(self._num_layers)
+        }
+
+    def _forward(self, x):
+        return x
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    ret = fn()
+    elapsed = time.perf_counter() - start
+    if isinstance(ret, Future):
+        # wait for asynchronous writes, so that they do not overlap the next timings
+        ret.result()
+    return elapsed
+
+
+def _touch(v):
+    # read every weight, so that lazily mapped weights are paged in
+    return sum(float(ivy.to_numpy(x).sum()) for x in v.cont_to_flat_list())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num_layers", type=int, default=16)
+    parser.add_argument("--width", type=int, default=2048)
+    parser.add_argument("--shard_size", type=int, default=2**28)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    model = _Model(args.num_layers, args.width)
+    nbytes = sum(x.size * 4 for x in model.v.cont_to_flat_list())
+    print("weights: {:.1f} MB".format(nbytes / 1e6))
+    directory = tempfile.mkdtemp()
+    try:
+        hdf5_path = os.path.join(directory, "weights.hdf5")
+        sharded_path = os.path.join(directory, "weights")
+        rows = [
+            ("hdf5 save", lambda: model.save_weights(hdf5_path)),
+            ("hdf5 load", lambda: model.load_weights(hdf5_path)),
+            (
+                "sharded save",
+                lambda: model.save_weights(sharded_path, shard_size=args.shard_size),
+            ),
+            (
+                "sharded save (async)",
+                lambda: model.save_weights(
+                    sharded_path, shard_size=args.shard_size, asynchronous=True
+                ),
+            ),
+            (
+                "sharded load",
+                lambda: model.load_weights(sharded_path, mmap_mode=False),
+            ),
+            ("sharded load (mmap)", lambda: model.load_weights(sharded_path)),
+            (
+                "mmap load + read",
+                lambda: _touch(model.load_weights(sharded_path)),
+            ),
+        ]
+        print("{:<24}{:>10}".format("operation", "time (s)"))
+        for name, fn in rows:
+            print("{:<24}{:>10.3f}".format(name, _timed(fn)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()